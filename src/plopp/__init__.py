@@ -16,7 +16,15 @@ __getattr__, __dir__, __all__ = lazy.attach(
     __name__,
     submodules=['data'],
     submod_attrs={
-        'core': ['Node', 'View', 'node', 'show_graph', 'widget_node'],
+        'core': [
+            'LazyDataArray',
+            'Node',
+            'StreamNode',
+            'View',
+            'node',
+            'show_graph',
+            'widget_node',
+        ],
         'graphics': [
             'Camera',
             'imagefigure',
@@ -31,6 +31,28 @@ def check_ndim(data: sc.DataArray, ndim: int, origin: str) -> None:
         )
 
 
+def reuse_buffer(
+    buffer: np.ndarray | None, shape: tuple[int, ...], dtype: np.dtype | type = float
+) -> np.ndarray:
+    """
+    Return the buffer if it has the requested shape and dtype, or allocate a new
+    (uninitialized) one otherwise. This is used by artists to write colors into the
+    same array on every update, instead of allocating a new one each time.
+
+    Parameters
+    ----------
+    buffer:
+        The current buffer (``None`` if no buffer was allocated yet).
+    shape:
+        The requested shape.
+    dtype:
+        The requested dtype.
+    """
+    if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+        buffer = np.empty(shape, dtype=dtype)
+    return buffer
+
+
 def make_line_data(data: sc.DataArray, dim: str) -> dict:
     """
     Prepare data for plotting a line.
@@ -69,6 +91,57 @@ def make_line_data(data: sc.DataArray, dim: str) -> dict:
     return {'values': values, 'stddevs': error, 'mask': mask, 'hist': hist}
 
 
+def minmax_decimation(
+    x: np.ndarray,
+    y: np.ndarray,
+    nbuckets: int,
+    xlim: tuple[float, float] | None = None,
+) -> np.ndarray:
+    """
+    Select the indices of the points of a line that need to be drawn to faithfully
+    represent the line on a screen ``nbuckets`` pixels wide (M4 decimation).
+    The x range is divided into ``nbuckets`` buckets of equal width, and in each bucket
+    the first, last, minimum and maximum points are kept. This preserves the envelope
+    of the line (no aliasing), while drawing at most ``4 * nbuckets`` points.
+
+    Parameters
+    ----------
+    x:
+        The x values of the line, as floats, sorted in ascending order.
+    y:
+        The y values of the line.
+    nbuckets:
+        The number of buckets (typically the width of the axes in pixels).
+    xlim:
+        The visible x range. Points outside of it are dropped, except for the nearest
+        point on each side, so that the line extends to the edges of the axes.
+    """
+    start, stop = 0, len(x)
+    if xlim is not None:
+        lo, hi = sorted(xlim)
+        start = max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(x, hi, side='right')) + 1, len(x))
+    if stop - start <= 4 * nbuckets:
+        return np.arange(start, stop)
+    xs = x[start:stop]
+    ys = y[start:stop]
+    edges = np.linspace(xs[0], xs[-1], nbuckets + 1)[1:-1]
+    bounds = np.unique(
+        np.concatenate([[0], np.searchsorted(xs, edges, side='left'), [len(xs)]])
+    )
+    starts = bounds[:-1]
+    counts = np.diff(bounds)
+    bucket = np.repeat(np.arange(len(starts)), counts)
+    keep = [starts, bounds[1:] - 1]
+    for reduce in (np.fmin, np.fmax):
+        extrema = reduce.reduceat(ys, starts)
+        hits = np.flatnonzero(ys == np.repeat(extrema, counts))
+        # Keep only the first occurrence of the extremum in each bucket
+        _, first = np.unique(bucket[hits], return_index=True)
+        keep.append(hits[first])
+    return np.unique(np.concatenate(keep)) + start
+
+
 def make_line_bbox(
     data: sc.DataArray,
     dim: str,
@@ -167,6 +167,9 @@ class Canvas:
         The label for the y axis.
     norm:
         Set to ``'log'`` for a logarithmic y-axis (legacy, prefer ``logy`` instead).
+    badge:
+        A short text displayed in the top right corner of the axes, for example to
+        indicate that the data was downsampled for display.
     """
 
     def __init__(
@@ -191,6 +194,7 @@ class Canvas:
         ylabel: str | None = None,
         norm: Literal['linear', 'log'] | None = None,
         autoscale_axes: Callable | None = None,
+        badge: str | None = None,
         **ignored,
     ):
         # Note on the `**ignored`` keyword arguments: the figure which owns the canvas
@@ -231,6 +235,10 @@ class Canvas:
         if aspect is not None:
             self.ax.set_aspect(aspect)
 
+        # Callbacks that refresh the artists before a draw, see `on_draw`.
+        self._refresh_callbacks = {}
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw_event)
+
         if cbar and (self.cax is None):
             if self.ax.name == 'polar':
                 bounds = self.ax.get_position().bounds
@@ -286,6 +294,10 @@ class Canvas:
         if ylabel is not None:
             self.ylabel = ylabel
 
+        self._badge = None
+        if badge:
+            self.badge = badge
+
     def _on_mouse_enter(self, _) -> None:
         """
         Show log buttons when hovering over the figure.
@@ -379,8 +391,48 @@ class Canvas:
         We also update the bounding box of the canvas, which is used to determine when
         to show the log buttons.
         """
+        self._refresh()
         self.fig.canvas.draw_idle()
 
+    def _refresh(self) -> bool:
+        """
+        Call the refresh callbacks of the artists. Returns ``True`` if one of them
+        changed what is displayed.
+        """
+        # Run all the callbacks, do not stop at the first one which changed something
+        changed = [callback() for callback in list(self._refresh_callbacks.values())]
+        return any(changed)
+
+    def _on_draw_event(self, _) -> None:
+        """
+        The axes can be redrawn without going through :meth:`Canvas.draw` (e.g. when
+        zooming with the toolbar). In that case, the artists are refreshed after the
+        draw, and the figure is drawn again if they changed.
+        """
+        if self._refresh():
+            self.fig.canvas.draw_idle()
+
+    def on_draw(self, key: str, callback: Callable[[], bool] | None) -> None:
+        """
+        Register a function that refreshes an artist when the figure is drawn. Artists
+        use this to update their data once per draw, after all the limits of the axes
+        have been changed (a zoom changes the x and y limits one after the other).
+        The callbacks are called by :meth:`Canvas.draw`, and after any other draw of
+        the figure (in which case the figure is drawn again if they return ``True``).
+
+        Parameters
+        ----------
+        key:
+            The key identifying the callback, usually the uid of the artist.
+        callback:
+            The function to call, which returns ``True`` if the artist has changed.
+            If ``None``, the callback registered under ``key`` is removed.
+        """
+        if callback is None:
+            self._refresh_callbacks.pop(key, None)
+        else:
+            self._refresh_callbacks[key] = callback
+
     def update_legend(self):
         """
         Update the legend on the canvas.
@@ -496,6 +548,32 @@ class Canvas:
     def title(self, text: str):
         self.ax.set_title(text)
 
+    @property
+    def badge(self) -> str | None:
+        """
+        Get or set the text of the badge in the top right corner of the axes.
+        Set to ``None`` to remove the badge.
+        """
+        return None if self._badge is None else self._badge.get_text()
+
+    @badge.setter
+    def badge(self, text: str | None):
+        if self._badge is not None:
+            self._badge.remove()
+            self._badge = None
+        if text:
+            self._badge = self.ax.text(
+                0.985,
+                0.98,
+                text,
+                transform=self.ax.transAxes,
+                ha="right",
+                va="top",
+                fontsize=8,
+                zorder=np.inf,
+                bbox={"boxstyle": "round,pad=0.3", "facecolor": "0.95", "alpha": 0.8},
+            )
+
     @property
     def xlabel(self) -> str:
         """
@@ -3,18 +3,44 @@
 
 import uuid
 import warnings
+from collections.abc import Callable
 from typing import Literal
 
 import numpy as np
 import scipp as sc
 
-from ...core.utils import coord_as_bin_edges, scalar_to_string
+from ...core.utils import coord_as_bin_edges, merge_masks, scalar_to_string
 from ...graphics.bbox import BoundingBox, axis_bounds
 from ...graphics.colormapper import ColorMapper
-from ..common import check_ndim
+from ..common import check_ndim, reuse_buffer
 from .canvas import Canvas
 
 
+def _block_reduce(
+    values: np.ndarray, mask: np.ndarray | None, op: str
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Reduce an image by a factor of 2 along both axes, by combining blocks of 2x2
+    pixels. Images with an odd size are padded with NaNs (ignored by the reduction).
+    """
+    ny, nx = values.shape
+    pad = ((0, ny % 2), (0, nx % 2))
+    values = np.pad(values.astype(float, copy=False), pad, constant_values=np.nan)
+    blocks = values.reshape(values.shape[0] // 2, 2, values.shape[1] // 2, 2)
+    if op == 'max':
+        out = np.fmax.reduce(np.fmax.reduce(blocks, axis=3), axis=1)
+    else:
+        out = np.nansum(blocks, axis=(1, 3))
+        if op == 'mean':
+            count = np.sum(~np.isnan(blocks), axis=(1, 3))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out = np.where(count > 0, out / count, np.nan)
+    if mask is not None:
+        mask = np.pad(mask, pad, constant_values=False)
+        mask = mask.reshape(blocks.shape).any(axis=(1, 3))
+    return out, mask
+
+
 class FastImage:
     """
     Artist to represent two-dimensional data.
@@ -32,6 +58,26 @@ class FastImage:
         by the FastImage artist.
     uid:
         The unique identifier of the artist. If None, a random UUID is generated.
+    pyramid:
+        If set, build a multi-resolution pyramid of the image, where each level is
+        half the size of the previous one. Only the part of the level that matches the
+        visible extent and the resolution of the axes is drawn, and it is updated when
+        the axes are zoomed or panned. The value sets how blocks of pixels are combined:
+        ``'mean'`` (or ``True``), ``'max'`` or ``'sum'``. With ``'sum'``, the color
+        limits are scaled by the number of pixels in a block, so that the colors of
+        the reduced levels match the full-resolution data.
+
+        .. versionadded:: 26.11.0
+    rebin:
+        A dict of functions that histogram the (binned) data of an artist over the
+        visible region of the axes, keyed by the uid of the artist. If the image has an
+        entry, the visible region is histogrammed again with one bin per screen pixel
+        when the axes are zoomed or panned, and the color range is fitted to the new
+        histogram (the counts per bin depend on the bin size). The data supplied to the
+        image is the histogram over the full range, which is used for the bounding box.
+        This takes precedence over ``pyramid``.
+
+        .. versionadded:: 26.11.0
     **kwargs:
         Additional arguments are forwarded to Matplotlib's ``imshow``.
     """
@@ -43,6 +89,8 @@ class FastImage:
         data: sc.DataArray,
         artist_number: int,
         uid: str | None = None,
+        pyramid: Literal['mean', 'max', 'sum'] | bool | None = None,
+        rebin: dict[str, Callable] | None = None,
         **kwargs,
     ):
         check_ndim(data, ndim=2, origin="FastImage")
@@ -51,20 +99,26 @@ class FastImage:
         self._colormapper = colormapper
         self._ax = self._canvas.ax
         self._data = data
+        if pyramid is True:
+            pyramid = 'mean'
+        if pyramid not in (None, False, 'mean', 'max', 'sum'):
+            raise ValueError(
+                f"Invalid pyramid reduction: {pyramid}. "
+                "Valid values are 'mean', 'max' and 'sum'."
+            )
+        self._rebin = (rebin or {}).get(self.uid)
+        self._full_data = data
+        self._pyramid = None if self._rebin is not None else (pyramid or None)
+        self._levels = None
+        self._window = None
+        self._rgba_buffer = None
 
         string_labels = {}
-        self._bin_edge_coords = {}
         for i, k in enumerate("yx"):
-            self._bin_edge_coords[k] = coord_as_bin_edges(
-                self._data, self._data.dims[i]
-            )
             if self._data.coords[self._data.dims[i]].dtype == str:
                 string_labels[k] = self._data.coords[self._data.dims[i]]
-
-        self._xmin, self._xmax = self._bin_edge_coords["x"].values[[0, -1]]
-        self._ymin, self._ymax = self._bin_edge_coords["y"].values[[0, -1]]
-        self._dx = np.diff(self._bin_edge_coords["x"].values[:2])[0]
-        self._dy = np.diff(self._bin_edge_coords["y"].values[:2])[0]
+        self._set_edges()
+        self._bbox_edges = self._bin_edge_coords
 
         # Calling imshow sets the aspect ratio to 'equal', which might not be what the
         # user requested. We need to restore the original aspect ratio after making the
@@ -88,6 +142,8 @@ class FastImage:
 
         self._ax.set_aspect(original_aspect)
         self._colormapper.add_artist(self.uid, self)
+        if self._pyramid is not None:
+            self._window = self._visible_window(full=True)
         self._update_colors()
 
         for xy, var in string_labels.items():
@@ -99,6 +155,15 @@ class FastImage:
         # included in our custom format_coord.
         self._image.format_cursor_data = lambda _: ""
 
+        self._lim_cids = []
+        self._limits_changed = False
+        if (self._pyramid is not None) or (self._rebin is not None):
+            self._lim_cids = [
+                self._ax.callbacks.connect(f'{xy}lim_changed', self._on_lim_changed)
+                for xy in 'xy'
+            ]
+            self._canvas.on_draw(self.uid, self._on_draw)
+
     @property
     def data(self):
         """
@@ -107,6 +172,19 @@ class FastImage:
         """
         return self._data
 
+    def _set_edges(self) -> None:
+        """
+        Compute the bin edges and the extent of the displayed data.
+        """
+        self._bin_edge_coords = {
+            k: coord_as_bin_edges(self._data, self._data.dims[i])
+            for i, k in enumerate("yx")
+        }
+        self._xmin, self._xmax = self._bin_edge_coords["x"].values[[0, -1]]
+        self._ymin, self._ymax = self._bin_edge_coords["y"].values[[0, -1]]
+        self._dx = np.diff(self._bin_edge_coords["x"].values[:2])[0]
+        self._dy = np.diff(self._bin_edge_coords["y"].values[:2])[0]
+
     def notify_artist(self, message: str) -> None:
         """
         Receive notification from the colormapper that its state has changed.
@@ -119,12 +197,140 @@ class FastImage:
         """
         self._update_colors()
 
+    def _get_level(self, level: int) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Return the values and mask of a level of the pyramid, building the missing
+        levels if needed.
+        """
+        if self._levels is None:
+            mask = None
+            if self._data.masks:
+                mask = sc.broadcast(
+                    merge_masks(self._data.masks), sizes=self._data.sizes
+                ).values
+            self._levels = [(self._data.values, mask)]
+        while len(self._levels) <= level:
+            self._levels.append(_block_reduce(*self._levels[-1], op=self._pyramid))
+        return self._levels[level]
+
+    def _visible_window(self, full: bool = False) -> tuple[int, slice, slice]:
+        """
+        Find the pyramid level and the range of pixels of that level that match the
+        visible extent (or the full extent of the image if ``full`` is ``True``) and the
+        resolution of the axes.
+        """
+        ny, nx = self._data.shape
+        ranges = []
+        for lim, vmin, d, n in (
+            (None if full else self._ax.get_ylim(), self._ymin, self._dy, ny),
+            (None if full else self._ax.get_xlim(), self._xmin, self._dx, nx),
+        ):
+            if lim is None:
+                ranges.append((0, n))
+                continue
+            start, stop = sorted((np.asarray(lim, dtype=float) - vmin) / d)
+            ranges.append(
+                (
+                    min(max(int(np.floor(start)), 0), n - 1),
+                    max(min(int(np.ceil(stop)), n), 1),
+                )
+            )
+        extent = self._ax.get_window_extent()
+        factor = max(
+            (ranges[0][1] - ranges[0][0]) / max(extent.height, 1),
+            (ranges[1][1] - ranges[1][0]) / max(extent.width, 1),
+        )
+        level = int(np.floor(np.log2(factor))) if factor > 1 else 0
+        level = min(level, int(np.log2(max(nx, ny))))
+        f = 2**level
+        return level, *(slice(a // f, max(-(-b // f), a // f + 1)) for a, b in ranges)
+
+    def _rgba(self, data: sc.DataArray) -> np.ndarray:
+        """
+        Colorize the data as 8-bit rgba values, into a buffer that is re-used as long
+        as the shape of the data does not change (``imshow`` keeps its own copy).
+        """
+        self._rgba_buffer = reuse_buffer(
+            self._rgba_buffer, (*data.shape, 4), dtype=np.uint8
+        )
+        return self._colormapper.rgba(data, bytes=True, out=self._rgba_buffer)
+
     def _update_colors(self):
         """
         Update the image colors.
         """
-        rgba = self._colormapper.rgba(self.data)
-        self._image.set_data(rgba)
+        if self._pyramid is None:
+            self._image.set_data(self._rgba(self.data))
+            return
+        level, ys, xs = self._window
+        values, mask = self._get_level(level)
+        values = values[ys, xs]
+        if self._pyramid == 'sum' and level > 0:
+            # Dividing the sums by the block size is the same as multiplying the limits
+            # of the (linear or log) norm by the block size.
+            values = values / 4**level
+        window = sc.DataArray(
+            data=sc.array(dims=self._data.dims, values=values, unit=self._data.unit)
+        )
+        if mask is not None:
+            window.masks['mask'] = sc.array(dims=self._data.dims, values=mask[ys, xs])
+        self._image.set_data(self._rgba(window))
+        f = 2**level
+        ny, nx = self._data.shape
+        self._image.set_extent(
+            (
+                self._xmin + xs.start * f * self._dx,
+                self._xmin + min(xs.stop * f, nx) * self._dx,
+                self._ymin + ys.start * f * self._dy,
+                self._ymin + min(ys.stop * f, ny) * self._dy,
+            )
+        )
+
+    def _show_rebinned(self) -> bool:
+        """
+        Histogram the visible region again, with one bin per screen pixel. If the
+        region cannot be re-histogrammed, the full-range data is displayed.
+        Returns ``True`` if the displayed data has changed.
+        """
+        ydim, xdim = self._full_data.dims
+        extent = self._ax.get_window_extent()
+        window = self._rebin(
+            {xdim: self._ax.get_xlim(), ydim: self._ax.get_ylim()},
+            {xdim: max(int(extent.width), 1), ydim: max(int(extent.height), 1)},
+        )
+        data = self._full_data if window is None else window
+        if data is self._data:
+            return False
+        self._data = data
+        self._set_edges()
+        self._image.set_extent((self._xmin, self._xmax, self._ymin, self._ymax))
+        return True
+
+    def _on_lim_changed(self, ax) -> None:
+        # A zoom changes the x and y limits one after the other: the displayed data
+        # is only updated once both are set, right before the axes are drawn.
+        self._limits_changed = True
+
+    def _on_draw(self) -> bool:
+        if not self._limits_changed:
+            return False
+        self._limits_changed = False
+        if self._rebin is not None:
+            if not self._show_rebinned():
+                return False
+            if self._colormapper.set_colors_on_update:
+                # The view does not autoscale: keep the current color range
+                self._update_colors()
+            else:
+                # Fitting the color range also updates the colors of the image
+                self._colormapper.autoscale()
+            return True
+        window = self._visible_window()
+        if window == self._window:
+            return False
+        self._window = window
+        self._update_colors()
+        return True
 
     def update(self, new_values: sc.DataArray):
         """
@@ -137,6 +343,15 @@ class FastImage:
         """
         check_ndim(new_values, ndim=2, origin="FastImage")
         self._data = new_values
+        if self._rebin is not None:
+            self._full_data = new_values
+            self._set_edges()
+            self._bbox_edges = self._bin_edge_coords
+            self._image.set_extent((self._xmin, self._xmax, self._ymin, self._ymax))
+            self._show_rebinned()
+        self._levels = None
+        if self._pyramid is not None:
+            self._window = self._visible_window()
         self._update_colors()
 
     def format_coord(
@@ -191,13 +406,16 @@ class FastImage:
         The bounding box of the image.
         """
         return BoundingBox(
-            **{**axis_bounds(("xmin", "xmax"), self._bin_edge_coords["x"], xscale)},
-            **{**axis_bounds(("ymin", "ymax"), self._bin_edge_coords["y"], yscale)},
+            **{**axis_bounds(("xmin", "xmax"), self._bbox_edges["x"], xscale)},
+            **{**axis_bounds(("ymin", "ymax"), self._bbox_edges["y"], yscale)},
         )
 
     def remove(self):
         """
         Remove the image artist from the canvas.
         """
+        for cid in self._lim_cids:
+            self._ax.callbacks.disconnect(cid)
+        self._canvas.on_draw(self.uid, None)
         self._image.remove()
         self._colormapper.remove_artist(self.uid)
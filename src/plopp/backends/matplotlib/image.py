@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2025 Scipp contributors (https://github.com/scipp)
 
+from collections.abc import Callable
+
 import scipp as sc
 
 from .canvas import Canvas
@@ -11,6 +13,8 @@ from .mesh_image import MeshImage
 def Image(
     canvas: Canvas,
     data: sc.DataArray,
+    pyramid: str | bool | None = None,
+    rebin: dict[str, Callable] | None = None,
     **kwargs,
 ):
     """
@@ -25,12 +29,25 @@ def Image(
         The canvas that will display the image.
     data:
         The data to create the image from.
+    pyramid:
+        The reduction used to build a multi-resolution pyramid of the image (see
+        :class:`FastImage`). This is ignored if a ``MeshImage`` is created.
+
+        .. versionadded:: 26.11.0
+    rebin:
+        Functions that histogram binned data over the visible region of the axes, keyed
+        by the uid of the artist (see :class:`FastImage`). This is ignored if a
+        ``MeshImage`` is created.
+
+        .. versionadded:: 26.11.0
     """
     if (canvas.ax.name != 'polar') and all(
         (data.coords[dim].ndim < 2)
         and ((data.coords[dim].dtype == str) or (sc.islinspace(data.coords[dim])))
         for dim in data.dims
     ):
-        return FastImage(canvas=canvas, data=data, **kwargs)
+        return FastImage(
+            canvas=canvas, data=data, pyramid=pyramid, rebin=rebin, **kwargs
+        )
     else:
         return MeshImage(canvas=canvas, data=data, **kwargs)
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
 import uuid
+from collections.abc import Callable
 from enum import Enum
 from typing import Literal
 
@@ -12,7 +13,7 @@ from matplotlib.dates import date2num
 from matplotlib.lines import Line2D
 
 from ...graphics.bbox import BoundingBox
-from ..common import check_ndim, make_line_bbox, make_line_data
+from ..common import check_ndim, make_line_bbox, make_line_data, minmax_decimation
 from .canvas import Canvas
 from .utils import parse_dicts_in_kwargs
 
@@ -209,6 +210,23 @@ class Line:
         specify the error bar style. Valid values are 'band' and 'bar'.
     mask_color:
         The color of the masked points.
+    lod:
+        Level of detail: if ``True``, only draw the points that are needed to
+        represent the line at the resolution of the axes (first, last, minimum and
+        maximum points in each pixel column). The selection is recomputed when the
+        axes are zoomed or panned. An integer sets the number of columns instead of
+        using the width of the axes in pixels. This requires the coordinate to be
+        sorted; unsorted lines are drawn in full.
+
+        .. versionadded:: 26.11.0
+    rebin:
+        A dict of functions that histogram the (binned) data of an artist over the
+        visible range of the axes, keyed by the uid of the artist. If the line has an
+        entry, the visible range is histogrammed again at the resolution of the axes
+        when the axes are zoomed or panned. The data supplied to the line is the
+        histogram over the full range, which is used for the bounding box.
+
+        .. versionadded:: 26.11.0
     """
 
     def __init__(
@@ -219,6 +237,8 @@ class Line:
         artist_number: int = 0,
         errorbars: Literal['band', 'bar', True, False] = True,
         mask_color: str | None = None,
+        lod: bool | int = False,
+        rebin: dict[str, Callable] | None = None,
         **kwargs,
     ):
         check_ndim(data, ndim=1, origin='Line')
@@ -247,7 +267,10 @@ class Line:
             if key in line_args:
                 line_args[alias] = line_args.pop(key)
 
-        line_data = make_line_data(data=self._data, dim=self._dim)
+        self._lod = lod
+        self._lod_x = None
+        self._rebin = (rebin or {}).get(self.uid)
+        line_data = self._decimate(make_line_data(data=self._data, dim=self._dim))
 
         default_step_style = {
             'linestyle': 'solid',
@@ -313,6 +336,94 @@ class Line:
                 hist=line_data['hist'],
             )
 
+        self._xlim_cid = None
+        self._shown = self._data
+        self._rebin_pending = False
+        if self._lod or (self._rebin is not None):
+            self._xlim_cid = self._ax.callbacks.connect(
+                'xlim_changed', self._on_xlim_changed
+            )
+        if self._rebin is not None:
+            self._canvas.on_draw(self.uid, self._on_draw)
+
+    def _decimate(self, line_data: dict, xlim: tuple | None = None) -> dict:
+        """
+        Keep only the points of the line that are visible at the resolution of the
+        axes. The full line data is stored, so that the selection can be recomputed
+        when the axes limits change.
+        """
+        if not self._lod:
+            return line_data
+        self._full_line_data = line_data
+        if self._lod_x is None:
+            x = np.asarray(_to_float(line_data['values']['x']), dtype=float)
+            self._lod_x = x if bool(np.all(x[1:] >= x[:-1])) else False
+        if self._lod_x is False:
+            return line_data
+        nbuckets = (
+            max(int(self._ax.get_window_extent().width), 1)
+            if self._lod is True
+            else int(self._lod)
+        )
+        idx = minmax_decimation(
+            self._lod_x, line_data['values']['y'], nbuckets=nbuckets, xlim=xlim
+        )
+        if len(idx) == len(self._lod_x):
+            return line_data
+        out = {**line_data}
+        for key in ('values', 'mask'):
+            out[key] = {
+                **line_data[key],
+                'x': line_data[key]['x'][idx],
+                'y': line_data[key]['y'][idx],
+            }
+        # Error bars on histograms are defined on the bin edges: keep them in full
+        if (line_data['stddevs'] is not None) and not line_data['hist']:
+            out['stddevs'] = {k: v[idx] for k, v in line_data['stddevs'].items()}
+        return out
+
+    def _on_draw(self) -> bool:
+        """
+        Histogram the data again over the visible range, with one bin per pixel
+        column. If the range cannot be re-histogrammed, the full data is used.
+        This is done once per draw, after new data and new axes limits (e.g. from
+        autoscaling) have all been set.
+        """
+        if not self._rebin_pending:
+            return False
+        self._rebin_pending = False
+        ncols = max(int(self._ax.get_window_extent().width), 1)
+        window = self._rebin({self._dim: self._ax.get_xlim()}, {self._dim: ncols})
+        data = self._data if window is None else window
+        if data is self._shown:
+            return False
+        self._shown = data
+        self._set_line_data(make_line_data(data=data, dim=self._dim))
+        return True
+
+    def _on_xlim_changed(self, ax: Axes) -> None:
+        if self._rebin is not None:
+            self._rebin_pending = True
+            return
+        self._set_line_data(self._decimate(self._full_line_data, xlim=ax.get_xlim()))
+
+    def _set_line_data(self, line_data: dict) -> None:
+        self._line.set_data(line_data['values']['x'], line_data['values']['y'])
+        # When there are no masks and the mask line is already hidden, there is no
+        # need to send new (all-NaN) mask values to matplotlib. This keeps frequent
+        # updates (e.g. from a streaming source) cheap.
+        if line_data['mask']['visible'] or self._mask.get_visible():
+            self._mask.set_data(line_data['mask']['x'], line_data['mask']['y'])
+            self._mask.set_visible(line_data['mask']['visible'])
+
+        if (self._error is not None) and (line_data['stddevs'] is not None):
+            self._error.update(
+                x=line_data['stddevs']['x'],
+                y=line_data['stddevs']['y'],
+                e=line_data['stddevs']['e'],
+                hist=line_data['hist'],
+            )
+
     def update(self, new_values: sc.DataArray):
         """
         Update the x and y positions of the data points from new data.
@@ -324,24 +435,20 @@ class Line:
         """
         check_ndim(new_values, ndim=1, origin='Line')
         self._data = new_values
+        if self._rebin is not None:
+            self._rebin_pending = True
+            return
+        self._lod_x = None
         line_data = make_line_data(data=self._data, dim=self._dim)
-
-        self._line.set_data(line_data['values']['x'], line_data['values']['y'])
-        self._mask.set_data(line_data['mask']['x'], line_data['mask']['y'])
-        self._mask.set_visible(line_data['mask']['visible'])
-
-        if (self._error is not None) and (line_data['stddevs'] is not None):
-            self._error.update(
-                x=line_data['stddevs']['x'],
-                y=line_data['stddevs']['y'],
-                e=line_data['stddevs']['e'],
-                hist=line_data['hist'],
-            )
+        self._set_line_data(self._decimate(line_data, xlim=self._ax.get_xlim()))
 
     def remove(self):
         """
         Remove the line, masks and errorbar artists from the canvas.
         """
+        if self._xlim_cid is not None:
+            self._ax.callbacks.disconnect(self._xlim_cid)
+        self._canvas.on_draw(self.uid, None)
         self._line.remove()
         self._mask.remove()
         if self._error is not None:
@@ -10,7 +10,7 @@ import scipp as sc
 from ...core.utils import coord_as_bin_edges, merge_masks, repeat, scalar_to_string
 from ...graphics.bbox import BoundingBox, axis_bounds
 from ...graphics.colormapper import ColorMapper
-from ..common import check_ndim
+from ..common import check_ndim, reuse_buffer
 from .canvas import Canvas
 
 
@@ -120,6 +120,8 @@ class MeshImage:
 
         self._dim_1d, self._dim_2d = _get_dims_of_1d_and_2d_coords(to_dim_search)
         self._mesh = None
+        self._mesh_data = self._make_mesh_data()
+        self._rgba_buffer = None
 
         x, y, z = _from_data_array_to_pcolormesh(
             data=self._data.data,
@@ -155,6 +157,13 @@ class MeshImage:
         Get the Mesh's data in a form that may have been tweaked, compared to the
         original data, in the case of a two-dimensional coordinate.
         """
+        return self._mesh_data
+
+    def _make_mesh_data(self) -> sc.DataArray:
+        """
+        Make the data that is displayed by the mesh, with values (and a single merged
+        mask) repeated in the case of a two-dimensional coordinate.
+        """
         out = sc.DataArray(
             data=_maybe_repeat_values(
                 data=self._data.data, dim_1d=self._dim_1d, dim_2d=self._dim_2d
@@ -186,7 +195,10 @@ class MeshImage:
         """
         Update the mesh colors.
         """
-        rgba = self._colormapper.rgba(self.data)
+        data = self.data
+        self._rgba_buffer = reuse_buffer(self._rgba_buffer, (*data.shape, 4))
+        rgba = self._colormapper.rgba(data, out=self._rgba_buffer)
+        # Matplotlib copies the colors, so the buffer can be re-used on the next update
         self._mesh.set_facecolors(rgba.reshape(np.prod(rgba.shape[:-1]), 4))
 
     def update(self, new_values: sc.DataArray):
@@ -201,6 +213,7 @@ class MeshImage:
         check_ndim(new_values, ndim=2, origin='MeshImage')
         self._data = new_values
         self._data_with_bin_edges.data = new_values.data
+        self._mesh_data = self._make_mesh_data()
         self._update_colors()
 
     def format_coord(
@@ -11,7 +11,7 @@ from matplotlib.lines import Line2D
 from ...core.utils import merge_masks
 from ...graphics.bbox import BoundingBox, axis_bounds
 from ...graphics.colormapper import ColorMapper
-from ..common import check_ndim
+from ..common import check_ndim, reuse_buffer
 from .canvas import Canvas
 from .utils import parse_dicts_in_kwargs
 
@@ -69,6 +69,7 @@ class Scatter:
         self._y = y
         self._size = size
         self._colormapper = colormapper
+        self._rgba_buffer = None
 
         if 's' in kwargs:
             raise ValueError("Use 'size' instead of 's' for scatter plot.")
@@ -140,7 +141,10 @@ class Scatter:
         """
         Update the colors of the scatter points.
         """
-        self._scatter.set_facecolors(self._colormapper.rgba(self.data))
+        self._rgba_buffer = reuse_buffer(self._rgba_buffer, (*self.data.shape, 4))
+        self._scatter.set_facecolors(
+            self._colormapper.rgba(self.data, out=self._rgba_buffer)
+        )
 
     def update(self, new_values: sc.DataArray):
         """
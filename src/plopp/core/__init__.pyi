@@ -3,7 +3,17 @@
 
 from .graph import show_graph
 from .helpers import node, widget_node
+from .lazy import LazyDataArray
 from .node_class import Node
+from .stream import StreamNode
 from .view import View
 
-__all__ = ['Node', 'View', 'node', 'show_graph', 'widget_node']
+__all__ = [
+    'LazyDataArray',
+    'Node',
+    'StreamNode',
+    'View',
+    'node',
+    'show_graph',
+    'widget_node',
+]
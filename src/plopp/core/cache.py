@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a :class:`NodeCache`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a value to a hashable key that can be used to identify it.
+    Dicts, lists, tuples and slices are converted recursively.
+    A ``TypeError`` is raised if the value cannot be made hashable.
+
+    Parameters
+    ----------
+    value:
+        The value to convert.
+    """
+    if isinstance(value, dict):
+        return tuple((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, slice):
+        return ('slice', value.start, value.stop, value.step)
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    raise TypeError(f"Cannot make a hashable key from {type(value).__name__}.")
+
+
+def nbytes(value: Any) -> int:
+    """
+    Estimate the memory footprint (in bytes) of a value.
+
+    Parameters
+    ----------
+    value:
+        The value whose size should be estimated.
+    """
+    if hasattr(value, 'underlying_size'):
+        return value.underlying_size()
+    if hasattr(value, 'nbytes'):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class NodeCache:
+    """
+    A least-recently-used cache of node results, with a memory budget.
+    When adding a new entry makes the total size exceed ``max_bytes``, the least
+    recently used entries are evicted until the cache fits in the budget again.
+    Values larger than the budget are never stored.
+
+    Parameters
+    ----------
+    max_bytes:
+        The maximum total size (in bytes) of the cached values.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Look up an entry in the cache. Returns a tuple containing a boolean indicating
+        whether the key was found, and the cached value (``None`` if not found).
+
+        Parameters
+        ----------
+        key:
+            The key of the entry.
+        """
+        if key not in self._entries:
+            self._misses += 1
+            return False, None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return True, self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add an entry to the cache, evicting old entries if needed.
+
+        Parameters
+        ----------
+        key:
+            The key of the entry.
+        value:
+            The value to be cached.
+        """
+        size = nbytes(value)
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self._nbytes += size
+        while self._nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache. The statistics are preserved.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the cache statistics.
+        """
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            nbytes=self._nbytes,
+            max_bytes=self.max_bytes,
+        )
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import asyncio
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+_default_executor = None
+
+
+def default_executor() -> Executor:
+    """
+    Return the executor shared by all background evaluations that do not specify
+    their own. It has a single worker thread, so that graph evaluations never run
+    concurrently with one another.
+    """
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='plopp'
+        )
+    return _default_executor
+
+
+class BackgroundEvaluator:
+    """
+    Evaluate functions in a background thread, keeping only the latest request for
+    a given key.
+
+    At most one evaluation per key is in flight. If new requests for that key arrive
+    while it is running, they replace one another and only the newest is evaluated
+    once the running one completes. The result of the superseded (running) evaluation
+    is discarded. The callback receiving the result is called in the thread of the
+    asyncio event loop that submitted the request, so it is safe to update widgets and
+    figures from it.
+
+    Submitting never waits for a running evaluation. Instead, a request can come with
+    a ``stamp`` (e.g. :attr:`Node.stamp`), and its result is dropped if the stamp
+    changed while it was computed.
+
+    If no asyncio event loop is running, functions are evaluated synchronously, and
+    errors are raised to the caller of :meth:`BackgroundEvaluator.submit`. Errors
+    raised by a background evaluation are re-raised by the next call to
+    :meth:`BackgroundEvaluator.submit` for the same key, so that they also reach the
+    code which notified the graph.
+
+    .. versionadded:: 26.11.0
+
+    Parameters
+    ----------
+    executor:
+        The executor used to run the evaluations. Defaults to a shared executor with a
+        single worker thread.
+    """
+
+    def __init__(self, executor: Executor | None = None):
+        self._executor = default_executor() if executor is None else executor
+        self._running = {}
+        self._latest = {}
+        self._errors = {}
+        self.nsuperseded = 0
+
+    @property
+    def busy(self) -> bool:
+        """
+        ``True`` if some evaluations are in flight.
+        """
+        return bool(self._running)
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        callback: Callable[[Any], None],
+        stamp: Callable[[], Hashable] | None = None,
+    ) -> None:
+        """
+        Request the evaluation of ``func``, and pass the result to ``callback``.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the request (e.g. a node id). Only the latest request
+            for a key is evaluated and delivered.
+        func:
+            The function to evaluate.
+        callback:
+            The function receiving the result.
+        stamp:
+            A function returning a token that changes when the result of ``func`` is
+            out-of-date. The result is dropped if the token changed during the
+            evaluation.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            callback(func())
+            return
+        error = self._errors.pop(key, None)
+        if key in self._running:
+            if key in self._latest:
+                self.nsuperseded += 1
+            self._latest[key] = (func, callback, stamp)
+        else:
+            token = None if stamp is None else stamp()
+            future = loop.run_in_executor(self._executor, func)
+            self._running[key] = future
+            future.add_done_callback(partial(self._done, key, callback, stamp, token))
+        if error is not None:
+            raise error
+
+    def _done(
+        self,
+        key: Hashable,
+        callback: Callable,
+        stamp: Callable | None,
+        token: Hashable,
+        future: asyncio.Future,
+    ) -> None:
+        del self._running[key]
+        if key in self._latest:
+            # A newer request arrived while this one was running: drop the result
+            self.nsuperseded += 1
+            self.submit(key, *self._latest.pop(key))
+            return
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._errors[key] = error
+            return
+        if (stamp is not None) and (stamp() != token):
+            # The inputs changed during the evaluation: the result is out-of-date
+            self.nsuperseded += 1
+            return
+        callback(future.result())
+
+    def cancel(self) -> None:
+        """
+        Cancel all queued requests and discard the results of running ones.
+        """
+        self._latest.clear()
+        self._errors.clear()
+        for future in self._running.values():
+            future.cancel()
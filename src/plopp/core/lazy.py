@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import scipp as sc
+
+
+class LazyDataArray:
+    """
+    A data array whose values are stored in an array-like object that is only read
+    on demand, such as an ``h5py.Dataset`` or a ``numpy.memmap``.
+
+    The dims, coordinates and masks are held in memory, so that the sizes and
+    coordinates can be inspected without reading any values. Slicing by position
+    returns a new lazy array that refers to a region of the same source, and
+    :meth:`LazyDataArray.load` reads only that region. The slicer uses this to read
+    only the slab that is displayed, which makes it possible to browse files that are
+    much larger than the available memory.
+
+    .. versionadded:: 26.11.0
+
+    Parameters
+    ----------
+    values:
+        The array-like source of the values. It must have a ``shape`` and support
+        indexing with a tuple of integers and slices.
+    dims:
+        The dimension labels, one for each axis of ``values``.
+    coords:
+        The coordinates of the data array.
+    masks:
+        The masks of the data array.
+    unit:
+        The unit of the values.
+    name:
+        The name of the data array.
+    """
+
+    def __init__(
+        self,
+        values: Any,
+        dims: list[str] | tuple[str, ...],
+        coords: dict[str, sc.Variable] | None = None,
+        masks: dict[str, sc.Variable] | None = None,
+        unit: sc.Unit | str | None = sc.units.default_unit,
+        name: str = '',
+    ):
+        shape = tuple(values.shape)
+        if len(dims) != len(shape):
+            raise sc.DimensionError(
+                f"Got {len(dims)} dims {tuple(dims)} for values with shape {shape}."
+            )
+        self._values = values
+        self._unit = unit
+        self._index = tuple(slice(0, n) for n in shape)
+        self._axes = tuple(range(len(shape)))
+        # The metadata is stored in a data array with broadcast (zero-stride) data, so
+        # that scipp handles the slicing of the coordinates (including bin edges) and
+        # masks, without allocating any memory for the values.
+        self._meta = sc.DataArray(
+            data=sc.broadcast(
+                sc.scalar(False), sizes=dict(zip(dims, shape, strict=True))
+            ),
+            coords=coords if coords is not None else {},
+            masks=masks if masks is not None else {},
+            name=name,
+        )
+
+    def _replace(
+        self,
+        meta: sc.DataArray,
+        index: tuple | None = None,
+        axes: tuple[int, ...] | None = None,
+    ) -> LazyDataArray:
+        out = object.__new__(LazyDataArray)
+        out._values = self._values
+        out._unit = self._unit
+        out._index = self._index if index is None else index
+        out._axes = self._axes if axes is None else axes
+        out._meta = meta
+        return out
+
+    @property
+    def dims(self) -> tuple[str, ...]:
+        return self._meta.dims
+
+    @property
+    def sizes(self) -> dict[str, int]:
+        return self._meta.sizes
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._meta.shape
+
+    @property
+    def ndim(self) -> int:
+        return self._meta.ndim
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self._values.dtype)
+
+    @property
+    def unit(self) -> sc.Unit | str | None:
+        return self._unit
+
+    @property
+    def coords(self) -> sc.Coords:
+        return self._meta.coords
+
+    @property
+    def masks(self) -> sc.Masks:
+        return self._meta.masks
+
+    @property
+    def name(self) -> str:
+        return self._meta.name
+
+    @name.setter
+    def name(self, value: str):
+        self._meta.name = value
+
+    @property
+    def is_binned(self) -> bool:
+        return False
+
+    @property
+    def bins(self) -> None:
+        return None
+
+    def copy(self, deep: bool = True) -> LazyDataArray:
+        """
+        Return a copy of the lazy array. The values are never copied, as they live
+        in the source; ``deep`` applies to the coordinates and masks.
+        """
+        return self._replace(self._meta.copy(deep=deep))
+
+    def rename_dims(self, *args, **kwargs) -> LazyDataArray:
+        return self._replace(self._meta.rename_dims(*args, **kwargs))
+
+    def assign_coords(self, *args, **kwargs) -> LazyDataArray:
+        return self._replace(self._meta.assign_coords(*args, **kwargs))
+
+    def drop_coords(self, *args, **kwargs) -> LazyDataArray:
+        return self._replace(self._meta.drop_coords(*args, **kwargs))
+
+    def __getitem__(self, key: tuple[str, int | slice]) -> LazyDataArray:
+        dim, sel = key
+        if not isinstance(sel, int | slice):
+            raise TypeError(
+                "LazyDataArray only supports positional slicing with an integer or a "
+                f"slice, got {type(sel)}."
+            )
+        i = self.dims.index(dim)
+        axis = self._axes[i]
+        current = self._index[axis]
+        size = current.stop - current.start
+        index = list(self._index)
+        axes = self._axes
+        if isinstance(sel, int):
+            if not -size <= sel < size:
+                raise IndexError(f"Index {sel} is out of range for dim '{dim}'.")
+            index[axis] = current.start + sel % size
+            axes = axes[:i] + axes[i + 1 :]
+        else:
+            start, stop, step = sel.indices(size)
+            if step != 1:
+                raise ValueError("LazyDataArray does not support slicing with a step.")
+            index[axis] = slice(current.start + start, current.start + max(stop, start))
+        return self._replace(self._meta[dim, sel], index=tuple(index), axes=axes)
+
+    def load(self) -> sc.DataArray:
+        """
+        Read the values of the (sliced) region from the source, and return them as a
+        data array.
+        """
+        values = np.asarray(self._values[self._index])
+        return sc.DataArray(
+            data=sc.array(dims=self.dims, values=values, unit=self._unit),
+            coords=dict(self._meta.coords),
+            masks=dict(self._meta.masks),
+            name=self.name,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LazyDataArray(dims={self.sizes}, dtype={self.dtype}, "
+            f"unit={self._unit}, source={type(self._values).__name__})>"
+        )
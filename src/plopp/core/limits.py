@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
-from typing import Literal
+from typing import Any, Literal, NamedTuple
 
 import numpy as np
 import scipp as sc
@@ -21,64 +21,106 @@ def is_datetime(x: sc.Variable | sc.DataArray) -> bool:
     return x.dtype == sc.DType.datetime64
 
 
-def find_limits(
-    x: sc.Variable | sc.DataArray,
-    scale: Literal['linear', 'log'] = 'linear',
-    pad: bool = False,
-) -> tuple[sc.Variable, sc.Variable]:
+class ValueRange(NamedTuple):
     """
-    Find sensible limits, depending on linear or log scale.
+    The range of finite (and unmasked) values in an array.
+    """
+
+    min: Any
+    """The smallest finite value."""
+    max: Any
+    """The largest finite value."""
+    positive_min: Any
+    """The smallest positive finite value (``None`` if there are none, or for
+    datetimes)."""
+    unit: sc.Unit | None
+    """The unit of the values."""
+
+
+def value_range(x: sc.Variable | sc.DataArray, chunk_size: int = 1 << 20) -> ValueRange:
+    """
+    Find the range of finite values in an array, ignoring masked values (unless all
+    values are masked). The min, max and positive min are computed in a single pass
+    over the data, in chunks of ``chunk_size`` elements, so that no temporary copies of
+    the full array are made.
     If there are no finite values in the array, raise an error.
-    If there are no positive values in the array, and the scale is log, fall back to
-    some sensible default values.
 
     Parameters
     ----------
     x:
-        The data for which to find the limits.
-    scale:
-        The scale to use for the limits.
-    pad:
-        Whether to pad the limits.
+        The data for which to find the range.
+    chunk_size:
+        The (approximate) number of elements to process at once.
     """
-    is_dt = is_datetime(x)
     # Computing limits for string arrays is not supported, so we convert them to
     # dummy numerical arrays.
     if x.dtype == sc.DType.string:
         x = sc.arange(x.dim, float(len(x)), unit=x.unit)
+    is_dt = is_datetime(x)
+    v = np.atleast_1d(np.asarray(x.values))
+    mask = None
     if getattr(x, 'masks', None):
-        one_mask = merge_masks(x.masks)
+        one_mask = np.atleast_1d(
+            sc.broadcast(merge_masks(x.masks), sizes=x.sizes).values
+        )
         # If all values are masked, we will not be able to compute limits, so we do not
-        # replace with NaN in that case.
-        if int(one_mask.broadcast(sizes=x.sizes).sum()) < x.size:
-            x = sc.where(
-                one_mask,
-                sc.scalar(np.nan, unit=x.unit),
-                x.data.to(dtype='float64'),
-            )
-    v = x.values
-    finite_inds = np.isfinite(v)
-    if np.sum(finite_inds) == 0:
+        # apply the masks in that case.
+        if not one_mask.all():
+            mask = one_mask
+    vmin = vmax = pmin = None
+    step = max(1, chunk_size // max(1, v[0:1].size))
+    for start in range(0, len(v), step):
+        chunk = v[start : start + step]
+        valid = np.isfinite(chunk)
+        if mask is not None:
+            valid &= ~mask[start : start + step]
+        vals = chunk if valid.all() else chunk[valid]
+        if vals.size == 0:
+            continue
+        lo, hi = vals.min(), vals.max()
+        vmin = lo if vmin is None else min(vmin, lo)
+        vmax = hi if vmax is None else max(vmax, hi)
+        if not is_dt:
+            positives = vals if lo > 0 else vals[vals > 0]
+            if positives.size:
+                lo = positives.min()
+                pmin = lo if pmin is None else min(pmin, lo)
+    if vmin is None:
         raise ValueError("No finite values were found in array. Cannot compute limits.")
-    finite_vals = v[finite_inds]
-    finite_max = None
-    if scale == "log":
-        if is_dt:
-            finite_min = np.amin(finite_vals)
+    if (mask is not None) and (not is_dt):
+        # Masked values used to be replaced by NaN, which always yielded float limits
+        vmin, vmax = float(vmin), float(vmax)
+        pmin = None if pmin is None else float(pmin)
+    return ValueRange(min=vmin, max=vmax, positive_min=pmin, unit=x.unit)
+
+
+def limits_from_value_range(
+    vrange: ValueRange,
+    scale: Literal['linear', 'log'] = 'linear',
+    pad: bool = False,
+) -> tuple[sc.Variable, sc.Variable]:
+    """
+    Find sensible limits from a range of values, depending on linear or log scale.
+    If there are no positive values, and the scale is log, fall back to some sensible
+    default values.
+
+    Parameters
+    ----------
+    vrange:
+        The range of values, as returned by :func:`value_range`.
+    scale:
+        The scale to use for the limits.
+    pad:
+        Whether to pad the limits.
+    """
+    is_dt = isinstance(vrange.min, np.datetime64)
+    finite_min, finite_max = vrange.min, vrange.max
+    if (scale == "log") and (not is_dt):
+        if vrange.positive_min is None:
+            finite_min = 0.1
+            finite_max = 1.0
         else:
-            positives = finite_vals > 0
-            if np.sum(positives) == 0:
-                finite_min = 0.1
-                finite_max = 1.0
-            else:
-                initial = (np.finfo if v.dtype.kind == 'f' else np.iinfo)(v.dtype).max
-                finite_min = np.amin(
-                    finite_vals, initial=initial, where=finite_vals > 0
-                )
-    else:
-        finite_min = np.amin(finite_vals)
-    if finite_max is None:
-        finite_max = np.amax(finite_vals)
+            finite_min = vrange.positive_min
     if pad:
         delta = 0.05
         if (scale == 'log') and (not is_dt):
@@ -89,7 +131,33 @@ def find_limits(
             p = (finite_max - finite_min) * delta
             finite_min -= p
             finite_max += p
-    return (sc.scalar(finite_min, unit=x.unit), sc.scalar(finite_max, unit=x.unit))
+    return (
+        sc.scalar(finite_min, unit=vrange.unit),
+        sc.scalar(finite_max, unit=vrange.unit),
+    )
+
+
+def find_limits(
+    x: sc.Variable | sc.DataArray,
+    scale: Literal['linear', 'log'] = 'linear',
+    pad: bool = False,
+) -> tuple[sc.Variable, sc.Variable]:
+    """
+    Find sensible limits, depending on linear or log scale.
+    If there are no finite values in the array, raise an error.
+    If there are no positive values in the array, and the scale is log, fall back to
+    some sensible default values.
+
+    Parameters
+    ----------
+    x:
+        The data for which to find the limits.
+    scale:
+        The scale to use for the limits.
+    pad:
+        Whether to pad the limits.
+    """
+    return limits_from_value_range(value_range(x), scale=scale, pad=pad)
 
 
 def fix_empty_range(
@@ -109,3 +177,55 @@ def fix_empty_range(
             # We decompose value and unit to avoid operation exceptions when unit=None.
             dx = sc.scalar(0.5 * abs(lims[0].value), unit=lims[0].unit)
     return (lims[0] - dx, lims[1] + dx)
+
+
+class ValueSampler:
+    """
+    Draw a fixed-size random sample of the finite (and unmasked) values of arrays, to
+    estimate quantiles in bounded memory and time. The sample positions are drawn
+    once for a given array shape, and re-used for all arrays with the same shape (e.g.
+    successive updates of the same artist). Arrays smaller than the sample size are
+    not sampled.
+
+    Parameters
+    ----------
+    size:
+        The number of values in the sample.
+    seed:
+        The seed of the random number generator.
+    """
+
+    def __init__(self, size: int = 100_000, seed: int = 0):
+        self._size = size
+        self._rng = np.random.default_rng(seed)
+        self._positions = {}
+
+    def _get_positions(self, shape: tuple[int, ...]) -> tuple[np.ndarray, ...] | None:
+        if int(np.prod(shape)) <= self._size:
+            return None
+        if shape not in self._positions:
+            flat = np.sort(self._rng.integers(0, np.prod(shape), size=self._size))
+            self._positions[shape] = np.unravel_index(flat, shape)
+        return self._positions[shape]
+
+    def __call__(self, x: sc.Variable | sc.DataArray) -> np.ndarray:
+        """
+        Return the sampled values of an array.
+
+        Parameters
+        ----------
+        x:
+            The array to sample.
+        """
+        v = np.atleast_1d(np.asarray(x.values))
+        positions = self._get_positions(v.shape)
+        values = v.ravel() if positions is None else v[positions]
+        valid = np.isfinite(values)
+        if getattr(x, 'masks', None):
+            mask = np.atleast_1d(
+                sc.broadcast(merge_masks(x.masks), sizes=x.sizes).values
+            )
+            mask = mask.ravel() if positions is None else mask[positions]
+            if not mask.all():
+                valid &= ~mask
+        return values[valid]
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import threading
 import uuid
+from collections import deque
 from itertools import chain
 from typing import Any
 
+from .cache import NodeCache, freeze
 from .view import View
 
 
@@ -20,6 +23,39 @@ def _no_replace_append(container: list[Node], item: Node, kind: str) -> None:
     container.append(item)
 
 
+def _descendants_in_order(start: Node) -> list[Node]:
+    """
+    Return ``start`` and all of its descendants, sorted topologically so that every
+    node appears after all of its parents that are also part of the sub-graph.
+    Nodes reachable through several paths (e.g. diamond-shaped graphs) only appear
+    once.
+    """
+    # Count, for every node in the sub-graph, how many of its parents are also
+    # downstream of ``start``.
+    in_degree = {start.id: 0}
+    nodes = {start.id: start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for child in node.children:
+            if child.id not in nodes:
+                nodes[child.id] = child
+                in_degree[child.id] = 0
+                stack.append(child)
+            in_degree[child.id] += 1
+    # Kahn's algorithm, which preserves the order in which children were added.
+    order = []
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in node.children:
+            in_degree[child.id] -= 1
+            if in_degree[child.id] == 0:
+                queue.append(child)
+    return order
+
+
 class Node:
     """
     A node that can have parent and children nodes, to create a graph.
@@ -32,7 +68,16 @@ class Node:
     traversing the graph from bottom to top.
 
     Caching is used to avoid traversing the graph multiple times when data is
-    requested multiple times without any changes to the graph.
+    requested multiple times without any changes to the graph. When a node notifies
+    its children, all the nodes downstream are first marked as dirty, before the
+    views are notified in topological order. This ensures that each node is only
+    evaluated once per change, and that each view is notified only once per node,
+    even when a node can be reached through multiple paths in the graph.
+
+    In addition, a node can keep a bounded cache of previous results (see
+    :meth:`Node.enable_cache`), keyed on the values (or versions) of its parents. When
+    the parents return to a state that was seen before, the result is then fetched
+    from the cache instead of calling ``func`` again.
 
     Leaf nodes are nodes that have neither children nor views. When such nodes are
     notified of changes, they will call their ``func`` to ensure any side effects are
@@ -66,6 +111,13 @@ class Node:
             key: p if isinstance(p, Node) else Node(p) for key, p in kwparents.items()
         }
         self._data = None
+        self._dirty = True
+        self._stamp = 0
+        # Only guards the cached state: no lock is held while ``func`` runs
+        self._lock = threading.Lock()
+        self._version = None
+        self._counter = 0
+        self._cache = None
 
         if func_is_callable:
             # Set automatic name from function name and arguments
@@ -123,7 +175,7 @@ class Node:
             child.kwparents = {
                 key: parent for key, parent in child.kwparents.items() if parent != self
             }
-            child._data = None
+            child._mark_dirty()
         self.children.clear()
         for view in self.views:
             del view.graph_nodes[self.id]
@@ -132,7 +184,101 @@ class Node:
         self.views.clear()
         self.parents.clear()
         self.kwparents.clear()
-        self._data = None
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """
+        Mark the cached data as out-of-date, so that it is re-computed the next time
+        data is requested from the node.
+        """
+        with self._lock:
+            self._data = None
+            self._dirty = True
+            self._version = None
+            self._stamp += 1
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the cached data of the node is out-of-date.
+        """
+        return self._dirty
+
+    @property
+    def stamp(self) -> int:
+        """
+        A counter that is incremented every time the node is marked as dirty. A result
+        computed while the stamp changed is out-of-date.
+        """
+        return self._stamp
+
+    @property
+    def version(self) -> Any:
+        """
+        A hashable token identifying the current value of the node. Two identical
+        tokens mean that the node returned the same value. For nodes with parents,
+        the token is derived from the values (or versions) of the parents. For nodes
+        without parents, the token is the value itself if it can be made hashable,
+        and a counter that is incremented every time ``func`` is called otherwise.
+        """
+        if self._version is None:
+            self.request_data()
+            if self.parents or self.kwparents:
+                self._version = self._input_key()
+            else:
+                try:
+                    self._version = (self.id, freeze(self._data))
+                except TypeError:
+                    self._version = (self.id, self._counter)
+        return self._version
+
+    def _input_key(self) -> Any:
+        """
+        Make a hashable key from the current values of the parents. Parent values
+        that cannot be made hashable (e.g. data arrays) are represented by the version
+        of the parent node.
+        """
+
+        def token(parent: Node) -> Any:
+            try:
+                return freeze(parent.request_data())
+            except TypeError:
+                return parent.version
+
+        return (
+            self.id,
+            tuple(token(parent) for parent in self.parents),
+            tuple((key, token(parent)) for key, parent in self.kwparents.items()),
+        )
+
+    @property
+    def cache(self) -> NodeCache | None:
+        """
+        The cache of previous results of the node, if enabled.
+        """
+        return self._cache
+
+    def enable_cache(self, max_bytes: int = 256 * 1024**2) -> None:
+        """
+        Keep a least-recently-used cache of the results of the node, keyed on the
+        values of its parents. This is useful for nodes that perform expensive
+        computations, and whose inputs frequently return to previous states (e.g. when
+        scrubbing a slider back and forth).
+        The results must not share memory with data that is modified in place, such
+        as the buffer of a :class:`StreamNode`.
+
+        Parameters
+        ----------
+        max_bytes:
+            The memory budget of the cache, in bytes.
+        """
+        self._cache = NodeCache(max_bytes=max_bytes)
+
+    def disable_cache(self) -> None:
+        """
+        Disable and clear the cache of previous results.
+        """
+        self._cache = None
 
     def request_data(self) -> Any:
         """
@@ -141,13 +287,36 @@ class Node:
         The result from calling the function is cached, to limit the number of times
         the graph is traversed.
         """
-        if self._data is None:
-            args = (parent.request_data() for parent in self.parents)
-            kwargs = {
-                key: parent.request_data() for key, parent in self.kwparents.items()
-            }
-            self._data = self.func(*args, **kwargs)
-        return self._data
+        with self._lock:
+            if not self._dirty:
+                return self._data
+            stamp = self._stamp
+        args = [parent.request_data() for parent in self.parents]
+        kwargs = {key: parent.request_data() for key, parent in self.kwparents.items()}
+        cache = self._cache if (self.parents or self.kwparents) else None
+        key = None
+        if cache is not None:
+            key = self._input_key()
+            with self._lock:
+                found, value = cache.get(key)
+            if not found:
+                value = self.func(*args, **kwargs)
+                with self._lock:
+                    cache.put(key, value)
+        else:
+            value = self.func(*args, **kwargs)
+        with self._lock:
+            if key is None:
+                self._counter += 1
+            # The node may be marked dirty again while computing (when the graph is
+            # evaluated in a background thread), in which case the result is stale:
+            # it is returned, but not stored.
+            if self._stamp == stamp:
+                self._data = value
+                self._dirty = False
+                if key is not None:
+                    self._version = key
+        return value
 
     def add_parents(self, *parents: Node) -> None:
         """
@@ -191,20 +360,26 @@ class Node:
         Receiving a notification also means that the local copy of the data is
         out-of-date, and it is thus reset.
 
+        The notification is propagated in a single pass: the node and all of its
+        descendants are first marked as dirty, and their views are then notified in
+        topological order. Nodes that can be reached via several paths are thus only
+        evaluated and notified once.
+
         Parameters
         ----------
         message:
             The message to pass to the children.
         """
-        self._data = None
-        if self.is_leaf():
-            # Special case: leaf nodes have no children nor views, so we always request
-            # data from parents and call ``self.func``.
-            self.request_data()
-            return
-        self.notify_views(message)
-        for child in self.children:
-            child.notify_children(message)
+        nodes = _descendants_in_order(self)
+        for node in nodes:
+            node._mark_dirty()
+        for node in nodes:
+            if node.is_leaf():
+                # Special case: leaf nodes have no children nor views, so we always
+                # request data from parents and call ``self.func``.
+                node.request_data()
+            else:
+                node.notify_views(message)
 
     def notify_views(self, message: Any) -> None:
         """
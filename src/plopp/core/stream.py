@@ -0,0 +1,251 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+from __future__ import annotations
+
+import scipp as sc
+
+from .node_class import Node
+
+
+def _buffered_entries(
+    mapping: sc.Coords | sc.Masks, dim: str
+) -> dict[str, sc.Variable]:
+    return {name: var for name, var in mapping.items() if dim in var.dims}
+
+
+def _empty_like(var: sc.Variable, dim: str, size: int) -> sc.Variable:
+    sizes = {d: (size if d == dim else s) for d, s in var.sizes.items()}
+    return sc.zeros(
+        sizes=sizes,
+        unit=var.unit,
+        dtype=var.dtype,
+        with_variances=var.variances is not None,
+    )
+
+
+class StreamNode(Node):
+    """
+    An input node for data that arrives in chunks, for example from a live data
+    acquisition. The node keeps the most recent ``capacity`` elements along the
+    streaming dimension ``dim`` in a pre-allocated buffer. Appending a chunk only
+    copies the chunk into the buffer, and the data returned by the node is a view
+    into the buffer (no copy of the full window is made).
+
+    The buffer is twice as large as ``capacity``, so that the current window is
+    always contiguous: when the end of the buffer is reached, the most recent
+    elements are moved back to the start of the buffer.
+
+    Note that because the data returned by the node is a view, it is only valid until
+    the next call to :meth:`StreamNode.append` or :meth:`StreamNode.replace`. For the
+    same reason, caching (see :meth:`Node.enable_cache`) is not supported for nodes
+    below a stream node whose results share memory with the stream (e.g. slices):
+    cached results would change under the cache with the next chunk.
+
+    .. versionadded:: 26.11.0
+
+    Parameters
+    ----------
+    data:
+        The initial data. This also defines the dims, dtype, units, coordinates and
+        masks of the stream. It can have a length of zero along ``dim``.
+    dim:
+        The dimension along which the data is streamed. Defaults to the outermost
+        dimension of ``data``.
+    capacity:
+        The maximum number of elements along ``dim`` that are kept.
+    """
+
+    def __init__(
+        self,
+        data: sc.DataArray | sc.Variable,
+        dim: str | None = None,
+        capacity: int = 100_000,
+    ):
+        super().__init__(lambda: self._window())
+        if isinstance(data, sc.Variable):
+            data = sc.DataArray(data=data)
+        if dim is None:
+            dim = data.dims[0]
+        if dim not in data.dims:
+            raise sc.DimensionError(
+                f"Stream dimension '{dim}' not found in data with dims {data.dims}."
+            )
+        if capacity < 1:
+            raise ValueError(f"Stream capacity must be positive, got {capacity}.")
+        for name, coord in data.coords.items():
+            if dim in coord.dims and data.coords.is_edges(name, dim=dim):
+                raise ValueError(
+                    f"Coordinate '{name}' is bin-edges along the stream dimension "
+                    f"'{dim}', which is not supported."
+                )
+        self.pretty_name = f'Stream <{dim}, capacity={capacity}>'
+        self._dim = dim
+        self._capacity = capacity
+        self._index_coord = dim not in data.coords
+        size = 2 * capacity
+        self._buffer = sc.DataArray(
+            data=_empty_like(data.data, dim, size),
+            coords={
+                name: (_empty_like(coord, dim, size) if dim in coord.dims else coord)
+                for name, coord in data.coords.items()
+            },
+            masks={
+                name: (_empty_like(mask, dim, size) if dim in mask.dims else mask)
+                for name, mask in data.masks.items()
+            },
+            name=data.name,
+        )
+        if self._index_coord:
+            self._buffer.coords[dim] = sc.zeros(
+                sizes={dim: size}, unit=None, dtype='int64'
+            )
+        self._start = 0
+        self._stop = 0
+        self._count = 0
+        self._write(self._check(data))
+
+    @property
+    def dim(self) -> str:
+        """
+        The dimension along which the data is streamed.
+        """
+        return self._dim
+
+    @property
+    def capacity(self) -> int:
+        """
+        The maximum number of elements kept along the stream dimension.
+        """
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        """
+        The current number of elements along the stream dimension.
+        """
+        return self._stop - self._start
+
+    def _window(self) -> sc.DataArray:
+        return self._buffer[self._dim, self._start : self._stop]
+
+    def _assign(self, start: int, chunk: sc.DataArray) -> None:
+        stop = start + chunk.sizes[self._dim]
+        targets = [(self._buffer.data, chunk.data)]
+        targets += [
+            (coord, chunk.coords[name])
+            for name, coord in _buffered_entries(self._buffer.coords, self._dim).items()
+            if not (self._index_coord and name == self._dim)
+        ]
+        targets += [
+            (mask, chunk.masks[name])
+            for name, mask in _buffered_entries(self._buffer.masks, self._dim).items()
+        ]
+        for target, source in targets:
+            target[self._dim, start:stop] = source.transpose(target.dims)
+        if self._index_coord:
+            self._buffer.coords[self._dim][self._dim, start:stop] = sc.arange(
+                self._dim,
+                self._count - chunk.sizes[self._dim],
+                self._count,
+                unit=None,
+                dtype='int64',
+            )
+
+    def _move_to_front(self, keep: int) -> None:
+        variables = [
+            self._buffer.data,
+            *_buffered_entries(self._buffer.coords, self._dim).values(),
+            *_buffered_entries(self._buffer.masks, self._dim).values(),
+        ]
+        for var in variables:
+            var[self._dim, 0:keep] = var[
+                self._dim, self._stop - keep : self._stop
+            ].copy()
+        self._start = 0
+        self._stop = keep
+
+    def _check(self, chunk: sc.DataArray | sc.Variable) -> sc.DataArray:
+        """
+        Check that a chunk can be written to the buffer, before any of the state of
+        the stream is modified.
+        """
+        if isinstance(chunk, sc.Variable):
+            chunk = sc.DataArray(data=chunk)
+        if set(chunk.dims) != set(self._buffer.dims):
+            raise sc.DimensionError(
+                f"Chunk with dims {chunk.dims} is incompatible with stream dims "
+                f"{self._buffer.dims}."
+            )
+        for dim, size in self._buffer.sizes.items():
+            if dim != self._dim and chunk.sizes[dim] != size:
+                raise sc.DimensionError(
+                    f"Chunk has size {chunk.sizes[dim]} along '{dim}', expected {size}."
+                )
+        targets = {'data': (self._buffer.data, chunk.data)}
+        for kind in ('coords', 'masks'):
+            entries = _buffered_entries(getattr(self._buffer, kind), self._dim)
+            for name, var in entries.items():
+                if kind == 'coords' and self._index_coord and name == self._dim:
+                    continue
+                if name not in getattr(chunk, kind):
+                    raise KeyError(f"Chunk is missing {kind[:-1]} '{name}'.")
+                targets[name] = (var, getattr(chunk, kind)[name])
+        for name, (target, source) in targets.items():
+            if source.unit != target.unit:
+                raise sc.UnitError(
+                    f"Chunk has unit {source.unit} for '{name}', expected "
+                    f"{target.unit}."
+                )
+            if source.dtype != target.dtype:
+                raise sc.DTypeError(
+                    f"Chunk has dtype {source.dtype} for '{name}', expected "
+                    f"{target.dtype}."
+                )
+        return chunk
+
+    def _write(self, chunk: sc.DataArray) -> None:
+        n = chunk.sizes[self._dim]
+        self._count += n
+        if n >= self._capacity:
+            self._start = 0
+            self._stop = self._capacity
+            self._assign(0, chunk[self._dim, n - self._capacity :])
+            return
+        if self._stop + n > 2 * self._capacity:
+            self._move_to_front(min(self.size, self._capacity - n))
+        self._assign(self._stop, chunk)
+        self._stop += n
+        self._start = max(self._start, self._stop - self._capacity)
+
+    def append(self, chunk: sc.DataArray | sc.Variable) -> None:
+        """
+        Append a chunk of data at the end of the stream, dropping the oldest elements
+        if the capacity is exceeded, and notify the children.
+
+        Parameters
+        ----------
+        chunk:
+            The new data. It must have the same dims (and sizes along the other
+            dims), units and dtype as the initial data.
+        """
+        self._write(self._check(chunk))
+        self.notify_children('append')
+
+    def replace(self, window: sc.DataArray | sc.Variable) -> None:
+        """
+        Replace the entire content of the stream with ``window``, and notify the
+        children.
+
+        Parameters
+        ----------
+        window:
+            The new data. If it is longer than the capacity, only the last elements
+            are kept.
+        """
+        window = self._check(window)
+        self._start = 0
+        self._stop = 0
+        self._count = 0
+        self._write(window)
+        self.notify_children('replace')
@@ -7,6 +7,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from .executor import BackgroundEvaluator
     from .node_class import Node
 
 
@@ -23,6 +24,9 @@ class View:
         The nodes that are attached to the view.
     """
 
+    # When set, data requested upon notification is computed in the background
+    _evaluator: BackgroundEvaluator | None = None
+
     def __init__(self, *nodes: Node) -> None:
         self._id = uuid.uuid4().hex
         self.graph_nodes = {}
@@ -69,8 +73,16 @@ class View:
             The notification message containing the node id it originated from.
         """
         node_id = message["node_id"]
-        new_values = self.graph_nodes[node_id].request_data()
-        self.update(**{node_id: new_values})
+        node = self.graph_nodes[node_id]
+        if self._evaluator is None:
+            self.update(**{node_id: node.request_data()})
+        else:
+            self._evaluator.submit(
+                node_id,
+                node.request_data,
+                lambda new_values: self.update(**{node_id: new_values}),
+                stamp=lambda: node.stamp,
+            )
 
     @abstractmethod
     def update(self, *args: Any, **kwargs: Any) -> None:
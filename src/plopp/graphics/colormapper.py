@@ -13,7 +13,13 @@ from matplotlib.colorbar import ColorbarBase
 from matplotlib.colors import Colormap, LinearSegmentedColormap, LogNorm, Normalize
 
 from ..backends.matplotlib.utils import fig_to_bytes
-from ..core.limits import find_limits, fix_empty_range
+from ..core.limits import (
+    ValueRange,
+    ValueSampler,
+    fix_empty_range,
+    limits_from_value_range,
+    value_range,
+)
 from ..core.utils import maybe_variable_to_number, merge_masks
 from ..utils import parse_mutually_exclusive
 
@@ -136,6 +142,18 @@ class ColorMapper:
         The maximum value for the colorscale range. If a number (without a unit) is
         supplied, it is assumed that the unit is the same as the data unit.
         This is an old parameter name. Prefer using ``cmax`` instead.
+    autoscale:
+        How the colorscale range is found when autoscaling. With ``'minmax'``, the
+        range spans all the (finite) values. With ``'percentile'``, the range is
+        estimated from a fixed-size random sample of the values, using the
+        ``percentile`` bounds. This ignores outliers such as hot pixels.
+
+        .. versionadded:: 26.11.0
+    percentile:
+        The lower and upper percentiles (between 0 and 100) used when
+        ``autoscale='percentile'``.
+
+        .. versionadded:: 26.11.0
     """
 
     def __init__(
@@ -154,7 +172,14 @@ class ColorMapper:
         norm: Literal['linear', 'log'] | None = None,
         vmin: sc.Variable | float | None = None,
         vmax: sc.Variable | float | None = None,
+        autoscale: Literal['minmax', 'percentile'] = 'minmax',
+        percentile: tuple[float, float] = (1.0, 99.0),
     ):
+        if autoscale not in ('minmax', 'percentile'):
+            raise ValueError(
+                f"Invalid autoscale mode: {autoscale}. "
+                "Valid values are 'minmax' and 'percentile'."
+            )
         cmin = parse_mutually_exclusive(vmin=vmin, cmin=cmin)
         cmax = parse_mutually_exclusive(vmax=vmax, cmax=cmax)
         logc = parse_mutually_exclusive(norm=norm, logc=logc)
@@ -193,6 +218,12 @@ class ColorMapper:
         self.changed = False
         self.artists = {}
         self.widget = None
+        self._luts = {}
+        self._value_ranges = {}
+        self._autoscale = autoscale
+        self._percentile = percentile
+        self._sampler = ValueSampler()
+        self._samples = {}
 
         if cbar:
             if self.cax is None:
@@ -218,6 +249,58 @@ class ColorMapper:
 
     def remove_artist(self, key: str):
         del self.artists[key]
+        self._value_ranges.pop(key, None)
+        self._samples.pop(key, None)
+
+    def _artist_value_range(self, key: str, artist: Any) -> ValueRange:
+        """
+        Get the range of values of an artist's data. The range is cached until the
+        artist's data is replaced by a new object (which is what artists do on
+        update), so that changing the norm does not require scanning the data again.
+        """
+        cached = self._value_ranges.get(key)
+        if cached is not None and cached[0] is artist._data:
+            return cached[1]
+        vrange = value_range(artist._data)
+        self._value_ranges[key] = (artist._data, vrange)
+        return vrange
+
+    def _artist_sample(self, key: str, artist: Any) -> np.ndarray:
+        """
+        Get a sample of the values of an artist's data, cached in the same way as the
+        value range.
+        """
+        cached = self._samples.get(key)
+        if cached is not None and cached[0] is artist._data:
+            return cached[1]
+        sample = self._sampler(artist._data)
+        self._samples[key] = (artist._data, sample)
+        return sample
+
+    def _minmax_limits(self, scale: Literal['linear', 'log']) -> list:
+        return [
+            fix_empty_range(
+                limits_from_value_range(
+                    self._artist_value_range(key, artist), scale=scale
+                )
+            )
+            for key, artist in self.artists.items()
+        ]
+
+    def _percentile_limits(self, scale: Literal['linear', 'log']) -> list:
+        samples = [
+            self._artist_sample(key, artist) for key, artist in self.artists.items()
+        ]
+        values = np.concatenate(samples)
+        if values.dtype.kind not in 'biuf':
+            return self._minmax_limits(scale)
+        if scale == 'log':
+            values = values[values > 0]
+        if values.size == 0:
+            return self._minmax_limits(scale)
+        lo, hi = np.percentile(values, self._percentile)
+        unit = next(iter(self.artists.values()))._data.unit
+        return [fix_empty_range((sc.scalar(lo, unit=unit), sc.scalar(hi, unit=unit)))]
 
     def to_widget(self):
         """
@@ -243,7 +326,55 @@ class ColorMapper:
         if self.widget is not None:
             self.widget.set_svg(fig_to_bytes(self.cax.get_figure(), form='svg'))
 
-    def rgba(self, data: sc.DataArray) -> np.ndarray:
+    def _lut(self, cmap: Colormap, bytes: bool) -> np.ndarray:
+        """
+        Get the lookup table of a colormap, with the 'under', 'over' and 'bad' colors
+        appended at the end (in that order, as in Matplotlib). The tables are cached.
+        """
+        key = (id(cmap), bytes)
+        cached = self._luts.get(key)
+        if cached is not None and cached[0] is cmap:
+            return cached[1]
+        lut = np.concatenate(
+            [
+                cmap(np.arange(cmap.N)),
+                [cmap.get_under(), cmap.get_over(), cmap.get_bad()],
+            ]
+        )
+        if bytes:
+            lut = (lut * 255).astype(np.uint8)
+        self._luts[key] = (cmap, lut)
+        return lut
+
+    def _lut_indices(self, values: np.ndarray, n: int) -> np.ndarray:
+        """
+        Convert data values to indices in a lookup table of ``n`` colors, following
+        the same rules as Matplotlib's normalizers and colormaps.
+        """
+        vmin, vmax = self.normalizer.vmin, self.normalizer.vmax
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self._logc:
+                # Matplotlib's LogNorm masks non-positive and infinite values
+                x = np.log10(values, dtype=float)
+                bad = ~np.isfinite(x)
+                vmin, vmax = np.log10(vmin), np.log10(vmax)
+            else:
+                bad = np.isnan(values)
+                x = np.subtract(values, 0, dtype=float)
+            if vmax == vmin:
+                x[...] = 0
+            else:
+                x -= vmin
+                x *= n / (vmax - vmin)
+        x[x == n] = n - 1
+        x[x >= n] = n + 1
+        x[x < 0] = n
+        x[bad] = n + 2
+        return x.astype(np.intp)
+
+    def rgba(
+        self, data: sc.DataArray, bytes: bool = False, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Return rgba values given a data array.
 
@@ -251,11 +382,21 @@ class ColorMapper:
         ----------
         data:
             The data array to be converted to rgba colors, taking masks into account.
+        bytes:
+            If ``True``, return colors as ``uint8`` in the range 0-255 instead of
+            floats in the range 0-1.
+        out:
+            Optional array of shape ``data.shape + (4,)`` and matching dtype to write
+            the colors into.
         """
-        colors = self.cmap(self.normalizer(data.values))
+        indices = self._lut_indices(data.values, self.cmap.N)
+        colors = np.take(self._lut(self.cmap, bytes=bytes), indices, axis=0, out=out)
         if data.masks:
             one_mask = sc.broadcast(merge_masks(data.masks), sizes=data.sizes).values
-            colors[one_mask] = self.mask_cmap(self.normalizer(data.values[one_mask]))
+            mask_lut = self._lut(self.mask_cmap, bytes=bytes)
+            if self.mask_cmap.N != self.cmap.N:
+                indices = self._lut_indices(data.values, self.mask_cmap.N)
+            colors[one_mask] = mask_lut[indices[one_mask]]
         return colors
 
     def autoscale(self):
@@ -271,12 +412,12 @@ class ColorMapper:
             self.apply_limits()
             return
 
-        limits = [
-            fix_empty_range(
-                find_limits(artist._data, scale='log' if self._logc else 'linear')
-            )
-            for artist in self.artists.values()
-        ]
+        scale = 'log' if self._logc else 'linear'
+        limits = (
+            self._percentile_limits(scale)
+            if self._autoscale == 'percentile'
+            else self._minmax_limits(scale)
+        )
         if "user" not in self._cmin:
             self._cmin["data"] = reduce(min, [v[0] for v in limits]).value
         else:
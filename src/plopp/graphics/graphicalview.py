@@ -2,17 +2,20 @@
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
 from collections.abc import Callable
+from concurrent.futures import Executor
 from typing import Any, Literal
 
 import numpy as np
 import scipp as sc
 
 from ..core import Node, View
+from ..core.executor import BackgroundEvaluator
 from ..core.typing import CanvasLike
 from ..core.utils import make_compatible, name_with_unit
 from .bbox import BoundingBox
 from .camera import Camera
 from .colormapper import ColorMapper
+from .scheduler import get_scheduler
 
 
 def _none_if_not_finite(x: float | None) -> float | int | None:
@@ -63,7 +66,7 @@ class GraphicalView(View):
         legend: bool | tuple[float, float] = True,
         camera: Camera | None = None,
         perspective: bool = True,
-        autoscale: bool = True,
+        autoscale: bool | Literal['percentile'] = True,
         ax: Any = None,
         cax: Any = None,
         xmin: sc.Variable | float | None = None,
@@ -83,6 +86,9 @@ class GraphicalView(View):
         zlabel: str | None = None,
         clabel: str | None = None,
         nan_color: str | None = None,
+        max_fps: float | None = None,
+        executor: Executor | bool | None = None,
+        badge: str | None = None,
         **kwargs,
     ):
         super().__init__(*nodes)
@@ -96,7 +102,8 @@ class GraphicalView(View):
         self.bbox = BoundingBox()
         self._data_name = None
         self._data_axis = None
-        self._autoscale = autoscale
+        self._autoscale = bool(autoscale)
+        self._pending_data = {}
 
         self.canvas = canvas_maker(
             cbar=cbar,
@@ -123,6 +130,7 @@ class GraphicalView(View):
             zlabel=zlabel,
             norm=norm if len(dims) == 1 else None,
             autoscale_axes=self.autoscale,
+            badge=badge,
         )
 
         if colormapper:
@@ -141,6 +149,7 @@ class GraphicalView(View):
                 canvas=self.canvas,
                 figsize=getattr(self.canvas, "figsize", None),
                 nan_color=nan_color,
+                autoscale='percentile' if autoscale == 'percentile' else 'minmax',
             )
             self._kwargs['colormapper'] = self.colormapper
             if self._autoscale:
@@ -153,8 +162,21 @@ class GraphicalView(View):
             # artist maker.
             self._kwargs['mask_color'] = mask_color
 
+        # When a maximum frame rate is requested, updates are coalesced by a render
+        # scheduler shared by all the views drawing on the same canvas.
+        self._scheduler = (
+            get_scheduler(self.canvas, max_fps=max_fps) if max_fps else None
+        )
+
         self.render()
 
+        # The initial render is synchronous. After that, data requested from the
+        # graph can be computed in a background thread.
+        if executor:
+            self._evaluator = BackgroundEvaluator(
+                None if executor is True else executor
+            )
+
     def autoscale(self):
         bbox = BoundingBox()
         scales = {"xscale": self.canvas.xscale, "yscale": self.canvas.yscale}
@@ -179,8 +201,23 @@ class GraphicalView(View):
         """
         Update the view with new data by either supplying a dictionary of
         new data or by keyword arguments.
+        If the view has a render scheduler (``max_fps`` was set), the new data is
+        stored and only the latest values are applied when the scheduler draws the
+        canvas.
         """
         new = dict(*args, **kwargs)
+        if self._scheduler is None:
+            self._apply(new)
+            self.canvas.draw()
+            return
+        self._pending_data.update(new)
+        self._scheduler.schedule(self._id, self._apply_pending)
+
+    def _apply_pending(self) -> None:
+        new, self._pending_data = self._pending_data, {}
+        self._apply(new)
+
+    def _apply(self, new: dict[str, sc.DataArray]) -> None:
         need_legend_update = False
         for key, new_values in new.items():
             coords = {}
@@ -273,8 +310,6 @@ class GraphicalView(View):
         if self._autoscale:
             self.fit_to_data()
 
-        self.canvas.draw()
-
     def fit_to_data(self) -> None:
         """
         Autoscale axes and colormapper.
@@ -299,6 +334,8 @@ class GraphicalView(View):
         old = self._autoscale
         self._autoscale = False
         super().render()
+        if self._scheduler is not None:
+            self._scheduler.flush()
         self.fit_to_data()
         self.canvas.draw()
         self._autoscale = old
@@ -313,6 +350,7 @@ class GraphicalView(View):
             The id of the object to be removed.
         """
         super().remove(key)
+        self._pending_data.pop(key, None)
         self.artists[key].remove()
         del self.artists[key]
         self.canvas.update_legend()
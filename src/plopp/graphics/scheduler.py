@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import asyncio
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from ..widgets.debounce import Timer
+
+
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class RenderScheduler:
+    """
+    Coalesce the updates made to a canvas, so that the canvas is drawn at most
+    ``max_fps`` times per second.
+
+    Every update is registered with :meth:`schedule` using a key, and only the latest
+    callback for a given key is kept. When the frame budget allows it, all pending
+    callbacks are called, followed by a single draw of the canvas.
+
+    If an asyncio event loop is running (e.g. in a Jupyter kernel), updates that arrive
+    too early are applied by a timer at the end of the frame interval. Without an event
+    loop (e.g. in scripts), nothing would apply them later, so every update is applied
+    and drawn immediately.
+
+    .. versionadded:: 26.11.0
+
+    Parameters
+    ----------
+    canvas:
+        The canvas to draw.
+    max_fps:
+        The maximum number of draws per second.
+    """
+
+    def __init__(self, canvas: Any, max_fps: float = 30.0):
+        self._canvas = canvas
+        self.max_fps = max_fps
+        self._pending = {}
+        self._timer = None
+        self._last_draw = -float('inf')
+        self.ndraws = 0
+
+    @property
+    def max_fps(self) -> float:
+        """
+        The maximum number of draws per second.
+        """
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, value: float):
+        if value <= 0:
+            raise ValueError(f"max_fps must be positive, got {value}.")
+        self._max_fps = float(value)
+
+    @property
+    def pending(self) -> bool:
+        """
+        ``True`` if some updates have not yet been applied.
+        """
+        return bool(self._pending)
+
+    def schedule(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """
+        Register an update. The callback replaces any pending callback with the same
+        key.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the source of the update (typically a view id).
+        callback:
+            The function that applies the update, without drawing the canvas.
+        """
+        self._pending[key] = callback
+        if self._timer is not None:
+            # A flush is already planned at the end of the current frame interval
+            return
+        wait = self._last_draw + 1.0 / self._max_fps - time.perf_counter()
+        if wait <= 0 or not _has_running_loop():
+            self.flush()
+        else:
+            self._timer = Timer(wait, self._on_timer)
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.flush()
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove a pending update, if any.
+
+        Parameters
+        ----------
+        key:
+            The key of the update to remove.
+        """
+        self._pending.pop(key, None)
+
+    def flush(self) -> None:
+        """
+        Apply all pending updates and draw the canvas once.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            callback()
+        self._canvas.draw()
+        self.ndraws += 1
+        self._last_draw = time.perf_counter()
+
+
+def get_scheduler(canvas: Any, max_fps: float) -> RenderScheduler:
+    """
+    Return the render scheduler attached to a canvas, creating it if needed.
+    All the views that draw on the same canvas share the same scheduler.
+
+    Parameters
+    ----------
+    canvas:
+        The canvas to draw.
+    max_fps:
+        The maximum number of draws per second.
+    """
+    scheduler = getattr(canvas, '_render_scheduler', None)
+    if scheduler is None:
+        scheduler = RenderScheduler(canvas, max_fps=max_fps)
+        canvas._render_scheduler = scheduler
+    else:
+        scheduler.max_fps = max_fps
+    return scheduler
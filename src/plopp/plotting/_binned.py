@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+import scipp as sc
+
+from ..core import Node
+
+DEFAULT_RESOLUTION = 1000
+
+
+def _histogram(da: sc.DataArray, dims: list[str], bins: dict) -> sc.DataArray:
+    """
+    Histogram binned data into the requested dims. Outer dims that are not requested
+    are concatenated, and the requested dims that are event coordinates are
+    histogrammed using ``bins``. Requested outer dims without a matching event
+    coordinate keep the existing binning.
+    """
+    for dim in dims:
+        if (dim not in da.dims) and (dim not in da.bins.coords):
+            raise ValueError(
+                f"coords: '{dim}' is neither a dimension nor an event coordinate "
+                "of the binned data."
+            )
+    to_concat = [dim for dim in da.dims if dim not in dims]
+    if to_concat:
+        da = da.bins.concat(to_concat)
+    edges = {dim: bins[dim] for dim in dims if dim in da.bins.coords}
+    out = da.hist(edges) if edges else da.hist()
+    return out.transpose([dim for dim in dims if dim in out.dims])
+
+
+class DisplayHistogram:
+    """
+    Histogram binned (event) data for display.
+
+    When called with binned data (as the function of a node), the events are
+    histogrammed over their full range, using ``resolution`` bins along each event
+    coordinate. The result is kept until the input changes.
+    The :meth:`window` method re-histograms only the events that fall inside the
+    visible region of the axes, at the resolution of the screen. Artists call it
+    when the axes are zoomed or panned. The most recent windows are cached, so that
+    going back and forth between views does not histogram the events again.
+
+    Parameters
+    ----------
+    dims:
+        The dims of the histogram. These can be dims of the binned data or names of
+        event coordinates. Outer dims that are not listed are concatenated.
+    resolution:
+        The number of bins along each event coordinate, for the full-range histogram.
+    cache_size:
+        The number of windows to keep in the cache.
+    """
+
+    def __init__(
+        self,
+        dims: list[str],
+        resolution: int = DEFAULT_RESOLUTION,
+        cache_size: int = 16,
+    ):
+        # Used by the Node to generate its name
+        self.__name__ = 'hist'
+        self._dims = list(dims)
+        self._resolution = resolution
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._source = None
+        self._full = None
+
+    def __call__(self, da: sc.DataArray) -> sc.DataArray:
+        if da is not self._source:
+            self._cache.clear()
+            self._full = _histogram(
+                da, self._dims, dict.fromkeys(self._dims, self._resolution)
+            )
+            self._source = da
+        return self._full
+
+    def _window_edges(
+        self, dim: str, limits: tuple[float, float], bins: int
+    ) -> tuple[float, float, int] | None:
+        edges = self._full.coords[dim]
+        if edges.dtype not in (sc.DType.float64, sc.DType.float32):
+            return None
+        vmin, vmax = float(edges.values[0]), float(edges.values[-1])
+        lo, hi = sorted(float(x) for x in limits)
+        if not hi > lo:
+            return None
+        start, stop = max(lo, vmin), min(hi, vmax)
+        if not stop > start:
+            return None
+        # The number of bins is for the whole axis: only the part covered by the data
+        # needs to be histogrammed.
+        nbins = max(int(np.ceil(bins * (stop - start) / (hi - lo))), 1)
+        return start, stop, nbins
+
+    def window(
+        self, limits: dict[str, tuple[float, float]], bins: dict[str, int]
+    ) -> sc.DataArray | None:
+        """
+        Histogram the events inside the visible region.
+
+        Returns ``None`` if none of the limits apply to an event coordinate (or to a
+        coordinate with a non-floating-point dtype), in which case the full-range
+        histogram should be displayed.
+
+        Parameters
+        ----------
+        limits:
+            The visible range along each dim, in the unit of the histogram coordinates.
+        bins:
+            The number of bins spanning the visible range along each dim, typically
+            the number of screen pixels.
+        """
+        if self._source is None:
+            return None
+        windows = {}
+        for dim, lims in limits.items():
+            if (dim not in self._dims) or (dim not in self._source.bins.coords):
+                continue
+            edges = self._window_edges(dim, lims, bins[dim])
+            if edges is not None:
+                windows[dim] = edges
+        if not windows:
+            return None
+        key = tuple(sorted(windows.items()))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        hist_bins = {dim: self._full.coords[dim] for dim in self._dims}
+        for dim, (start, stop, nbins) in windows.items():
+            coord = self._full.coords[dim]
+            hist_bins[dim] = sc.linspace(
+                dim, start, stop, nbins + 1, unit=coord.unit, dtype=coord.dtype
+            )
+        out = _histogram(self._source, self._dims, hist_bins)
+        self._cache[key] = out
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return out
+
+
+def histogram_binned_nodes(
+    nodes: list[Node], dims: list[str] | None = None
+) -> tuple[list[Node], dict[str, Callable]]:
+    """
+    Add a :class:`DisplayHistogram` node after each node that provides binned data.
+
+    Returns the new list of nodes, and a dict of the ``window`` methods of the
+    histograms, keyed by the id of the corresponding node. The dict is meant to be
+    forwarded to the artists (as the ``rebin`` argument), which use it to
+    re-histogram the data when the axes are zoomed or panned.
+
+    Parameters
+    ----------
+    nodes:
+        The nodes providing the (pre-processed) data.
+    dims:
+        The dims of the histograms. If ``None``, the dims of the binned data are used.
+    """
+    if isinstance(dims, str):
+        dims = [dims]
+    out = []
+    rebin = {}
+    for node in nodes:
+        da = node()
+        if not da.is_binned:
+            out.append(node)
+            continue
+        hist = DisplayHistogram(dims=list(da.dims) if dims is None else list(dims))
+        hist_node = Node(hist, node)
+        hist_node.pretty_name = 'Histogram binned data'
+        rebin[hist_node.id] = hist.window
+        out.append(hist_node)
+    return out, rebin
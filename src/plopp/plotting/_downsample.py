@@ -0,0 +1,291 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+from __future__ import annotations
+
+import uuid
+from typing import Literal
+
+import numpy as np
+import scipp as sc
+
+from ..backends.common import minmax_decimation
+from ..core import Node
+from ..core.utils import coord_as_bin_edges
+
+
+def _fold_blocks(
+    x: sc.Variable | sc.DataArray, dim: str, factor: int
+) -> list[tuple[sc.Variable | sc.DataArray, str]]:
+    """
+    Split ``x`` along ``dim`` into blocks of ``factor`` elements, as a folded array
+    with an extra dim for the position inside the block. If the size is not a
+    multiple of the factor, the remaining elements are returned as a second folded
+    array with a single (smaller) block.
+    """
+    block = uuid.uuid4().hex
+    size = x.sizes[dim]
+    nblocks, rem = divmod(size, factor)
+    parts = []
+    if nblocks:
+        parts.append(
+            x[dim, : nblocks * factor].fold(
+                dim=dim, sizes={dim: nblocks, block: factor}
+            )
+        )
+    if rem:
+        parts.append(
+            x[dim, nblocks * factor :].fold(dim=dim, sizes={dim: 1, block: rem})
+        )
+    return [(part, block) for part in parts]
+
+
+def _block_edges(edges: sc.Variable, dim: str, factor: int) -> sc.Variable:
+    """
+    Select the bin edges of the blocks of ``factor`` bins along ``dim``: the first
+    edge of each block, and the last edge.
+    """
+    parts = [
+        part[block, 0] for part, block in _fold_blocks(edges[dim, :-1], dim, factor)
+    ]
+    return sc.concat([*parts, edges[dim, -1:]], dim)
+
+
+def block_reduce(
+    da: sc.DataArray, factors: dict[str, int], op: Literal['mean', 'sum', 'max']
+) -> sc.DataArray:
+    """
+    Reduce a data array by combining blocks of neighbouring elements.
+
+    The coordinates of the reduced dims are converted to bin edges, and the edges of
+    the blocks are used as the new coordinates. Masked values are excluded from the
+    reductions. Variances are dropped for the ``'max'`` operation.
+
+    Parameters
+    ----------
+    da:
+        The data array to reduce.
+    factors:
+        The number of elements in a block, for each dim.
+    op:
+        The operation used to combine the elements of a block.
+    """
+    if op == 'max':
+        da = sc.values(da)
+    for dim, factor in factors.items():
+        if factor <= 1:
+            continue
+        coords = {
+            name: coord_as_bin_edges(da, name, dim=dim)
+            for name, coord in da.coords.items()
+            if dim in coord.dims
+        }
+        base = da.drop_coords(list(coords))
+        parts = [
+            getattr(part, op)(block) for part, block in _fold_blocks(base, dim, factor)
+        ]
+        da = sc.concat(parts, dim).assign_coords(
+            {name: _block_edges(edges, dim, factor) for name, edges in coords.items()}
+        )
+    return da
+
+
+def _take(da: sc.DataArray, dim: str, indices: np.ndarray) -> sc.DataArray:
+    """
+    Select the elements at the given positions along ``dim`` of a one-dimensional
+    data array.
+    """
+
+    def take(var: sc.Variable) -> sc.Variable:
+        if dim not in var.dims:
+            return var
+        return sc.array(
+            dims=var.dims,
+            values=var.values[indices],
+            variances=None if var.variances is None else var.variances[indices],
+            unit=var.unit,
+            dtype=var.dtype,
+        )
+
+    return sc.DataArray(
+        data=take(da.data),
+        coords={name: take(coord) for name, coord in da.coords.items()},
+        masks={name: take(mask) for name, mask in da.masks.items()},
+        name=da.name,
+    )
+
+
+def decimate_line(da: sc.DataArray, max_size: int) -> sc.DataArray:
+    """
+    Select at most ``max_size`` points of a line, while preserving its envelope (see
+    :func:`minmax_decimation`). If the coordinate is not sorted, every n-th point is
+    selected instead.
+
+    Parameters
+    ----------
+    da:
+        The one-dimensional data array.
+    max_size:
+        The maximum number of points.
+    """
+    dim = da.dim
+    x = da.coords[dim].values
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.view(np.int64)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(da.values, dtype=float)
+    if bool(np.all(x[1:] >= x[:-1])):
+        indices = minmax_decimation(x, y, nbuckets=max(max_size // 4, 1))
+    else:
+        indices = np.arange(0, da.sizes[dim], int(np.ceil(da.sizes[dim] / max_size)))
+    return _take(da, dim, indices)
+
+
+def decimate_points(da: sc.DataArray, max_size: int) -> sc.DataArray:
+    """
+    Select every n-th point of a one-dimensional data array (for scatter plots), so
+    that at most ``max_size`` points remain.
+
+    Parameters
+    ----------
+    da:
+        The one-dimensional data array.
+    max_size:
+        The maximum number of points.
+    """
+    step = int(np.ceil(da.size / max_size))
+    return _take(da, da.dim, np.arange(0, da.size, step))
+
+
+def _image_factors(sizes: dict[str, int], max_size: int) -> dict[str, int]:
+    """
+    Find the block sizes that reduce an image to at most ``max_size`` pixels, using
+    the same factor along both dims where possible (to keep the aspect ratio of the
+    pixels).
+    """
+    (ydim, ny), (xdim, nx) = sizes.items()
+    factor = int(np.ceil(np.sqrt(ny * nx / max_size)))
+    fy = min(factor, ny)
+    nx_max = max(max_size // -(-ny // fy), 1)
+    fx = max(int(np.ceil(nx / nx_max)), 1)
+    return {ydim: fy, xdim: fx}
+
+
+def _check_args(max_size: int, op: str) -> None:
+    if max_size < 1:
+        raise ValueError(f"max_display_size must be positive, got {max_size}.")
+    if op not in ('mean', 'sum', 'max'):
+        raise ValueError(
+            f"Invalid downsampling operation '{op}'. "
+            "Expected one of 'mean', 'sum', 'max'."
+        )
+
+
+def _shape_to_string(sizes: dict[str, int]) -> str:
+    return 'x'.join(f'{size:,}' for size in sizes.values())
+
+
+class Downsample:
+    """
+    Reduce data that is larger than ``max_size`` elements, to bring it within the
+    display budget. Images are reduced by combining blocks of pixels with ``op``.
+    Lines are decimated (see :func:`decimate_line`), unless they are histograms, which
+    are reduced with ``op``. With ``points=True``, the data is a set of scatter points
+    that are decimated with :func:`decimate_points`.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum number of elements.
+    op:
+        The operation used to combine blocks of pixels (or histogram bins).
+    points:
+        If ``True``, the data represents scatter points.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        op: Literal['mean', 'sum', 'max'] = 'mean',
+        points: bool = False,
+    ):
+        # Used by the Node to generate its name
+        self.__name__ = 'downsample'
+        _check_args(max_size, op)
+        self._max_size = int(max_size)
+        self._op = op
+        self._points = points
+        self.sizes = None
+
+    def __call__(self, da: sc.DataArray) -> sc.DataArray:
+        if da.size <= self._max_size:
+            out = da
+        elif self._points:
+            out = decimate_points(da, self._max_size)
+        elif da.ndim == 1 and not da.coords.is_edges(da.dim):
+            out = decimate_line(da, self._max_size)
+        elif da.ndim == 1:
+            out = block_reduce(
+                da, {da.dim: int(np.ceil(da.size / self._max_size))}, self._op
+            )
+        else:
+            out = block_reduce(da, _image_factors(da.sizes, self._max_size), self._op)
+        self.sizes = (dict(da.sizes), dict(out.sizes))
+        return out
+
+    def description(self) -> str | None:
+        """
+        A short text describing the effective resolution of the last data, or
+        ``None`` if it was not reduced.
+        """
+        if self.sizes is None or self.sizes[0] == self.sizes[1]:
+            return None
+        before, after = (_shape_to_string(sizes) for sizes in self.sizes)
+        if self._points:
+            return f"Decimated: {before} → {after} points"
+        return f"Downsampled: {before} → {after}"
+
+
+def downsample_nodes(
+    nodes: list[Node],
+    max_size: int | None,
+    op: Literal['mean', 'sum', 'max'] = 'mean',
+    points: bool = False,
+) -> tuple[list[Node], str | None]:
+    """
+    Add a :class:`Downsample` node after each node that provides more than
+    ``max_size`` elements.
+
+    Returns the new list of nodes, and a text describing the effective resolution
+    (meant to be displayed as a badge on the figure), or ``None`` if no data needed
+    to be reduced.
+
+    Parameters
+    ----------
+    nodes:
+        The nodes providing the data to be displayed.
+    max_size:
+        The maximum number of elements to display for each node. If ``None``, the
+        nodes are returned unchanged.
+    op:
+        The operation used to combine blocks of pixels (or histogram bins).
+    points:
+        If ``True``, the nodes provide scatter points.
+    """
+    if max_size is None:
+        return nodes, None
+    _check_args(max_size, op)
+    out = []
+    descriptions = []
+    for node in nodes:
+        if node().size <= max_size:
+            out.append(node)
+            continue
+        downsample = Downsample(max_size=max_size, op=op, points=points)
+        down_node = Node(downsample, node)
+        down_node.pretty_name = 'Downsample for display'
+        down_node()
+        descriptions.append(downsample.description())
+        out.append(down_node)
+    badge = '\n'.join(dict.fromkeys(d for d in descriptions if d)) or None
+    return out, badge
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import uuid
 from functools import partial
 from typing import Literal
 
@@ -13,6 +14,7 @@ from ..core.typing import Plottable
 from ..core.utils import coord_as_bin_edges
 from ..graphics import imagefigure, linefigure
 from ..widgets import Box, PointsTool, PolygonTool, RectangleTool
+from ._range_index import RangeSumIndex
 from ._slicer import SlicerPlot
 from .common import preprocess, require_interactive_figure
 
@@ -63,6 +65,131 @@ def _slice_xy(da: sc.DataArray, xy: dict[str, dict[str, int]]) -> sc.DataArray:
         return sc.full_like(da[y['dim'], 0][x['dim'], 0], value=np.nan, dtype=float)
 
 
+def _bin_indices(edges: sc.Variable, values: list[sc.Variable]) -> np.ndarray | None:
+    """
+    Find the bins of the (sorted) ``edges`` that contain each of the ``values``, with
+    a single search. Values outside of the range of the edges get the index -1.
+    Returns ``None`` if the values cannot be converted to the unit of the edges.
+    """
+    try:
+        x = np.array([v.to(unit=edges.unit, dtype='float64').value for v in values])
+    except sc.UnitError:
+        return None
+    e = edges.values
+    indices = np.searchsorted(e, x, side='right') - 1
+    indices[~((x >= e[0]) & (x < e[-1]))] = -1
+    return indices
+
+
+def _can_gather(da: sc.DataArray, xdim: str, ydim: str) -> bool:
+    """
+    Whether the points can be gathered with :func:`_gather_xy`: the coordinates of the
+    two image dims must be sorted one-dimensional bin edges, and no other coordinate
+    may depend on them.
+    """
+    for dim in (xdim, ydim):
+        if dim not in da.coords:
+            return False
+        coord = da.coords[dim]
+        if (
+            coord.dims != (dim,)
+            or not da.coords.is_edges(dim)
+            or coord.dtype
+            not in (sc.DType.float64, sc.DType.float32, sc.DType.int64, sc.DType.int32)
+            or not np.all(np.diff(coord.values) >= 0)
+        ):
+            return False
+    return not any(
+        {xdim, ydim} & set(coord.dims)
+        for name, coord in da.coords.items()
+        if name not in (xdim, ydim)
+    )
+
+
+def _gather_xy(da: sc.DataArray, infos: list[dict]) -> list[sc.DataArray]:
+    """
+    Select the data at the positions of all the points at once. The bins that contain
+    the points are found with a single search along each of the two image dims, and the
+    values (and masks) are then gathered with a single indexing operation.
+    The results are the same as calling :func:`_slice_xy` for each point, which is done
+    instead if the coordinates do not allow it (see :func:`_can_gather`).
+    """
+    if not infos:
+        return []
+    xdim = infos[0]['x']['dim']
+    ydim = infos[0]['y']['dim']
+    same_dims = all(
+        (info['x']['dim'], info['y']['dim']) == (xdim, ydim) for info in infos
+    )
+    if not (same_dims and _can_gather(da, xdim, ydim)):
+        return [_slice_xy(da, info) for info in infos]
+    ix = _bin_indices(da.coords[xdim], [info['x']['value'] for info in infos])
+    iy = _bin_indices(da.coords[ydim], [info['y']['value'] for info in infos])
+    if ix is None or iy is None:
+        return [_slice_xy(da, info) for info in infos]
+    inside = (ix >= 0) & (iy >= 0)
+    sizes = {ydim: da.sizes[ydim], xdim: da.sizes[xdim]}
+    point = uuid.uuid4().hex
+
+    def gather(var: sc.Variable) -> sc.Variable:
+        if not set(sizes) & set(var.dims):
+            return var
+        var = sc.broadcast(var, sizes={**sizes, **var.sizes})
+        rest = [dim for dim in var.dims if dim not in sizes]
+        var = var.transpose([ydim, xdim, *rest])
+        index = (iy[inside], ix[inside])
+        return sc.array(
+            dims=[point, *rest],
+            values=var.values[index],
+            variances=None if var.variances is None else var.variances[index],
+            unit=var.unit,
+            dtype=var.dtype,
+        )
+
+    gathered = sc.DataArray(
+        data=gather(da.data),
+        coords={name: coord for name, coord in da.coords.items() if name not in sizes},
+        masks={name: gather(mask) for name, mask in da.masks.items()},
+        name=da.name,
+    )
+    # The coordinates of the bins are sliced from an array without values, so that
+    # they are the same as when slicing the data
+    meta = sc.DataArray(
+        data=sc.broadcast(sc.scalar(False), sizes=sizes),
+        coords={dim: da.coords[dim] for dim in sizes},
+    )
+    position = np.cumsum(inside) - 1
+    out = []
+    for i, info in enumerate(infos):
+        if not inside[i]:
+            # If the point is out of bounds, the result is filled with NaNs
+            out.append(_slice_xy(da, info))
+            continue
+        coords = meta[ydim, int(iy[i])][xdim, int(ix[i])].coords
+        out.append(gathered[point, int(position[i])].assign_coords(dict(coords)))
+    return out
+
+
+def _reduce_region(out: sc.DataArray, dims: tuple[str, str], op: str) -> sc.DataArray:
+    """
+    Apply the reduction operation over the two image dimensions.
+    """
+    # If the operation is a mean, there is currently a bug in the implementation
+    # in scipp where doing a mean over a subset of the array's dimensions gives the
+    # wrong result: https://github.com/scipp/scipp/issues/3841
+    # Instead, we manually compute the mean
+    if 'mean' not in op:
+        return getattr(out, op)(dims)
+    if 'nan' in op:
+        numerator = out.nansum(dims)
+        denominator = (~sc.isnan(out.data)).sum(dims)
+        denominator.unit = ""
+    else:
+        numerator = out.sum(dims)
+        denominator = out.sizes[dims[0]] * out.sizes[dims[1]]
+    return numerator / denominator
+
+
 def _slice_rectangular_region(da: sc.DataArray, rect: dict, op: str) -> sc.DataArray:
     x = rect['x']
     y = rect['y']
@@ -79,43 +206,176 @@ def _slice_rectangular_region(da: sc.DataArray, rect: dict, op: str) -> sc.DataA
             out = da[x['dim'], xmin:xmax][y['dim'], ymin:ymax]
         else:
             out = da[y['dim'], ymin:ymax][x['dim'], xmin:xmax]
-        # If the operation is a mean, there is currently a bug in the implementation
-        # in scipp where doing a mean over a subset of the array's dimensions gives the
-        # wrong result: https://github.com/scipp/scipp/issues/3841
-        # Instead, we manually compute the mean
-        dims = (x['dim'], y['dim'])
-        if 'mean' not in op:
-            return getattr(out, op)(dims)
-        if 'nan' in op:
-            numerator = out.nansum(dims)
-            denominator = (~sc.isnan(out.data)).sum(dims)
-            denominator.unit = ""
-        else:
-            numerator = out.sum(dims)
-            denominator = out.sizes[x['dim']] * out.sizes[y['dim']]
-        return numerator / denominator
+        return _reduce_region(out, (x['dim'], y['dim']), op)
     except IndexError:
         # If the index is out of bounds, return an empty DataArray
         return sc.full_like(da[y['dim'], 0][x['dim'], 0], value=np.nan, dtype=float)
 
 
+class _RectangleReducer:
+    """
+    Reduce the data inside a rectangle using a summed-area table, i.e. cumulative sums
+    over the two image dimensions for every bin of the remaining dimension. The sum
+    over any rectangle is then obtained from four lookups per bin, independently of the
+    size of the rectangle. The table is shared by all the rectangles of an inspector.
+    It is built lazily on the first request, and re-built when the version of the
+    input node changes (see :attr:`Node.version`), so that data modified in place is
+    also detected.
+
+    If the table cannot be used (``max``/``min`` operations, unsupported dtype,
+    non-finite values, multi-dimensional or unsorted coordinates, or the table would
+    exceed the memory budget), the reduction falls back to
+    :func:`_slice_rectangular_region`.
+
+    Parameters
+    ----------
+    op:
+        The reduction operation.
+    max_bytes:
+        The memory budget for the table.
+    node:
+        The node that supplies the data to reduce.
+    """
+
+    def __init__(self, op: str, max_bytes: int, node: Node):
+        # Used by the Node to generate its name
+        self.__name__ = '_slice_rectangular_region'
+        self._op = op
+        self._max_bytes = max_bytes
+        self._node = node
+        self._source = None
+        self._dims = None
+        self._index = None
+
+    def _can_index(self, da: sc.DataArray, dims: list[str]) -> bool:
+        if not RangeSumIndex.supports(da, self._op):
+            return False
+        # The table excludes masked elements from the count of a 'nanmean', which is
+        # not the case when reducing the sliced data
+        if self._op == 'nanmean' and any(
+            set(m.dims) & set(dims) for m in da.masks.values()
+        ):
+            return False
+        for dim in dims:
+            coord = da.coords[dim]
+            if (
+                coord.dims != (dim,)
+                or len(coord) != da.sizes[dim] + 1
+                or coord.values.dtype.kind not in 'iuf'
+                or not np.all(np.diff(coord.values) > 0)
+            ):
+                return False
+        return RangeSumIndex.estimate_nbytes(da, dims, self._op) <= self._max_bytes
+
+    def _get_index(self, da: sc.DataArray, dims: list[str]) -> RangeSumIndex | None:
+        source = self._node.version
+        if source == self._source and dims == self._dims:
+            return self._index
+        self._source = source
+        self._dims = dims
+        self._index = None
+        if self._can_index(da, dims):
+            slab = da[dims[0], 0:1][dims[1], 0:1]
+            self._index = RangeSumIndex.build(
+                da,
+                dims=dims,
+                op=self._op,
+                template=_reduce_region(slab, tuple(dims), self._op),
+            )
+        return self._index
+
+    def __call__(self, da: sc.DataArray, rect: dict) -> sc.DataArray:
+        dims = [rect['x']['dim'], rect['y']['dim']]
+        index = self._get_index(da, dims)
+        if index is not None:
+            ranges = []
+            for xy in 'xy':
+                edges = da.coords[rect[xy]['dim']].values
+                values = rect[xy]['value'].values
+                # Same selection as label-based slicing with bin-edges: bins that
+                # overlap with [min, max), clipped to the data range.
+                start = np.searchsorted(edges, values.min(), side='right') - 1
+                stop = np.searchsorted(edges, values.max(), side='left')
+                ranges.append((int(max(start, 0)), int(min(stop, len(edges) - 1))))
+            if all(stop > start for start, stop in ranges):
+                return index.reduce(ranges)
+        return _slice_rectangular_region(da, rect, op=self._op)
+
+
+def _polygon_selection(
+    vx: np.ndarray,
+    vy: np.ndarray,
+    x: sc.Variable,
+    y: sc.Variable,
+    sizes: dict[str, int],
+) -> tuple[dict[str, slice], np.ndarray]:
+    """
+    Find the pixels whose centers are inside a polygon.
+    The search is restricted to the window of pixels inside the bounding box of the
+    polygon (computed from the 1d coordinates), and only the pixels inside the bounding
+    box are tested against the polygon itself. This makes the cost proportional to the
+    area covered by the polygon, rather than to the size of the whole image.
+
+    Returns the slices of the window along each dimension, and a boolean array (with
+    the shape of the window) that is ``True`` for pixels inside the polygon.
+    If no pixels are inside the bounding box, a window containing only the first pixel
+    (outside of the polygon) is returned.
+    """
+    bounds = {'x': (vx.min(), vx.max()), 'y': (vy.min(), vy.max())}
+    window = {dim: slice(0, size) for dim, size in sizes.items()}
+    for xy, coord in (('x', x), ('y', y)):
+        if coord.ndim == 1:
+            lo, hi = bounds[xy]
+            inds = np.flatnonzero((coord.values >= lo) & (coord.values <= hi))
+            window[coord.dim] = slice(inds[0], inds[-1] + 1) if len(inds) else None
+    if any(s is None for s in window.values()):
+        window = {dim: slice(0, 1) for dim in sizes}
+        return window, np.zeros((1,) * len(sizes), dtype=bool)
+
+    window_sizes = {dim: s.stop - s.start for dim, s in window.items()}
+    grid = {}
+    for xy, coord in (('x', x), ('y', y)):
+        for dim in coord.dims:
+            coord = coord[dim, window[dim]]
+        grid[xy] = sc.broadcast(coord, sizes=window_sizes).values
+    # Prefilter: only pixels inside the bounding box can be inside the polygon
+    candidates = (
+        (grid['x'] >= bounds['x'][0])
+        & (grid['x'] <= bounds['x'][1])
+        & (grid['y'] >= bounds['y'][0])
+        & (grid['y'] <= bounds['y'][1])
+    )
+    inside = np.zeros(candidates.shape, dtype=bool)
+    if candidates.any():
+        path = Path(np.column_stack([vx, vy]))
+        inside[candidates] = path.contains_points(
+            np.column_stack([grid['x'][candidates], grid['y'][candidates]])
+        )
+    return window, inside
+
+
 def _mask_outside_polygon(
     da: sc.DataArray,
     poly: dict,
-    points: np.ndarray,
+    x: sc.Variable,
+    y: sc.Variable,
     sizes: dict[str, int],
     op: str,
     non_nan: sc.Variable,
 ) -> sc.DataArray:
-    vx = poly['x']['value'].values
-    vy = poly['y']['value'].values
-    verts = np.column_stack([vx, vy])
-    path = Path(verts)
-    dims = sizes.keys()
-    inside = sc.array(
-        dims=dims,
-        values=path.contains_points(points).reshape(tuple(sizes.values())),
+    window, inside = _polygon_selection(
+        vx=poly['x']['value'].values,
+        vy=poly['y']['value'].values,
+        x=x,
+        y=y,
+        sizes=sizes,
     )
+    # Only the window around the polygon is reduced
+    for dim, s in window.items():
+        da = da[dim, s]
+        non_nan = non_nan[dim, s]
+    dims = sizes.keys()
+    inside = sc.array(dims=dims, values=inside)
     masked = da.assign_masks({str(da.masks.keys()): ~inside})
     # If the operation is a mean, there is currently a bug in the implementation
     # in scipp where doing a mean over a subset of the array's dimensions gives the
@@ -159,6 +419,7 @@ def inspector(
         'sum', 'mean', 'min', 'max', 'nansum', 'nanmean', 'nanmin', 'nanmax'
     ] = 'sum',
     orientation: Literal['horizontal', 'vertical'] = 'horizontal',
+    rectangle_index_size: int | None = None,
     title: str | None = None,
     vmax: sc.Variable | float | None = None,
     vmin: sc.Variable | float | None = None,
@@ -277,6 +538,16 @@ def inspector(
     orientation:
         Display the two panels side-by-side ('horizontal') or one below the other
         ('vertical').
+    rectangle_index_size:
+        If set, accelerate the ``sum``, ``mean``, ``nansum`` and ``nanmean``
+        operations in ``rectangle`` mode with a summed-area table (cumulative sums
+        over the two image dimensions, for every bin of ``dim``), using at most
+        ``rectangle_index_size`` bytes. The table is built on the first rectangle
+        query, after which the cost of a query is independent of the size of the
+        rectangle. Other operations, or tables that would exceed the budget, fall
+        back to reducing the data inside the rectangle.
+
+        .. versionadded:: 26.11.0
     title:
         The figure title.
     vmax:
@@ -405,12 +676,22 @@ def inspector(
                 destination=f1d,
                 tooltip="Activate inspector tool",
                 continuous_update=continuous_update,
+                batched=True,
+                batch_func=_gather_xy,
             )
         case 'rectangle':
             tool = RectangleTool(
                 figure=f2d,
                 input_node=bin_edges_node,
-                func=partial(_slice_rectangular_region, op=operation),
+                func=(
+                    partial(_slice_rectangular_region, op=operation)
+                    if rectangle_index_size is None
+                    else _RectangleReducer(
+                        op=operation,
+                        max_bytes=rectangle_index_size,
+                        node=bin_edges_node,
+                    )
+                ),
                 destination=f1d,
                 tooltip="Activate rectangle inspector tool",
                 continuous_update=continuous_update,
@@ -422,16 +703,14 @@ def inspector(
             x = da.coords[xdim]
             y = da.coords[ydim]
             sizes = {**x.sizes, **y.sizes}
-            xx = sc.broadcast(x, sizes=sizes)
-            yy = sc.broadcast(y, sizes=sizes)
-            points = np.column_stack([xx.values.ravel(), yy.values.ravel()])
             non_nan = ~sc.isnan(da.data)
             tool = PolygonTool(
                 figure=f2d,
                 input_node=bin_centers_node,
                 func=partial(
                     _mask_outside_polygon,
-                    points=points,
+                    x=x,
+                    y=y,
                     sizes=sizes,
                     op=operation,
                     non_nan=non_nan,
@@ -8,6 +8,8 @@ import scipp as sc
 
 from ..core.typing import FigureLike, PlottableMulti
 from ..graphics import imagefigure, linefigure
+from ._binned import histogram_binned_nodes
+from ._downsample import downsample_nodes
 from .common import (
     categorize_args,
     input_to_nodes,
@@ -20,25 +22,29 @@ def plot(
     obj: PlottableMulti,
     *,
     aspect: Literal['auto', 'equal'] | None = None,
-    autoscale: bool = True,
+    autoscale: bool | Literal['percentile'] = True,
     cbar: bool = True,
     clabel: str | None = None,
     cmap: str = 'viridis',
     cmax: sc.Variable | float | None = None,
     cmin: sc.Variable | float | None = None,
     coords: list[str] | None = None,
+    downsample: Literal['mean', 'sum', 'max'] = 'mean',
     errorbars: Literal['band', 'bar', True, False] = True,
     figsize: tuple[float, float] | None = None,
     grid: bool = False,
     ignore_size: bool = False,
     legend: bool | tuple[float, float] = True,
+    lod: bool | int = False,
     logc: bool | None = None,
     logx: bool | None = None,
     logy: bool | None = None,
     mask_cmap: str = 'gray',
     mask_color: str | None = None,
+    max_display_size: int | None = None,
     nan_color: str | None = None,
     norm: Literal['linear', 'log'] | None = None,
+    pyramid: Literal['mean', 'max', 'sum'] | bool | None = None,
     scale: dict[str, str] | None = None,
     title: str | None = None,
     vmax: sc.Variable | float | None = None,
@@ -53,6 +59,14 @@ def plot(
 ) -> FigureLike:
     """Plot a Scipp object.
 
+    Binned data is histogrammed for display. When zooming or panning, the events
+    in the visible range are histogrammed again at the resolution of the figure
+    (for images, this requires the histogram to have regularly spaced bins, which
+    is the case when histogramming along event coordinates).
+
+    .. versionchanged:: 26.11.0
+       Added support for binned data.
+
     Parameters
     ----------
     obj:
@@ -60,7 +74,13 @@ def plot(
     aspect:
         Aspect ratio for the axes.
     autoscale:
-        Automatically scale the axes/colormap on updates if ``True``.
+        Automatically scale the axes/colormap on updates if ``True``. Use
+        ``'percentile'`` to set the colormap range from the 1st and 99th
+        percentiles of the data (estimated from a random sample), instead of the
+        min and max values (2d plots only).
+
+        .. versionchanged:: 26.11.0
+           Added the ``'percentile'`` mode.
     cbar:
         Show colorbar in 2d plots if ``True``.
     clabel:
@@ -73,6 +93,14 @@ def plot(
         Lower limit for colorscale (2d plots only).
     coords:
         If supplied, use these coords instead of the input's dimension coordinates.
+        For binned data, these can also be event coordinates, in which case the
+        events are histogrammed along them.
+    downsample:
+        The operation used to combine blocks of pixels (or histogram bins) when the
+        data is reduced to fit in ``max_display_size``: ``'mean'``, ``'sum'`` or
+        ``'max'``.
+
+        .. versionadded:: 26.11.0
     errorbars:
         Whether to add error bars to the line. Optionally, this can be a string to
         specify the error bar style. Valid values are 'band' and 'bar'.
@@ -82,9 +110,17 @@ def plot(
         Show grid if ``True``.
     ignore_size:
         If ``True``, skip the check that prevents the rendering of very large data.
+        Prefer ``max_display_size``, which reduces the data instead.
     legend:
         Show legend if ``True``. If ``legend`` is a tuple, it should contain the
         ``(x, y)`` coordinates of the legend's anchor point in axes coordinates.
+    lod:
+        If ``True``, decimate lines (1d plots only) to the resolution of the figure,
+        keeping the minimum and maximum values in each pixel column. The decimation
+        is recomputed when zooming or panning. This lifts the size limit for 1d data.
+        An integer sets the number of columns instead of using the figure width.
+
+        .. versionadded:: 26.11.0
     logc:
         If ``True``, use logarithmic scale for colorscale (2d plots only).
     logx:
@@ -95,11 +131,28 @@ def plot(
         Colormap to use for masks in 2d plots.
     mask_color:
         Color of masks.
+    max_display_size:
+        If set, data with more elements is reduced for display, instead of raising an
+        error if it exceeds the default size limit. Images are reduced by combining
+        blocks of pixels (see ``downsample``), and lines are decimated, keeping the
+        minimum and maximum values of groups of points. The figure shows a badge with
+        the effective resolution.
+
+        .. versionadded:: 26.11.0
     nan_color:
         Color to use for NaN values in 2d plots.
     norm:
         Set to ``'log'`` for a logarithmic y-axis (1d plots) or logarithmic colorscale
         (2d plots). Legacy, prefer ``logy`` and ``logc`` instead.
+    pyramid:
+        If set, draw images (2d plots only) from a multi-resolution pyramid, showing
+        only the part that is visible at the resolution of the figure. The view is
+        updated when zooming or panning. This lifts the size limit for 2d data. The
+        value sets how blocks of pixels are combined: ``'mean'`` (or ``True``),
+        ``'max'`` or ``'sum'``. This only applies to images with regularly spaced
+        coordinates.
+
+        .. versionadded:: 26.11.0
     scale:
         Change axis scaling between ``log`` and ``linear``. For example, specify
         ``scale={'time': 'log'}`` if you want log-scale for the ``time`` dimension.
@@ -145,6 +198,7 @@ def plot(
         figsize=figsize,
         grid=grid,
         legend=legend,
+        lod=lod,
         logc=logc,
         logx=logx,
         logy=logy,
@@ -152,6 +206,7 @@ def plot(
         mask_color=mask_color,
         nan_color=nan_color,
         norm=norm,
+        pyramid=pyramid,
         scale=scale,
         title=title,
         vmax=vmax,
@@ -166,8 +221,21 @@ def plot(
     )
 
     nodes = input_to_nodes(
-        obj, processor=partial(preprocess, ignore_size=ignore_size, coords=coords)
+        obj,
+        processor=partial(
+            preprocess,
+            ignore_size=ignore_size or (max_display_size is not None),
+            coords=coords,
+            lod=bool(lod),
+            pyramid=bool(pyramid),
+            binned=True,
+        ),
     )
+    nodes, rebin = histogram_binned_nodes(nodes, dims=coords)
+    nodes, badge = downsample_nodes(nodes, max_display_size, op=downsample)
+    if badge:
+        for key in args:
+            args[key]['badge'] = badge
 
     ndims = set()
     for n in nodes:
@@ -179,10 +247,14 @@ def plot(
         )
     ndim = ndims.pop()
     if ndim == 1:
+        if rebin:
+            args['1d']['rebin'] = rebin
         return linefigure(*nodes, **args['1d'])
     elif ndim == 2:
         if len(nodes) > 1:
             raise_multiple_inputs_for_2d_plot_error(origin='plot')
+        if rebin:
+            args['2d']['rebin'] = rebin
         return imagefigure(*nodes, **args['2d'])
     else:
         raise ValueError(
@@ -0,0 +1,617 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+from __future__ import annotations
+
+from itertools import product
+
+import numpy as np
+import scipp as sc
+
+from ..core.utils import merge_masks
+
+_SUPPORTED_DTYPES = (
+    sc.DType.float64,
+    sc.DType.float32,
+    sc.DType.int64,
+    sc.DType.int32,
+)
+
+
+class CumulativeSumIndex:
+    """
+    Prefix-sum (cumulative sum) table along the leading ``ndim`` axes of an array.
+    The sum over any range of the leading axes is then obtained via
+    inclusion-exclusion of ``2**ndim`` lookups, independently of the range lengths.
+
+    Parameters
+    ----------
+    values:
+        The array to be indexed. The axes to be reduced must come first.
+    ndim:
+        The number of leading axes along which to compute the cumulative sums.
+    """
+
+    def __init__(self, values: np.ndarray, ndim: int):
+        self.ndim = ndim
+        pad = [(1, 0)] * ndim + [(0, 0)] * (values.ndim - ndim)
+        table = np.pad(values, pad)
+        for axis in range(ndim):
+            np.cumsum(table, axis=axis, out=table)
+        self._table = table
+
+    @property
+    def nbytes(self) -> int:
+        return self._table.nbytes
+
+    def range_sum(self, ranges: list[tuple[int, int]]) -> np.ndarray:
+        """
+        Sum over the half-open ranges ``[start, stop)`` along the leading axes.
+
+        Parameters
+        ----------
+        ranges:
+            One ``(start, stop)`` tuple for each of the leading axes.
+        """
+        out = None
+        for corner in product((1, 0), repeat=self.ndim):
+            index = tuple(r[c] for r, c in zip(ranges, corner, strict=True))
+            sign = 1 if (self.ndim - sum(corner)) % 2 == 0 else -1
+            term = self._table[index]
+            if out is None:
+                out = term.copy() if sign > 0 else -term
+            elif sign > 0:
+                out += term
+            else:
+                out -= term
+        return out
+
+
+def _range_lengths(ranges: list[tuple[int, int]]) -> int:
+    return int(np.prod([stop - start for start, stop in ranges]))
+
+
+class RangeSumIndex:
+    """
+    Cumulative sums of a data array along the sliced dimensions, which are used to
+    compute the ``sum``, ``mean``, ``nansum`` or ``nanmean`` over any range of the
+    sliced dims with a constant number of lookups.
+
+    Masks that depend on the reduced dims are applied before computing the sums,
+    which means that the results are the same as when calling ``da.sum(dims)`` on the
+    sliced data. The variances, if present, are indexed separately. For ``nanmean``,
+    the number of valid (not NaN, not masked) elements is also indexed.
+
+    Use :meth:`RangeSumIndex.build` to create the index, which returns ``None`` if the
+    data cannot be indexed.
+
+    Parameters
+    ----------
+    values:
+        The cumulative sums of the values.
+    variances:
+        The cumulative sums of the variances (optional).
+    counts:
+        The cumulative count of valid elements (optional, only for ``nanmean``).
+    op:
+        The reduction operation.
+    template:
+        A reduced data array whose metadata (coords, masks, unit, dtype) is used for
+        the outputs.
+    """
+
+    def __init__(
+        self,
+        values: CumulativeSumIndex,
+        variances: CumulativeSumIndex | None,
+        counts: CumulativeSumIndex | None,
+        op: str,
+        template: sc.DataArray,
+    ):
+        self._values = values
+        self._variances = variances
+        self._counts = counts
+        self._op = op
+        self._template = template
+
+    @staticmethod
+    def supports(data: sc.DataArray, op: str) -> bool:
+        """
+        Whether the index can be used for the given data and operation.
+        """
+        return (
+            op in ('sum', 'mean', 'nansum', 'nanmean')
+            and isinstance(data, sc.DataArray)
+            and data.bins is None
+            and data.dtype in _SUPPORTED_DTYPES
+        )
+
+    @staticmethod
+    def estimate_nbytes(data: sc.DataArray, dims: list[str], op: str) -> int:
+        """
+        Estimate the memory footprint of the index.
+        """
+        size = np.prod([data.sizes[dim] + 1 for dim in dims]) * np.prod(
+            [size for dim, size in data.sizes.items() if dim not in dims]
+        )
+        ntables = 1 + (data.variances is not None) + (op == 'nanmean')
+        return int(size * ntables * 8)
+
+    @classmethod
+    def build(
+        cls, data: sc.DataArray, dims: list[str], op: str, template: sc.DataArray
+    ) -> RangeSumIndex | None:
+        """
+        Build the index for the data array ``data`` along dimensions ``dims``.
+        Returns ``None`` if the data contains non-finite values that are not discarded
+        by the operation, as those would pollute all the cumulative sums.
+
+        Parameters
+        ----------
+        data:
+            The full (un-sliced) data.
+        dims:
+            The dimensions along which to compute the cumulative sums.
+        op:
+            The reduction operation.
+        template:
+            A reduced data array whose metadata is used for the outputs.
+        """
+        order = [*dims, *(dim for dim in data.dims if dim not in dims)]
+        var = data.data.transpose(order)
+        acc_dtype = np.int64 if var.dtype in ('int32', 'int64') else np.float64
+        values = var.values.astype(acc_dtype)
+        variances = (
+            var.variances.astype(np.float64) if var.variances is not None else None
+        )
+
+        valid = None
+        masks = {k: m for k, m in data.masks.items() if set(m.dims) & set(dims)}
+        if masks:
+            valid = (
+                ~sc.broadcast(merge_masks(masks), sizes=data.sizes)
+                .transpose(order)
+                .values
+            )
+        if 'nan' in op and acc_dtype == np.float64:
+            not_nan = ~np.isnan(values)
+            valid = not_nan if valid is None else valid & not_nan
+        if valid is not None:
+            values[~valid] = 0
+            if variances is not None:
+                variances[~valid] = 0
+        if acc_dtype == np.float64 and not np.isfinite(values).all():
+            return None
+
+        ndim = len(dims)
+        counts = None
+        if op == 'nanmean':
+            counts = CumulativeSumIndex(
+                np.ones(values.shape, dtype=np.int64)
+                if valid is None
+                else valid.astype(np.int64),
+                ndim,
+            )
+        return cls(
+            values=CumulativeSumIndex(values, ndim),
+            variances=(
+                CumulativeSumIndex(variances, ndim) if variances is not None else None
+            ),
+            counts=counts,
+            op=op,
+            template=template,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            table.nbytes
+            for table in (self._values, self._variances, self._counts)
+            if table is not None
+        )
+
+    def reduce(self, ranges: list[tuple[int, int]]) -> sc.DataArray:
+        """
+        Reduce the data over the half-open ranges ``[start, stop)`` along the indexed
+        dims.
+
+        Parameters
+        ----------
+        ranges:
+            One ``(start, stop)`` tuple for each of the indexed dims.
+        """
+        values = self._values.range_sum(ranges)
+        variances = (
+            self._variances.range_sum(ranges) if self._variances is not None else None
+        )
+        if 'mean' in self._op:
+            if self._op == 'nanmean':
+                count = self._counts.range_sum(ranges)
+            else:
+                count = _range_lengths(ranges)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = values / count
+                if variances is not None:
+                    variances = variances / count**2
+            if self._op == 'nanmean':
+                # Differences of cumulative sums are not exactly zero when all
+                # elements in the range are invalid: force NaN as in ``nanmean``.
+                empty = count == 0
+                values[empty] = np.nan
+                if variances is not None:
+                    variances[empty] = np.nan
+        out = self._template.copy(deep=False)
+        out.data = sc.array(
+            dims=self._template.dims,
+            values=values,
+            variances=variances,
+            unit=self._template.unit,
+            dtype=self._template.dtype,
+        )
+        return out
+
+
+class SparseTableIndex:
+    """
+    Sparse table of partial extrema along the leading ``ndim`` axes of an array.
+    For every combination of levels ``(k_0, k_1, ...)``, the table stores the
+    extremum over all blocks of size ``(2**k_0, 2**k_1, ...)``. The extremum over any
+    range of the leading axes is then obtained by combining ``2**ndim`` (possibly
+    overlapping) blocks, independently of the range lengths.
+
+    Parameters
+    ----------
+    values:
+        The array to be indexed. The axes to be reduced must come first.
+    ndim:
+        The number of leading axes along which to build the table.
+    ufunc:
+        The binary function used to combine blocks (e.g. ``np.maximum``).
+    """
+
+    def __init__(self, values: np.ndarray, ndim: int, ufunc: np.ufunc):
+        self.ndim = ndim
+        self._ufunc = ufunc
+        tables = {(): values}
+        for axis in range(ndim):
+            new = {}
+            for levels, table in tables.items():
+                level = 0
+                current = table
+                new[(*levels, level)] = current
+                while 2 ** (level + 1) <= table.shape[axis]:
+                    half = 2**level
+                    n = current.shape[axis] - half
+                    current = ufunc(
+                        np.take(current, range(n), axis=axis),
+                        np.take(current, range(half, half + n), axis=axis),
+                    )
+                    level += 1
+                    new[(*levels, level)] = current
+            tables = new
+        self._tables = tables
+
+    @staticmethod
+    def estimate_size(shape: tuple[int, ...], ndim: int) -> int:
+        """
+        The number of elements stored in a table built from an array of the given
+        shape.
+        """
+        size = int(np.prod(shape[ndim:]))
+        for n in shape[:ndim]:
+            size *= sum(n - 2**k + 1 for k in range(n.bit_length()))
+        return size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(table.nbytes for table in self._tables.values())
+
+    def range_reduce(self, ranges: list[tuple[int, int]]) -> np.ndarray:
+        """
+        Extremum over the half-open ranges ``[start, stop)`` along the leading axes.
+
+        Parameters
+        ----------
+        ranges:
+            One ``(start, stop)`` tuple for each of the leading axes.
+        """
+        levels = tuple((stop - start).bit_length() - 1 for start, stop in ranges)
+        table = self._tables[levels]
+        starts = [
+            {start, stop - 2**k}
+            for (start, stop), k in zip(ranges, levels, strict=True)
+        ]
+        out = None
+        for index in product(*starts):
+            term = table[index]
+            out = term.copy() if out is None else self._ufunc(out, term, out=out)
+        return out
+
+
+class RangeExtremumIndex:
+    """
+    Sparse tables of a data array along the sliced dimensions, which are used to
+    compute the ``max``, ``min``, ``nanmax`` or ``nanmin`` over any range of the
+    sliced dims with a constant number of lookups.
+
+    Masked elements (for masks that depend on the reduced dims) and, for the
+    ``nan`` operations, NaN elements are replaced by the lowest (for ``max``) or
+    highest (for ``min``) value of the dtype, as is done by Scipp. Data with variances
+    is not supported.
+
+    Use :meth:`RangeExtremumIndex.build` to create the index.
+
+    Parameters
+    ----------
+    table:
+        The sparse table of the values.
+    template:
+        A reduced data array whose metadata (coords, masks, unit, dtype) is used for
+        the outputs.
+    """
+
+    def __init__(self, table: SparseTableIndex, template: sc.DataArray):
+        self._table = table
+        self._template = template
+
+    @staticmethod
+    def supports(data: sc.DataArray, op: str) -> bool:
+        """
+        Whether the index can be used for the given data and operation.
+        """
+        return (
+            op in ('max', 'min', 'nanmax', 'nanmin')
+            and isinstance(data, sc.DataArray)
+            and data.bins is None
+            and data.dtype in _SUPPORTED_DTYPES
+            and data.variances is None
+        )
+
+    @staticmethod
+    def estimate_nbytes(data: sc.DataArray, dims: list[str], op: str) -> int:
+        """
+        Estimate the memory footprint of the index.
+        """
+        order = [*dims, *(dim for dim in data.dims if dim not in dims)]
+        shape = tuple(data.sizes[dim] for dim in order)
+        itemsize = np.dtype(str(data.dtype)).itemsize
+        return SparseTableIndex.estimate_size(shape, len(dims)) * itemsize
+
+    @classmethod
+    def build(
+        cls, data: sc.DataArray, dims: list[str], op: str, template: sc.DataArray
+    ) -> RangeExtremumIndex:
+        """
+        Build the index for the data array ``data`` along dimensions ``dims``.
+
+        Parameters
+        ----------
+        data:
+            The full (un-sliced) data.
+        dims:
+            The dimensions along which to build the sparse tables.
+        op:
+            The reduction operation.
+        template:
+            A reduced data array whose metadata is used for the outputs.
+        """
+        order = [*dims, *(dim for dim in data.dims if dim not in dims)]
+        values = data.data.transpose(order).values.copy()
+        info = np.finfo if values.dtype.kind == 'f' else np.iinfo
+        fill = info(values.dtype).min if 'max' in op else info(values.dtype).max
+
+        invalid = None
+        masks = {k: m for k, m in data.masks.items() if set(m.dims) & set(dims)}
+        if masks:
+            invalid = (
+                sc.broadcast(merge_masks(masks), sizes=data.sizes)
+                .transpose(order)
+                .values
+            )
+        if 'nan' in op and values.dtype.kind == 'f':
+            nans = np.isnan(values)
+            invalid = nans if invalid is None else invalid | nans
+        if invalid is not None:
+            values[invalid] = fill
+        ufunc = np.maximum if 'max' in op else np.minimum
+        return cls(
+            table=SparseTableIndex(values, len(dims), ufunc=ufunc), template=template
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self._table.nbytes
+
+    def reduce(self, ranges: list[tuple[int, int]]) -> sc.DataArray:
+        """
+        Reduce the data over the half-open ranges ``[start, stop)`` along the indexed
+        dims.
+
+        Parameters
+        ----------
+        ranges:
+            One ``(start, stop)`` tuple for each of the indexed dims.
+        """
+        out = self._template.copy(deep=False)
+        out.data = sc.array(
+            dims=self._template.dims,
+            values=self._table.range_reduce(ranges),
+            unit=self._template.unit,
+            dtype=self._template.dtype,
+        )
+        return out
+
+
+def _select(data: sc.DataArray, dims: list[str], ranges: list[tuple[int, int]]):
+    for dim, (start, stop) in zip(dims, ranges, strict=True):
+        data = data[dim, start:stop]
+    return data
+
+
+class RunningRangeSum:
+    """
+    Running ``sum``, ``mean``, ``nansum`` or ``nanmean`` over ranges of the sliced
+    dimensions. When the range along a single dimension changes by a few bins
+    (typically when dragging one handle of a range slider), the previous sum is
+    updated by adding and subtracting the sums over the slabs that entered and left
+    the range, instead of reducing the whole range again.
+
+    To bound the accumulation of floating-point errors, a full reduction is performed
+    every ``refresh_interval`` incremental updates. A full reduction is also performed
+    when the data changes, when more than one range changes at once, when the change
+    is larger than half of the new range, or when non-finite values are involved.
+
+    Parameters
+    ----------
+    dims:
+        The dimensions to be reduced.
+    op:
+        The reduction operation.
+    refresh_interval:
+        The maximum number of incremental updates between two full reductions.
+    """
+
+    def __init__(self, dims: list[str], op: str, refresh_interval: int = 32):
+        self._dims = list(dims)
+        self._op = op
+        self._refresh_interval = refresh_interval
+        self._source = None
+        self._ranges = None
+        self._template = None
+        self._values = None
+        self._variances = None
+        self._counts = None
+        self._updates = 0
+
+    @staticmethod
+    def supports(data: sc.DataArray, op: str) -> bool:
+        """
+        Whether running sums can be used for the given data and operation.
+        """
+        return RangeSumIndex.supports(data, op)
+
+    def _slab_sums(
+        self, slab: sc.DataArray
+    ) -> tuple[sc.DataArray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+        total = slab.nansum(self._dims) if 'nan' in self._op else slab.sum(self._dims)
+        values = total.values.astype(
+            np.int64 if total.dtype in ('int32', 'int64') else np.float64
+        )
+        variances = (
+            total.variances.astype(np.float64) if total.variances is not None else None
+        )
+        counts = None
+        if self._op == 'nanmean':
+            counts = (~sc.isnan(slab)).to(dtype='int64').sum(self._dims).values
+        return total, values, variances, counts
+
+    def _full(self, data: sc.DataArray, ranges: list[tuple[int, int]]) -> None:
+        total, values, variances, counts = self._slab_sums(
+            _select(data, self._dims, ranges)
+        )
+        self._template = total
+        self._values = values
+        self._variances = variances
+        self._counts = counts
+        self._updates = 0
+
+    def _try_update(self, data: sc.DataArray, ranges: list[tuple[int, int]]) -> bool:
+        """
+        Attempt to update the running sums from the previous ranges to the new
+        ``ranges``. Returns ``False`` if a full reduction is needed instead.
+        """
+        if (
+            data is not self._source
+            or self._ranges is None
+            or self._updates >= self._refresh_interval
+            or not np.isfinite(self._values).all()
+        ):
+            return False
+        changed = [
+            i
+            for i, (old, new) in enumerate(zip(self._ranges, ranges, strict=True))
+            if old != new
+        ]
+        if len(changed) != 1:
+            return not changed
+        i = changed[0]
+        (old_start, old_stop), (new_start, new_stop) = self._ranges[i], ranges[i]
+        if new_start >= old_stop or new_stop <= old_start:
+            return False
+        # Slabs that entered (sign=1) or left (sign=-1) the range
+        slabs = []
+        if new_start < old_start:
+            slabs.append(((new_start, old_start), 1))
+        elif new_start > old_start:
+            slabs.append(((old_start, new_start), -1))
+        if new_stop > old_stop:
+            slabs.append(((old_stop, new_stop), 1))
+        elif new_stop < old_stop:
+            slabs.append(((new_stop, old_stop), -1))
+        if 2 * sum(stop - start for (start, stop), _ in slabs) > new_stop - new_start:
+            return False
+
+        updates = []
+        for slab_range, sign in slabs:
+            slab_ranges = list(ranges)
+            slab_ranges[i] = slab_range
+            _, values, variances, counts = self._slab_sums(
+                _select(data, self._dims, slab_ranges)
+            )
+            if not np.isfinite(values).all():
+                return False
+            updates.append((sign, values, variances, counts))
+        for sign, values, variances, counts in updates:
+            self._values += sign * values
+            if variances is not None:
+                self._variances += sign * variances
+            if counts is not None:
+                self._counts += sign * counts
+        self._updates += 1
+        return True
+
+    def reduce(self, data: sc.DataArray, ranges: list[tuple[int, int]]) -> sc.DataArray:
+        """
+        Reduce the data over the half-open ranges ``[start, stop)`` along the reduced
+        dims.
+
+        Parameters
+        ----------
+        data:
+            The full (un-sliced) data.
+        ranges:
+            One ``(start, stop)`` tuple for each of the reduced dims.
+        """
+        if not self._try_update(data, ranges):
+            self._full(data, ranges)
+        self._source = data
+        self._ranges = list(ranges)
+
+        values = self._values
+        variances = self._variances
+        if 'mean' in self._op:
+            if self._op == 'nanmean':
+                count = self._counts
+                # Running sums over ranges with no valid elements may not be exactly
+                # zero: force NaN as in ``nanmean``.
+                values = np.where(count == 0, np.nan, values)
+                if variances is not None:
+                    variances = np.where(count == 0, np.nan, variances)
+            else:
+                count = _range_lengths(ranges)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = values / count
+                if variances is not None:
+                    variances = variances / count**2
+        dtype = self._template.dtype
+        if 'mean' in self._op and dtype in ('int32', 'int64'):
+            dtype = sc.DType.float64
+        out = self._template.copy(deep=False)
+        out.data = sc.array(
+            dims=self._template.dims,
+            values=values,
+            variances=variances,
+            unit=self._template.unit,
+            dtype=dtype,
+        )
+        return out
@@ -9,6 +9,7 @@ import scipp as sc
 
 from ..core.typing import FigureLike, PlottableMulti
 from ..graphics import scatterfigure
+from ._downsample import downsample_nodes
 from .common import check_not_binned, check_size, from_compatible_lib, input_to_nodes
 
 
@@ -62,6 +63,7 @@ def scatter(
     logx: bool | None = None,
     logy: bool | None = None,
     mask_color: str = 'black',
+    max_display_size: int | None = None,
     nan_color: str | None = None,
     norm: Literal['linear', 'log'] | None = None,
     scale: dict[str, str] | None = None,
@@ -126,6 +128,12 @@ def scatter(
         If ``True``, use logarithmic scale for y-axis.
     mask_color:
         Color of markers for masked data.
+    max_display_size:
+        If set, inputs with more points are decimated for display (keeping every n-th
+        point), instead of raising an error if they exceed the default size limit.
+        The figure shows a badge with the number of displayed points.
+
+        .. versionadded:: 26.11.0
     nan_color:
         Color to use for NaN values in color mapping (only applicable if ``cbar`` is
         ``True``).
@@ -162,14 +170,21 @@ def scatter(
     nodes = input_to_nodes(
         obj,
         processor=partial(
-            _preprocess_scatter, x=x, y=y, pos=pos, size=size, ignore_size=ignore_size
+            _preprocess_scatter,
+            x=x,
+            y=y,
+            pos=pos,
+            size=size,
+            ignore_size=ignore_size or (max_display_size is not None),
         ),
     )
+    nodes, badge = downsample_nodes(nodes, max_display_size, points=True)
 
     return scatterfigure(
         *nodes,
         aspect=aspect,
         autoscale=autoscale,
+        badge=badge,
         cbar=cbar,
         clabel=clabel,
         cmap=cmap,
@@ -1,16 +1,25 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from functools import partial
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import scipp as sc
 
 from ..core import Node, widget_node
+from ..core.cache import NodeCache, freeze
 from ..core.typing import FigureLike, PlottableMulti
 from ..graphics import imagefigure, linefigure
 from ..widgets import CombinedSliceWidget, RangeSliceWidget, SliceWidget, slice_dims
+from ..widgets.slicing import _slice_dims
+from ._binned import histogram_binned_nodes
+from ._downsample import downsample_nodes
+from ._range_index import RangeExtremumIndex, RangeSumIndex, RunningRangeSum
 from .common import (
     categorize_args,
     input_to_nodes,
@@ -32,6 +41,10 @@ def _maybe_reduce_dim(da, dims, op):
     if not to_be_reduced:
         return da
 
+    if da.is_binned:
+        # Only the sum is supported for binned data: the events are combined
+        return da.bins.concat(sorted(to_be_reduced))
+
     if 'mean' not in op:
         return getattr(da, op)(to_be_reduced)
 
@@ -49,6 +62,273 @@ def _maybe_reduce_dim(da, dims, op):
     return numerator / denominator
 
 
+def _slices_to_ranges(
+    slices: dict[str, int | tuple[int, int]], dims: list[str]
+) -> list[tuple[int, int]] | None:
+    """
+    Convert the slider values to half-open ranges along ``dims``. Returns ``None`` if
+    any of the slices is not a range spanning more than one element (in which case
+    the dimension would be squeezed instead of reduced).
+    """
+    ranges = []
+    for dim in dims:
+        sl = slices[dim]
+        if not isinstance(sl, tuple) or sl[1] <= sl[0]:
+            return None
+        ranges.append((sl[0], sl[1] + 1))
+    return ranges
+
+
+class _RangeReducer:
+    """
+    Reduce the sliced dimensions, using either an index that is precomputed along the
+    sliced dims of the full data, or running sums that are updated incrementally when
+    a range slider moves by a few bins. Both make range reductions (almost)
+    independent of the range lengths.
+    The index is built lazily on the first range request, and re-built if the input
+    data changes.
+
+    If neither can be used (single slices, unsupported operation or dtype, non-finite
+    values, or the index would exceed the memory budget), the reduction falls back to
+    reducing the sliced data with :func:`_maybe_reduce_dim`.
+
+    Parameters
+    ----------
+    dims:
+        The dimensions to be reduced.
+    op:
+        The reduction operation.
+    max_bytes:
+        The memory budget for the index. If ``None``, no index is built.
+    incremental:
+        Update running sums incrementally when the ranges change by a few bins.
+    """
+
+    def __init__(
+        self,
+        dims: list[str],
+        op: str,
+        max_bytes: int | None = None,
+        incremental: bool = False,
+    ):
+        # Used by the Node to generate its name
+        self.__name__ = '_maybe_reduce_dim'
+        self._dims = list(dims)
+        self._op = op
+        self._max_bytes = max_bytes
+        self._source = None
+        self._index = None
+        self._running = RunningRangeSum(dims=self._dims, op=op) if incremental else None
+
+    def _get_index(
+        self, data: sc.DataArray
+    ) -> RangeSumIndex | RangeExtremumIndex | None:
+        if self._max_bytes is None:
+            return None
+        if data is self._source:
+            return self._index
+        self._source = data
+        self._index = None
+        index_type = next(
+            (
+                cls
+                for cls in (RangeSumIndex, RangeExtremumIndex)
+                if cls.supports(data, self._op)
+            ),
+            None,
+        )
+        if (
+            index_type is not None
+            and all(data.sizes[dim] > 1 for dim in self._dims)
+            and index_type.estimate_nbytes(data, self._dims, self._op)
+            <= self._max_bytes
+        ):
+            slab = data
+            for dim in self._dims:
+                slab = slab[dim, 0:2]
+            template = _maybe_reduce_dim(slab, self._dims, self._op)
+            self._index = index_type.build(
+                data, dims=self._dims, op=self._op, template=template
+            )
+        return self._index
+
+    def __call__(
+        self,
+        da: sc.DataArray,
+        data: sc.DataArray,
+        slices: dict[str, int | tuple[int, int]],
+    ) -> sc.DataArray:
+        ranges = _slices_to_ranges(slices, self._dims)
+        if ranges is not None:
+            index = self._get_index(data)
+            if index is not None:
+                return index.reduce(ranges)
+            if self._running is not None and RunningRangeSum.supports(data, self._op):
+                return self._running.reduce(data, ranges)
+        return _maybe_reduce_dim(da, self._dims, self._op)
+
+
+def _slice_and_reduce(
+    data: sc.DataArray,
+    slices: dict[str, int | tuple[int, int]],
+    *,
+    slice_func: Callable,
+    dims: list[str],
+    op: str,
+    reducer: _RangeReducer | None = None,
+) -> sc.DataArray:
+    da = slice_func(data, slices)
+    if reducer is None:
+        return _maybe_reduce_dim(da, dims, op)
+    return reducer(da=da, data=data, slices=slices)
+
+
+_prefetch_executor = None
+
+
+def _default_prefetch_executor() -> Executor:
+    """
+    Return the executor shared by the prefetchers of all slicers. It has a single
+    worker thread, which lives as long as the process, so that creating figures does
+    not start new threads. It is separate from the executor of the background
+    evaluations, which may wait for the results of the prefetcher.
+    """
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='plopp-prefetch'
+        )
+    return _prefetch_executor
+
+
+class _Prefetcher:
+    """
+    Compute the reduced slices for the next slider positions ahead of time, in a
+    background thread, and store them in a cache.
+
+    The next positions are predicted from the last slider move: if a single slider
+    moved, it is assumed to keep moving in the same direction with the same step
+    (which is the case when the play button is used, or when dragging a slider).
+    Predictions that are no longer relevant after a move are cancelled if they have
+    not started yet.
+
+    All computations (including the ones requested by the figure when a position is
+    not in the cache) run in the thread of the ``executor``, one at a time, so that
+    stateful reductions (e.g. with running sums) are never used concurrently. If a
+    requested position is being prefetched, the result of that computation is used.
+
+    Parameters
+    ----------
+    compute:
+        The function computing the reduced slice, from the full data and the slider
+        values.
+    sizes:
+        The sizes of the sliced dims, to limit the predicted positions.
+    nframes:
+        The number of positions to compute ahead.
+    max_bytes:
+        The memory budget of the cache.
+    executor:
+        The executor running the computations. It should have a single worker.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[Any, dict], Any],
+        sizes: dict[str, int],
+        nframes: int,
+        max_bytes: int,
+        executor: Executor,
+    ):
+        # Used by the Node to generate its name
+        self.__name__ = 'prefetch'
+        self._compute = compute
+        self._sizes = sizes
+        self._nframes = nframes
+        self._executor = executor
+        self._cache = NodeCache(max_bytes=max_bytes)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._source = None
+        self._previous = None
+
+    @property
+    def cache(self) -> NodeCache:
+        return self._cache
+
+    def _predict(self, slices: dict) -> list[dict]:
+        if self._previous is None:
+            return []
+        changed = [dim for dim in slices if slices[dim] != self._previous.get(dim)]
+        if len(changed) != 1:
+            return []
+        dim = changed[0]
+        current = np.asarray(slices[dim])
+        step = current - np.asarray(self._previous[dim])
+        out = []
+        for k in range(1, self._nframes + 1):
+            nxt = current + k * step
+            if np.any(nxt < 0) or np.any(nxt >= self._sizes[dim]):
+                break
+            if nxt.ndim == 0:
+                value = int(nxt)
+            elif nxt[0] <= nxt[1]:
+                value = (int(nxt[0]), int(nxt[1]))
+            else:
+                break
+            out.append({**slices, dim: value})
+        return out
+
+    def _store(self, data: Any, key: Any, slices: dict) -> Any:
+        value = self._compute(data, slices)
+        with self._lock:
+            if data is self._source:
+                self._cache.put(key, value)
+        return value
+
+    def _schedule(self, data: Any, slices: dict) -> None:
+        predicted = {freeze(s): s for s in self._predict(slices)}
+        for key in list(self._pending):
+            if (key not in predicted) or self._pending[key].done():
+                self._pending.pop(key).cancel()
+        for key, s in predicted.items():
+            with self._lock:
+                cached = key in self._cache
+            if not (cached or key in self._pending):
+                self._pending[key] = self._executor.submit(self._store, data, key, s)
+
+    def wait(self) -> None:
+        """
+        Wait until all the positions that are being prefetched are computed.
+        """
+        wait_futures(list(self._pending.values()))
+
+    def __call__(self, data: Any, slices: dict) -> Any:
+        if data is not self._source:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            with self._lock:
+                self._cache.clear()
+                self._source = data
+            self._previous = None
+        key = freeze(slices)
+        with self._lock:
+            found, value = self._cache.get(key)
+        if not found:
+            future = self._pending.pop(key, None)
+            if (future is None) or future.cancelled():
+                # Drop the predictions that have not started: the sliders did not
+                # move as expected.
+                for pending in self._pending.values():
+                    pending.cancel()
+                future = self._executor.submit(self._store, data, key, slices)
+            value = future.result()
+        self._schedule(data, slices)
+        self._previous = dict(slices)
+        return value
+
+
 class DimensionSlicer:
     """
     Class that slices out dimensions from the input data and exposes the result in
@@ -61,7 +341,8 @@ class DimensionSlicer:
     Parameters
     ----------
     obj:
-        The input data.
+        The input data. Inputs that are :class:`plopp.LazyDataArray` objects are not
+        loaded: only the slices selected by the sliders are read.
     enable_player:
         If ``True``, add a play button to the sliders to automatically step through
         the slices.
@@ -75,6 +356,35 @@ class DimensionSlicer:
     operation:
         The reduction operation to be applied to the sliced dimensions. This is ``sum``
         by default.
+    cache_size:
+        If set, keep a cache of the most recently reduced slices, using at most
+        ``cache_size`` bytes per input. Revisiting a slider position that is still in
+        the cache then avoids re-computing the reduction.
+    range_index_size:
+        If set, precompute an index along the sliced dimensions (using at most
+        ``range_index_size`` bytes per input) to accelerate range reductions. For the
+        ``sum``, ``mean``, ``nansum`` and ``nanmean`` operations, this is a table of
+        cumulative sums, which makes the cost of a range reduction independent of the
+        length of the range. For the ``max``, ``min``, ``nanmax`` and ``nanmin``
+        operations, this is a sparse table of partial extrema over blocks of
+        power-of-two sizes, so that any range is covered by a constant number of
+        blocks. Data with variances (for ``max`` and ``min``), or indices that would
+        exceed the budget, fall back to reducing the sliced data. So do lazy inputs,
+        as building the index would require reading all the values.
+    incremental:
+        If ``True``, the ``sum``, ``mean``, ``nansum`` and ``nanmean`` reductions over
+        ranges are updated incrementally when a range changes by a few bins (e.g.
+        when dragging one handle of a range slider), by adding and subtracting only
+        the slabs that entered and left the range. A full reduction is performed
+        periodically to limit the accumulation of floating-point errors.
+    prefetch:
+        If larger than zero, compute the reduced slices for this number of slider
+        positions ahead of time, in a background thread. The positions are predicted
+        from the direction and step of the last slider move, which makes playback
+        (with the play button) and dragging a slider smooth when some slices are slow
+        to compute. The results are kept in a cache using at most ``cache_size`` bytes
+        per input (256 MB if ``cache_size`` is not set). The data is then sliced by
+        the prefetchers, and ``slice_nodes`` is empty.
     """
 
     def __init__(
@@ -87,6 +397,10 @@ class DimensionSlicer:
         operation: Literal[
             'sum', 'mean', 'max', 'min', 'nansum', 'nanmean', 'nanmax', 'nanmin'
         ] = 'sum',
+        cache_size: int | None = None,
+        range_index_size: int | None = None,
+        incremental: bool = False,
+        prefetch: int = 0,
     ):
         if enable_player and mode != 'single':
             raise ValueError(
@@ -98,18 +412,19 @@ class DimensionSlicer:
         else:
             nodes = input_to_nodes(obj, processor=lambda x, name: x)
 
-        # Ensure all inputs have the same dims
-        dg = sc.DataGroup({str(i): node() for i, node in enumerate(nodes)})
-        dg_dims = set(dg.dims)
-        if not all(set(da.dims) == dg_dims for da in dg.values()):
+        # Ensure all inputs have the same dims. Note that only the dims and coords are
+        # needed here, so lazy inputs are not loaded.
+        data_arrays = [node() for node in nodes]
+        all_dims = data_arrays[0].dims
+        if not all(set(da.dims) == set(all_dims) for da in data_arrays):
             raise ValueError(
                 'Slicer plot: all inputs must have the same dimensions, but the '
-                f'following dimensions were found: {[da.dims for da in dg.values()]}'
+                f'following dimensions were found: {[da.dims for da in data_arrays]}'
             )
 
         self.keep = keep
         if self.keep is None:
-            self.keep = dg.dims[-min(dg.ndim - 1, 2) :]
+            self.keep = all_dims[-min(len(all_dims) - 1, 2) :]
         if isinstance(self.keep, str):
             self.keep = [self.keep]
 
@@ -117,16 +432,15 @@ class DimensionSlicer:
             raise ValueError(
                 'Slicer plot: the list of dims to be kept cannot be empty.'
             )
-        if not set(self.keep).issubset(dg_dims):
+        if not set(self.keep).issubset(all_dims):
             raise ValueError(
                 "Slicer plot: one or more of the requested dims to be kept "
-                f"{self.keep} were not found in the input's dimensions {dg.dims}."
+                f"{self.keep} were not found in the input's dimensions {all_dims}."
             )
 
-        other_dims = [dim for dim in dg.dims if dim not in self.keep]
-        data_arrays = list(dg.values())
+        other_dims = [dim for dim in all_dims if dim not in self.keep]
         # Ensure all dims in other_dims (dims to be sliced) have the same coordinates
-        if len(dg) > 1:
+        if len(data_arrays) > 1:
             for dim in other_dims:
                 template = data_arrays[0]
                 for da in data_arrays[1:]:
@@ -153,11 +467,66 @@ class DimensionSlicer:
             data_arrays[0], dims=other_dims, enable_player=enable_player
         )
         self.slider_node = widget_node(self.slider)
-        self.slice_nodes = [slice_dims(node, self.slider_node) for node in nodes]
-        self.reduce_nodes = [
-            Node(_maybe_reduce_dim, da=node, dims=other_dims, op=operation)
-            for node in self.slice_nodes
-        ]
+        if prefetch > 0:
+            # The prefetchers slice the data themselves, in a background thread. Slice
+            # nodes would be leaves of the graph, which are evaluated (and would read
+            # lazy data) on every slider move, so they are not created.
+            self.slice_nodes = []
+            sizes = {dim: data_arrays[0].sizes[dim] for dim in other_dims}
+            self.reduce_nodes = [
+                Node(
+                    _Prefetcher(
+                        partial(
+                            _slice_and_reduce,
+                            slice_func=_slice_dims,
+                            dims=other_dims,
+                            op=operation,
+                            reducer=None
+                            if range_index_size is None and not incremental
+                            else _RangeReducer(
+                                dims=other_dims,
+                                op=operation,
+                                max_bytes=range_index_size,
+                                incremental=incremental,
+                            ),
+                        ),
+                        sizes=sizes,
+                        nframes=prefetch,
+                        max_bytes=256 * 1024**2 if cache_size is None else cache_size,
+                        executor=_default_prefetch_executor(),
+                    ),
+                    data=node,
+                    slices=self.slider_node,
+                )
+                for node in nodes
+            ]
+            # The prefetcher has its own cache
+            cache_size = None
+        else:
+            self.slice_nodes = [slice_dims(node, self.slider_node) for node in nodes]
+            if range_index_size is None and not incremental:
+                self.reduce_nodes = [
+                    Node(_maybe_reduce_dim, da=node, dims=other_dims, op=operation)
+                    for node in self.slice_nodes
+                ]
+            else:
+                self.reduce_nodes = [
+                    Node(
+                        _RangeReducer(
+                            dims=other_dims,
+                            op=operation,
+                            max_bytes=range_index_size,
+                            incremental=incremental,
+                        ),
+                        da=slice_node,
+                        data=node,
+                        slices=self.slider_node,
+                    )
+                    for node, slice_node in zip(nodes, self.slice_nodes, strict=True)
+                ]
+        if cache_size is not None:
+            for node in self.reduce_nodes:
+                node.enable_cache(max_bytes=cache_size)
 
     @property
     def output(self) -> list[Node] | Node:
@@ -195,6 +564,23 @@ class SlicerPlot:
     operation:
         The reduction operation to be applied to the sliced dimensions. This is ``sum``
         by default.
+    cache_size:
+        If set, keep a cache of the most recently reduced slices, using at most
+        ``cache_size`` bytes per input.
+    range_index_size:
+        If set, precompute an index along the sliced dimensions (using at most
+        ``range_index_size`` bytes per input) to accelerate range reductions.
+    incremental:
+        If ``True``, update range sums and means incrementally when a range changes
+        by a few bins.
+    prefetch:
+        If larger than zero, compute the reduced slices for this number of slider
+        positions ahead of time, in a background thread.
+    max_display_size:
+        If set, slices with more elements are reduced for display.
+    downsample:
+        The operation used to combine blocks of pixels when a slice is reduced to fit
+        in ``max_display_size``.
     **kwargs:
         The additional arguments are forwarded to the underlying 1D or 2D figures.
     """
@@ -210,11 +596,25 @@ class SlicerPlot:
         operation: Literal[
             'sum', 'mean', 'max', 'min', 'nansum', 'nanmean', 'nanmax', 'nanmin'
         ] = 'sum',
+        cache_size: int | None = None,
+        range_index_size: int | None = None,
+        incremental: bool = False,
+        prefetch: int = 0,
+        max_display_size: int | None = None,
+        downsample: Literal['mean', 'sum', 'max'] = 'mean',
         **kwargs,
     ):
         nodes = input_to_nodes(
-            obj, processor=partial(preprocess, ignore_size=True, coords=coords)
+            obj,
+            processor=partial(
+                preprocess, ignore_size=True, coords=coords, binned=True, lazy=True
+            ),
         )
+        if operation != 'sum' and any(node().is_binned for node in nodes):
+            raise ValueError(
+                f"Slicer plot: invalid operation '{operation}' for binned data. "
+                "Only 'sum' is supported."
+            )
 
         self.slicer = DimensionSlicer(
             nodes,
@@ -222,16 +622,33 @@ class SlicerPlot:
             enable_player=enable_player,
             mode=mode,
             operation=operation,
+            cache_size=cache_size,
+            range_index_size=range_index_size,
+            incremental=incremental,
+            prefetch=prefetch,
         )
 
         args = categorize_args(**kwargs)
+        output_nodes, rebin = histogram_binned_nodes(
+            self.slicer.reduce_nodes, dims=self.slicer.keep
+        )
+        output_nodes, badge = downsample_nodes(
+            output_nodes, max_display_size, op=downsample
+        )
+        if badge:
+            for key in args:
+                args[key]['badge'] = badge
 
         ndims = len(self.slicer.keep)
         if ndims == 1:
+            if rebin:
+                args['1d']['rebin'] = rebin
             make_figure = partial(linefigure, **args['1d'])
         elif ndims == 2:
-            if len(self.slicer.slice_nodes) > 1:
+            if len(self.slicer.reduce_nodes) > 1:
                 raise_multiple_inputs_for_2d_plot_error(origin='slicer')
+            if rebin:
+                args['2d']['rebin'] = rebin
             make_figure = partial(imagefigure, **args['2d'])
         else:
             raise ValueError(
@@ -239,7 +656,7 @@ class SlicerPlot:
                 f'but {ndims} were requested.'
             )
 
-        self.figure = make_figure(*self.slicer.reduce_nodes)
+        self.figure = make_figure(*output_nodes)
         require_interactive_figure(self.figure, 'slicer')
         self.figure.bottom_bar.add(self.slicer.slider)
 
@@ -250,27 +667,33 @@ def slicer(
     *,
     aspect: Literal['auto', 'equal'] | None = None,
     autoscale: bool = True,
+    cache_size: int | None = None,
     cbar: bool = True,
     clabel: str | None = None,
     cmap: str = 'viridis',
     cmax: sc.Variable | float | None = None,
     cmin: sc.Variable | float | None = None,
     coords: list[str] | None = None,
+    downsample: Literal['mean', 'sum', 'max'] = 'mean',
     enable_player: bool = False,
     errorbars: Literal['band', 'bar', True, False] = True,
     figsize: tuple[float, float] | None = None,
     grid: bool = False,
+    incremental: bool = False,
     legend: bool | tuple[float, float] = True,
     logc: bool | None = None,
     logx: bool | None = None,
     logy: bool | None = None,
     mask_cmap: str = 'gray',
     mask_color: str | None = None,
+    max_display_size: int | None = None,
     nan_color: str | None = None,
     norm: Literal['linear', 'log'] | None = None,
     operation: Literal[
         'sum', 'mean', 'max', 'min', 'nansum', 'nanmean', 'nanmax', 'nanmin'
     ] = 'sum',
+    prefetch: int = 0,
+    range_index_size: int | None = None,
     scale: dict[str, str] | None = None,
     mode: Literal['single', 'range', 'combined'] = 'combined',
     title: str | None = None,
@@ -288,6 +711,17 @@ def slicer(
     Plot a multi-dimensional object by slicing one or more of the dimensions.
     This will produce one slider per sliced dimension, below the figure.
 
+    Binned data is sliced along its outer dimensions and histogrammed for display
+    (only the ``'sum'`` operation is supported). When zooming or panning, the events
+    in the visible range are histogrammed again at the resolution of the figure.
+
+    Inputs can also be :class:`plopp.LazyDataArray` objects, backed for example by
+    an ``h5py.Dataset`` or a ``numpy.memmap``. Only the slab that is displayed is
+    then read from the source.
+
+    .. versionchanged:: 26.11.0
+       Added support for binned data and lazy data arrays.
+
     Parameters
     ----------
     obj:
@@ -300,6 +734,12 @@ def slicer(
         Aspect ratio for the axes.
     autoscale:
         Automatically scale the axes/colormap on updates if ``True``.
+    cache_size:
+        If set, keep a cache of the most recently reduced slices, using at most
+        ``cache_size`` bytes per input. Revisiting a slider position that is still in
+        the cache then avoids re-computing the reduction.
+
+        .. versionadded:: 26.11.0
     cbar:
         Show colorbar in 2d plots if ``True``.
     clabel:
@@ -312,6 +752,11 @@ def slicer(
         Lower limit for colorscale (2d plots only).
     coords:
         If supplied, use these coords instead of the input's dimension coordinates.
+    downsample:
+        The operation used to combine blocks of pixels when a slice is reduced to fit
+        in ``max_display_size``: ``'mean'``, ``'sum'`` or ``'max'``.
+
+        .. versionadded:: 26.11.0
     enable_player:
         If ``True``, add a play button to the sliders to automatically step through
         the slices.
@@ -322,6 +767,12 @@ def slicer(
         The width and height of the figure, in inches.
     grid:
         Show grid if ``True``.
+    incremental:
+        If ``True``, the ``sum``, ``mean``, ``nansum`` and ``nanmean`` reductions over
+        ranges are updated incrementally when a range slider moves by a few bins,
+        instead of reducing the whole range again.
+
+        .. versionadded:: 26.11.0
     legend:
         Show legend if ``True``. If ``legend`` is a tuple, it should contain the
         ``(x, y)`` coordinates of the legend's anchor point in axes coordinates.
@@ -335,6 +786,13 @@ def slicer(
         Colormap to use for masks in 2d plots.
     mask_color:
         Color of masks.
+    max_display_size:
+        If set, slices with more elements are reduced for display. Images are reduced
+        by combining blocks of pixels (see ``downsample``), and lines are decimated,
+        keeping the minimum and maximum values of groups of points. The figure shows a
+        badge with the effective resolution.
+
+        .. versionadded:: 26.11.0
     mode:
         The type of slider to use for slicing. Can be either ``'single'`` for sliders
         that select a single index along the sliced dimension, ``'range'`` for sliders
@@ -349,6 +807,20 @@ def slicer(
     operation:
         The reduction operation to be applied to the sliced dimensions. This is ``sum``
         by default.
+    prefetch:
+        If larger than zero, compute the reduced slices for this number of slider
+        positions ahead of time, in a background thread. The positions are predicted
+        from the direction and step of the last slider move, which makes playback
+        with ``enable_player=True`` smooth when the slices are slow to compute.
+
+        .. versionadded:: 26.11.0
+    range_index_size:
+        If set, precompute an index along the sliced dimensions (using at most
+        ``range_index_size`` bytes per input) to accelerate reductions over ranges of
+        the sliders. This makes the cost of a reduction independent of the length of
+        the selected range.
+
+        .. versionadded:: 26.11.0
     scale:
         Change axis scaling between ``log`` and ``linear``. For example, specify
         ``scale={'time': 'log'}`` if you want log-scale for the ``time`` dimension.
@@ -381,26 +853,32 @@ def slicer(
         keep=keep,
         aspect=aspect,
         autoscale=autoscale,
+        cache_size=cache_size,
         cbar=cbar,
         clabel=clabel,
         cmap=cmap,
         cmax=cmax,
         cmin=cmin,
         coords=coords,
+        downsample=downsample,
         enable_player=enable_player,
         errorbars=errorbars,
         figsize=figsize,
         grid=grid,
+        incremental=incremental,
         legend=legend,
         logc=logc,
         logx=logx,
         logy=logy,
         mask_color=mask_color,
         mask_cmap=mask_cmap,
+        max_display_size=max_display_size,
         mode=mode,
         nan_color=nan_color,
         norm=norm,
         operation=operation,
+        prefetch=prefetch,
+        range_index_size=range_index_size,
         scale=scale,
         title=title,
         vmax=vmax,
@@ -5,9 +5,11 @@ from typing import Literal
 
 import scipp as sc
 
+from ..core import Node
 from ..core.typing import FigureLike, Plottable
 from ..widgets import LineSaveTool
 from ._slicer import SlicerPlot
+from .common import check_not_binned, to_data_array
 
 
 def superplot(
@@ -26,6 +28,7 @@ def superplot(
     logy: bool | None = None,
     mask_color: str = 'black',
     norm: Literal['linear', 'log'] | None = None,
+    prefetch: int = 0,
     scale: dict[str, str] | None = None,
     title: str | None = None,
     vmax: sc.Variable | float | None = None,
@@ -79,6 +82,11 @@ def superplot(
         Color of masks in 1d plots.
     norm:
         Set to ``'log'`` for a logarithmic y-axis. Legacy, prefer ``logy`` instead.
+    prefetch:
+        If larger than zero, compute the slices for this number of slider positions
+        ahead of time, in a background thread, to make playback smooth.
+
+        .. versionadded:: 26.11.0
     scale:
         Change axis scaling between ``log`` and ``linear``. For example, specify
         ``scale={'time': 'log'}`` if you want log-scale for the ``time`` dimension.
@@ -110,6 +118,8 @@ def superplot(
         A :class:`widgets.Box` which will contain a :class:`graphics.FigLine`, slider
         widgets and a tool to save/delete lines.
     """
+    # The saved lines are taken from the sliced data, which must be dense
+    check_not_binned(to_data_array(obj() if isinstance(obj, Node) else obj))
     sp = SlicerPlot(
         obj,
         keep=keep,
@@ -126,6 +136,7 @@ def superplot(
         logy=logy,
         mask_color=mask_color,
         norm=norm,
+        prefetch=prefetch,
         scale=scale,
         title=title,
         vmax=vmax,
@@ -140,7 +151,7 @@ def superplot(
     )
     sp.figure.right_bar.add(
         LineSaveTool(
-            data_node=sp.slicer.slice_nodes[0],
+            data_node=sp.slicer.reduce_nodes[0],
             slider_node=sp.slicer.slider_node,
             fig=sp.figure,
         )
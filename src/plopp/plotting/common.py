@@ -1,16 +1,25 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import logging
+import sys
 import warnings
-from collections.abc import Callable, Iterable
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from itertools import chain
 from typing import Any, Literal
 
 import numpy as np
 import scipp as sc
 
 from ..core import Node
+from ..core.cache import CacheInfo, nbytes
+from ..core.lazy import LazyDataArray
 from ..core.typing import FigureLike, Plottable, PlottableMulti
 
+_logger = logging.getLogger(__name__)
+
 
 def require_interactive_figure(fig: FigureLike, func: str):
     """
@@ -23,24 +32,106 @@ def require_interactive_figure(fig: FigureLike, func: str):
         )
 
 
+def _imported_module(name: str) -> Any | None:
+    """
+    Return a module if it has already been imported, and ``None`` otherwise.
+    An object cannot be an instance of a class from a library that was never
+    imported, so there is no need to import it (which can be slow) to check.
+    """
+    return sys.modules.get(name)
+
+
 def is_pandas_series(obj: Any) -> bool:
     """
     Check if an object is a pandas series.
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        return False
-    return isinstance(obj, pd.Series)
+    pd = _imported_module('pandas')
+    return pd is not None and isinstance(obj, pd.Series)
+
+
+def _report_copy(what: str, reason: str) -> None:
+    # Converting common inputs (e.g. uint8 images) is expected: this is only logged at
+    # debug level, for users tracking down where the memory of a plot goes.
+    _logger.debug(
+        "%s %s, which requires an additional copy of the data before it can be "
+        "plotted.",
+        what,
+        reason,
+    )
+
+
+# Numpy dtypes that scipp does not store, and the dtypes they are converted to
+_DTYPE_CONVERSIONS = {
+    np.dtype('float16'): np.dtype('float32'),
+    np.dtype('int8'): np.dtype('int32'),
+    np.dtype('int16'): np.dtype('int32'),
+    np.dtype('uint8'): np.dtype('int32'),
+    np.dtype('uint16'): np.dtype('int32'),
+    np.dtype('uint32'): np.dtype('int64'),
+}
+
+
+def _as_supported_array(values: np.ndarray) -> np.ndarray:
+    """
+    Return an array that scipp can store. The input is returned as is if its dtype is
+    supported, so that the only copy is the one into the buffer of the scipp
+    variable. Otherwise, it is converted and the copy is logged at debug level.
+    """
+    dtype = values.dtype
+    if not dtype.isnative:
+        dtype = dtype.newbyteorder('=')
+    dtype = _DTYPE_CONVERSIONS.get(dtype, dtype)
+    if dtype == values.dtype:
+        return values
+    _report_copy(
+        f"Input array with dtype {values.dtype}", f"was converted to dtype {dtype}"
+    )
+    return values.astype(dtype)
+
+
+def _check_pandas_columns(obj: Any) -> None:
+    columns = obj.items() if hasattr(obj, 'columns') else [(obj.name, obj)]
+    for name, column in columns:
+        # Extension dtypes (nullable integers, categoricals...) are not backed by a
+        # numpy array
+        if not isinstance(column.dtype, np.dtype):
+            _report_copy(
+                f"Pandas column '{name}'",
+                f"has extension dtype {column.dtype} which is converted to numpy",
+            )
+
+
+def _check_xarray_variables(obj: Any) -> None:
+    if hasattr(obj, 'data_vars'):
+        items = [(name, da.variable) for name, da in obj.data_vars.items()]
+    else:
+        items = [(obj.name, obj.variable)]
+    for name, var in items:
+        # Data that is not in memory (e.g. dask arrays) is loaded by the conversion
+        if not isinstance(var.data, np.ndarray):
+            _report_copy(
+                f"Xarray variable '{name}'",
+                f"is backed by {type(var.data).__name__} and is loaded as numpy",
+            )
 
 
 def from_compatible_lib(obj: Any) -> Any:
     """
     Convert from a compatible library, if possible.
+
+    Pandas series and data frames, and xarray data arrays and datasets, are converted
+    using :mod:`scipp.compat`, which copies numpy-backed data once, into the buffers
+    of the scipp variables. Data that must be converted before that (pandas extension
+    dtypes, or xarray variables that are not stored in numpy arrays) is logged at
+    debug level.
     """
-    if 'pandas' in str(type(obj)):
+    pd = _imported_module('pandas')
+    if pd is not None and isinstance(obj, pd.Series | pd.DataFrame):
+        _check_pandas_columns(obj)
         return sc.compat.from_pandas(obj)
-    if 'xarray' in str(type(obj)):
+    xr = _imported_module('xarray')
+    if xr is not None and isinstance(obj, xr.DataArray | xr.Dataset):
+        _check_xarray_variables(obj)
         return sc.compat.from_xarray(obj)
     return obj
 
@@ -50,13 +141,15 @@ def _maybe_to_variable(obj: Plottable | list) -> Plottable:
     Attempt to convert the input to a Variable.
     If the input is either a list or a numpy array, it will be converted.
     Otherwise, the input will be returned unchanged.
+    Numpy arrays are copied once, into the buffer of the variable, unless their dtype
+    is not supported by scipp (see :func:`_as_supported_array`).
     """
     out = obj
     if isinstance(out, list):
-        out = np.array(out)
+        out = np.asarray(out)
     if isinstance(out, np.ndarray):
         dims = [f"axis-{i}" for i in range(len(out.shape))]
-        out = sc.Variable(dims=dims, values=out)
+        out = sc.Variable(dims=dims, values=_as_supported_array(out))
     return out
 
 
@@ -86,7 +179,7 @@ def to_data_array(obj: Plottable | list) -> sc.DataArray:
     obj:
         The input object to be converted.
     """
-    if isinstance(obj, sc.DataArray):
+    if isinstance(obj, sc.DataArray | LazyDataArray):
         return obj.copy(deep=False)
     out = _maybe_to_variable(obj)
     if isinstance(out, sc.Variable):
@@ -97,19 +190,24 @@ def to_data_array(obj: Plottable | list) -> sc.DataArray:
     return out
 
 
-def check_size(da: sc.DataArray) -> None:
+def check_size(da: sc.DataArray, lod: bool = False, pyramid: bool = False) -> None:
     """
     Prevent slow figure rendering by raising an error if the data array exceeds a
     default size.
+    If ``lod`` is ``True``, 1d data of any size is accepted, as lines are then
+    decimated to the resolution of the figure.
+    If ``pyramid`` is ``True``, 2d data of any size is accepted, as images are then
+    drawn from a multi-resolution pyramid at the resolution of the figure.
     """
-    limits = {1: 1_000_000, 2: 2500 * 2500}
+    limits = {1: None if lod else 1_000_000, 2: None if pyramid else 2500 * 2500}
     if da.ndim not in limits:
         raise ValueError("plot can only handle 1d and 2d data.")
-    if np.prod(da.shape) > limits[da.ndim]:
+    if (limits[da.ndim] is not None) and (np.prod(da.shape) > limits[da.ndim]):
         raise ValueError(
             f"Plotting data of size {da.shape} may take very long or use "
             "an excessive amount of memory. This is therefore disabled by "
-            "default. To bypass this check, use `ignore_size=True`."
+            "default. To reduce the data for display, set a `max_display_size`. To "
+            "bypass this check, use `ignore_size=True`."
         )
 
 
@@ -163,6 +261,122 @@ def _all_dims_sorted(var, order='ascending') -> bool:
     return all(sc.allsorted(var, dim, order=order) for dim in var.dims)
 
 
+def _sample_values(var: sc.Variable, nsamples: int = 64) -> Hashable | None:
+    """
+    Identify the values of a variable from the address of its buffer and a sample of
+    evenly spaced elements, without reading all the values.
+    Returns ``None`` if the values are not stored in a numeric array.
+    """
+    if var.bins is not None:
+        return None
+    key = []
+    for values in (var.values, var.variances):
+        if values is None:
+            continue
+        if not isinstance(values, np.ndarray) or values.dtype == object:
+            return None
+        # The values of a scalar are a 0-d array, which cannot be indexed below
+        values = np.atleast_1d(values)
+        if values.size == 0:
+            key.append((values.shape, values.dtype.str))
+            continue
+        flat = np.linspace(0, values.size - 1, min(values.size, nsamples)).astype(int)
+        sample = values[np.unravel_index(flat, values.shape)]
+        key.append(
+            (
+                values.__array_interface__['data'][0],
+                values.strides,
+                values.dtype.str,
+                sample.tobytes(),
+            )
+        )
+    return tuple(key)
+
+
+def _sort_direction(
+    var: sc.Variable,
+) -> Literal['ascending', 'descending', 'constant'] | None:
+    """
+    Find the order in which the values of a variable are sorted along all its
+    dimensions. Returns ``'constant'`` if the values are sorted in both orders (all
+    values are equal along each dimension), and ``None`` if they are not sorted.
+
+    For numeric and datetime dtypes, this makes a single pass over the differences
+    between neighbouring values along each dim: the direction is given by the first
+    and last values, and only that direction is then checked.
+    Other dtypes are checked with :func:`scipp.allsorted`, which raises a
+    ``DTypeError`` if the values cannot be ordered.
+    """
+    if var.bins is not None or var.dtype not in (
+        sc.DType.float64,
+        sc.DType.float32,
+        sc.DType.int64,
+        sc.DType.int32,
+        sc.DType.datetime64,
+    ):
+        if _all_dims_sorted(var, order='ascending'):
+            return (
+                'constant' if _all_dims_sorted(var, order='descending') else 'ascending'
+            )
+        return 'descending' if _all_dims_sorted(var, order='descending') else None
+    values = np.asarray(var.values)
+    if var.dtype == sc.DType.datetime64:
+        values = values.view(np.int64)
+    direction = 'constant'
+    for axis in range(values.ndim):
+        if values.shape[axis] < 2:
+            continue
+        first = np.take(values, 0, axis=axis)
+        last = np.take(values, -1, axis=axis)
+        if np.all(last >= first) and np.any(last > first):
+            current = 'ascending'
+        elif np.all(last <= first) and np.any(last < first):
+            current = 'descending'
+        else:
+            current = 'constant'
+        if direction == 'constant':
+            direction = current
+        elif current not in ('constant', direction):
+            return None
+        diff = np.diff(values, axis=axis)
+        if current == 'ascending':
+            ok = np.all(diff >= 0)
+        elif current == 'descending':
+            ok = np.all(diff <= 0)
+        else:
+            ok = np.all(diff == 0)
+        if not ok:
+            return None
+    return direction
+
+
+_SORT_DIRECTION_CACHE_SIZE = 256
+_sort_direction_cache = OrderedDict()
+
+
+def _cached_sort_direction(
+    var: sc.Variable,
+) -> Literal['ascending', 'descending', 'constant'] | None:
+    """
+    Same as :func:`_sort_direction`, but the results are cached, keyed on the buffer
+    of the values (its address and layout, along with a sample of the values, see
+    :func:`_sample_values`). Plotting data that shares its coordinates with data
+    that was plotted before thus does not scan the coordinates again.
+    """
+    key = _sample_values(var)
+    if key is None:
+        return _sort_direction(var)
+    key = (key, var.dims, str(var.dtype))
+    if key in _sort_direction_cache:
+        _sort_direction_cache.move_to_end(key)
+        return _sort_direction_cache[key]
+    direction = _sort_direction(var)
+    _sort_direction_cache[key] = direction
+    if len(_sort_direction_cache) > _SORT_DIRECTION_CACHE_SIZE:
+        _sort_direction_cache.popitem(last=False)
+    return direction
+
+
 def _rename_dims_from_coords(da: sc.DataArray, coords: Iterable[str]) -> sc.DataArray:
     """
     If coordinates are provided, rename the dimensions of the data array to match the
@@ -218,26 +432,24 @@ def _handle_coords_with_left_over_dimensions(da: sc.DataArray) -> sc.DataArray:
     """
     return da.assign_coords(
         {
-            name: da.coords[name].mean(
-                [dim for dim in da.coords[name].dims if dim not in da.dims]
-            )
-            for name in da.coords
+            name: coord.mean([dim for dim in coord.dims if dim not in da.dims])
+            for name, coord in da.coords.items()
+            if not set(coord.dims).issubset(da.dims)
         }
     )
 
 
-def _check_coord_sanity(da: sc.DataArray) -> None:
+def _check_coord_sanity(da: sc.DataArray) -> bool:
     """
     Warn if any coordinate is not sorted. This can lead to unpredictable results
     when plotting.
     Also, raise an error if any coordinate is scalar.
+    Returns ``False`` if a warning was emitted.
     """
+    sane = True
     for name, coord in da.coords.items():
         try:
-            if not (
-                _all_dims_sorted(coord, order='ascending')
-                or _all_dims_sorted(coord, order='descending')
-            ):
+            if _cached_sort_direction(coord) is None:
                 warnings.warn(
                     'The input contains a coordinate with unsorted values '
                     f'({name}). The results may be unpredictable. '
@@ -246,6 +458,7 @@ def _check_coord_sanity(da: sc.DataArray) -> None:
                     RuntimeWarning,
                     stacklevel=2,
                 )
+                sane = False
         except sc.DTypeError:
             pass
 
@@ -255,6 +468,209 @@ def _check_coord_sanity(da: sc.DataArray) -> None:
                 f"dimension {name}. Consider dropping this coordinate before plotting. "
                 f"Use ``data.drop_coords('{name}').plot()``."
             )
+    return sane
+
+
+def _buffer_address(var: sc.Variable) -> Hashable | None:
+    """
+    Identify the buffers that hold the values (and variances) of a variable, by their
+    address and layout. Returns ``None`` if the values are not stored in a numeric
+    array.
+    """
+    if var.bins is not None:
+        constituents = var.bins.constituents
+        content = constituents['data']
+        if isinstance(content, sc.DataArray):
+            content = content.data
+        key = (_buffer_address(constituents['begin']), _buffer_address(content))
+        return None if None in key else key
+    key = []
+    for values in (var.values, var.variances):
+        if values is None:
+            continue
+        if not isinstance(values, np.ndarray) or values.dtype == object:
+            return None
+        key.append((values.__array_interface__['data'][0], values.strides))
+    return tuple(key)
+
+
+def _fingerprint(da: sc.DataArray, sampled: Iterable[str]) -> Hashable | None:
+    """
+    Describe the parts of a data array that affect its pre-processing: the name,
+    sizes, dtype and unit of the data, the buffers of the data and masks, the layout
+    of the coordinates, and a sample of the values of the ``sampled`` coordinates.
+    Returns ``None`` if one of these buffers cannot be identified.
+    """
+    buffers = [_buffer_address(da.data)]
+    buffers.extend(_buffer_address(mask) for mask in da.masks.values())
+    if None in buffers:
+        return None
+    layout = [da.name, tuple(da.sizes.items()), str(da.dtype), str(da.unit)]
+    layout.append(da.is_binned)
+    layout.append(tuple(buffers))
+    for name, coord in da.coords.items():
+        layout.append(
+            (name, coord.dims, coord.shape, str(coord.dtype), str(coord.unit))
+        )
+    layout.extend((name, mask.dims) for name, mask in da.masks.items())
+    for name in sampled:
+        sample = _sample_values(da.coords[name])
+        if sample is None:
+            return None
+        layout.append(sample)
+    return tuple(layout)
+
+
+def _owned_nbytes(obj: sc.DataArray, out: sc.DataArray) -> int:
+    """
+    The memory used by the buffers of ``out`` that are not shared with ``obj``, i.e.
+    the buffers created by the pre-processing (such as new or converted coordinates).
+    """
+    shared = {
+        _buffer_address(var)
+        for var in chain([obj.data], obj.coords.values(), obj.masks.values())
+    }
+    shared.discard(None)
+    return sum(
+        nbytes(var)
+        for var in chain([out.data], out.coords.values(), out.masks.values())
+        if _buffer_address(var) not in shared
+    )
+
+
+class PreprocessCache:
+    """
+    A cache of pre-processed data arrays, so that plotting the same data array again
+    (for example when re-executing a notebook cell) does not repeat the processing of
+    the coordinates, and in particular the checks that they are sorted.
+
+    Entries are identified by the input object, and are valid as long as its
+    fingerprint is unchanged (see :func:`_fingerprint`): replacing the data, a
+    coordinate or a mask (which gives them a new buffer), or modifying the values of a
+    coordinate in place is detected.
+    Note that the values of coordinates are compared using a sample of the elements,
+    so that changing a few values of a large coordinate in place may go unnoticed;
+    call :meth:`PreprocessCache.clear` in that case.
+    The pre-processed data shares the buffers of the input's data and masks, so that
+    changing their values in place is always reflected.
+
+    The cache only holds a weak reference to the inputs (inputs that do not support
+    weak references are not cached), and an entry is removed as soon as its input is
+    garbage collected, so that the cache never keeps the buffers of the input alive.
+    The least recently used entries are evicted when the total size of the cached
+    arrays exceeds ``max_bytes``. Only the memory owned by the cache counts towards
+    this budget: the buffers shared with the input are not included.
+
+    Parameters
+    ----------
+    max_bytes:
+        The maximum total size (in bytes) of the buffers created by the
+        pre-processing that are held by the cache. Set to zero to disable the cache.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _remove(self, key: Hashable, ref: Any = None) -> None:
+        entry = self._entries.get(key)
+        # When called from the callback of a weak reference, the entry may already
+        # have been replaced by a new one for an object that re-uses the same id.
+        if entry is None or (ref is not None and entry[0] is not ref):
+            return
+        del self._entries[key]
+        self._nbytes -= entry[3]
+
+    def get(self, obj: Any, options: Hashable) -> sc.DataArray | None:
+        """
+        Return (a shallow copy of) the pre-processed version of ``obj``, or ``None``
+        if it is not in the cache.
+
+        Parameters
+        ----------
+        obj:
+            The input of the pre-processing.
+        options:
+            The arguments of the pre-processing.
+        """
+        key = (id(obj), options)
+        entry = self._entries.get(key)
+        if entry is not None:
+            ref, sampled, fingerprint, _, out = entry
+            if (ref() is obj) and (_fingerprint(obj, sampled) == fingerprint):
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return out.copy(deep=False)
+            self._remove(key)
+        self._misses += 1
+        return None
+
+    def put(self, obj: sc.DataArray, options: Hashable, out: sc.DataArray) -> None:
+        """
+        Add the pre-processed version of ``obj`` to the cache, evicting old entries
+        if needed.
+
+        Parameters
+        ----------
+        obj:
+            The input of the pre-processing.
+        options:
+            The arguments of the pre-processing.
+        out:
+            The pre-processed data array.
+        """
+        if self.max_bytes <= 0:
+            return
+        size = _owned_nbytes(obj, out)
+        if size > self.max_bytes:
+            return
+        sampled = [name for name in out.coords if name in obj.coords]
+        fingerprint = _fingerprint(obj, sampled)
+        if fingerprint is None:
+            return
+        key = (id(obj), options)
+        try:
+            ref = weakref.ref(obj, lambda ref, key=key: self._remove(key, ref))
+        except TypeError:
+            return
+        self._remove(key)
+        self._entries[key] = (ref, sampled, fingerprint, size, out.copy(deep=False))
+        self._nbytes += size
+        while self._entries and self._nbytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry[3]
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache. The statistics are preserved.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the cache statistics.
+        """
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            nbytes=self._nbytes,
+            max_bytes=self.max_bytes,
+        )
+
+
+preprocess_cache = PreprocessCache(max_bytes=64 * 1024**2)
+"""
+The cache used by :func:`preprocess`. Its budget can be changed (or set to zero to
+disable caching) with ``preprocess_cache.max_bytes``.
+"""
 
 
 def preprocess(
@@ -262,7 +678,11 @@ def preprocess(
     name: str | None = None,
     ignore_size: bool = False,
     coords: Iterable[str] | str | None = None,
-) -> sc.DataArray:
+    lod: bool = False,
+    pyramid: bool = False,
+    binned: bool = False,
+    lazy: bool = False,
+) -> sc.DataArray | LazyDataArray:
     """
     Pre-process input data for plotting.
     This involves:
@@ -281,25 +701,66 @@ def preprocess(
         Do not perform a size check on the object before plotting it.
     coords:
         If supplied, use these coords instead of the input's dimension coordinates.
+    lod:
+        If ``True``, lines will be decimated for display, and the size check is not
+        applied to 1d data.
+    pyramid:
+        If ``True``, images will be drawn from a multi-resolution pyramid, and the
+        size check is not applied to 2d data.
+    binned:
+        If ``True``, binned data is accepted and returned as binned data, so that it
+        can be histogrammed for display later. Only the coordinates of the outer dims
+        are processed; ``coords`` may also name event coordinates.
+    lazy:
+        If ``True``, a :class:`LazyDataArray` input is returned as a lazy array, and
+        only its coordinates are processed. Otherwise, its values are loaded.
+
+    Data arrays that were already pre-processed with the same arguments are returned
+    from :data:`preprocess_cache`, unless they were modified in the meantime.
     """
     if isinstance(coords, str):
         coords = [coords]
     elif coords is not None:
         coords = list(coords)
 
+    options = (
+        name,
+        ignore_size,
+        None if coords is None else tuple(coords),
+        lod,
+        pyramid,
+        binned,
+        lazy,
+    )
+    cacheable = isinstance(obj, sc.DataArray) and obj.dtype != sc.DType.bool
+    if cacheable:
+        cached = preprocess_cache.get(obj, options)
+        if cached is not None:
+            return cached
+
     out = to_data_array(obj)
-    check_not_binned(out)
-    out = to_allowed_dtypes(out)
+    if not binned:
+        check_not_binned(out)
     if name is not None:
         out.name = str(name)
-    if not ignore_size:
-        check_size(out)
+    if not (ignore_size or out.is_binned):
+        check_size(out, lod=lod, pyramid=pyramid)
+    if isinstance(out, LazyDataArray) and not lazy:
+        out = out.load()
+    if not (out.is_binned or isinstance(out, LazyDataArray)):
+        out = to_allowed_dtypes(out)
     if coords is not None:
+        if out.is_binned:
+            # Event coordinates are used when histogramming the data
+            coords = [dim for dim in coords if dim in out.coords]
         out = _rename_dims_from_coords(out, coords)
     out = _add_missing_dimension_coords(out)
     out = _drop_non_dimension_coords(out)
     out = _handle_coords_with_left_over_dimensions(out)
-    _check_coord_sanity(out)
+    # Data with unsorted coordinates is not cached, so that the warning is emitted
+    # every time it is plotted.
+    if _check_coord_sanity(out) and cacheable:
+        preprocess_cache.put(obj, options, out)
     return out
 
 
@@ -348,7 +809,7 @@ def raise_multiple_inputs_for_2d_plot_error(origin):
 
 def categorize_args(
     aspect: Literal['auto', 'equal'] | None = None,
-    autoscale: bool = True,
+    autoscale: bool | Literal['percentile'] = True,
     cbar: bool = True,
     clabel: str | None = None,
     cmap: str = 'viridis',
@@ -358,6 +819,7 @@ def categorize_args(
     figsize: tuple[float, float] | None = None,
     grid: bool = False,
     legend: bool | tuple[float, float] = True,
+    lod: bool | int = False,
     logc: bool | None = None,
     logx: bool | None = None,
     logy: bool | None = None,
@@ -365,6 +827,7 @@ def categorize_args(
     mask_color: str = 'black',
     nan_color: str | None = None,
     norm: Literal['linear', 'log'] | None = None,
+    pyramid: Literal['mean', 'max', 'sum'] | bool | None = None,
     scale: dict[str, str] | None = None,
     title: str | None = None,
     vmax: sc.Variable | float | None = None,
@@ -399,7 +862,7 @@ def categorize_args(
         **kwargs,
     }
     return {
-        "1d": {'errorbars': errorbars, 'legend': legend, **common_args},
+        "1d": {'errorbars': errorbars, 'legend': legend, 'lod': lod, **common_args},
         "2d": {
             'cbar': cbar,
             'cmap': cmap,
@@ -409,6 +872,7 @@ def categorize_args(
             'logc': logc,
             'nan_color': nan_color,
             'mask_cmap': mask_cmap,
+            'pyramid': pyramid,
             **common_args,
         },
     }
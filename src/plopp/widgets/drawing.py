@@ -8,7 +8,7 @@ from typing import Any
 import mpltoolbox as tbx
 import scipp as sc
 
-from ..core import Node, node
+from ..core import Node, View, node
 from ..core.typing import FigureLike
 from ..graphics import BaseFig
 from .tools import ToggleTool
@@ -20,6 +20,23 @@ def is_figure(x):
     return answer
 
 
+class _BatchView(View):
+    """
+    A view attached to the node that evaluates all the shapes of a batched
+    :class:`DrawingTool`, which forwards all the results to a callback at once.
+    """
+
+    def __init__(self, node: Node, callback: Callable):
+        super().__init__(node)
+        self._callback = callback
+
+    def notify_view(self, message: dict[str, Any]) -> None:
+        self.update(self.graph_nodes[message["node_id"]].request_data())
+
+    def update(self, results: dict[str, Any]) -> None:
+        self._callback(results)
+
+
 class DrawingTool(ToggleTool):
     """
     Interface between Plopp and Mpltoolbox.
@@ -50,7 +67,22 @@ class DrawingTool(ToggleTool):
         mouse button.
         In other words, it can be set ``True`` for tools that need fast feedback,
         or ``False`` for tools that use computationally expensive functions.
+    batched:
+        If ``True``, all the shapes are evaluated together in a single node when the
+        input data changes (instead of once per shape), and when the destination is a
+        figure, all the results are sent to it in a single update (and a single draw).
+        This is useful when many shapes are drawn, as a change in the input data then
+        triggers a single evaluation and redraw instead of one per shape. When a single
+        shape is created or changed, only that shape is evaluated and updated.
 
+        .. versionadded:: 26.11.0
+    batch_func:
+        A function that computes the results for all shapes at once (used only if
+        ``batched=True``), when the input data changes. It is called with the input
+        data and the list of the states of all the shapes, and must return a list of
+        results in the same order. If ``None``, ``func`` is called for each shape.
+
+        .. versionadded:: 26.11.0
     **kwargs:
         Additional arguments are forwarded to the ``ToggleTool`` constructor.
     """
@@ -65,6 +97,8 @@ class DrawingTool(ToggleTool):
         get_artist_info: Callable,
         value: bool = False,
         continuous_update: bool = True,
+        batched: bool = False,
+        batch_func: Callable | None = None,
         **kwargs,
     ):
         super().__init__(callback=self.start_stop, value=value, **kwargs)
@@ -79,6 +113,15 @@ class DrawingTool(ToggleTool):
         self._destination_is_fig = is_figure(self._destination)
         self._get_artist_info = get_artist_info
         self._get_artist_info_is_callable = None
+        self._batch_node = None
+        if batched:
+            self._batch_func = batch_func
+            self._batch_node = Node(self._evaluate_batch, self._input_node)
+            self._batch_node.pretty_name = 'Batch node'
+            if self._destination_is_fig:
+                self._batch_view = _BatchView(
+                    self._batch_node, callback=self._send_batch
+                )
         self._tool.on_create(self.make_node)
         self._tool.on_remove(self.remove_node)
         if continuous_update:
@@ -87,6 +130,37 @@ class DrawingTool(ToggleTool):
             self._tool.on_vertex_release(self.update_node)
             self._tool.on_drag_release(self.update_node)
 
+    def _evaluate_batch(self, data: Any) -> dict[str, tuple[Any, Any]]:
+        """
+        Evaluate all the shapes at once, when the input data changes. The draw nodes
+        are not parents of the batch node, so that changing a single shape does not
+        re-evaluate all the others. Returns the state of each shape along with its
+        result, keyed by the id of the draw node.
+        """
+        infos = [draw_node() for draw_node in self._draw_nodes.values()]
+        if self._batch_func is None:
+            results = [self._func(data, info) for info in infos]
+        else:
+            results = self._batch_func(data, infos)
+        entries = zip(infos, results, strict=True)
+        return dict(zip(self._draw_nodes, entries, strict=True))
+
+    def _evaluate_shape(
+        self, batch: dict[str, tuple[Any, Any]], info: Any, key: str
+    ) -> Any:
+        """
+        Return the result for a single shape. The result of the batch is used if it
+        was computed for the current state of the shape; otherwise (the shape was
+        just created or changed) only this shape is evaluated.
+        """
+        entry = batch.get(key)
+        if entry is not None and entry[0] is info:
+            return entry[1]
+        return self._func(self._input_node(), info)
+
+    def _send_batch(self, batch: dict[str, tuple[Any, Any]]) -> None:
+        self._destination.update({key: result for key, (_, result) in batch.items()})
+
     def make_node(self, artist):
         info = self._get_artist_info(artist=artist, figure=self._figure)
         if self._get_artist_info_is_callable is None:
@@ -96,6 +170,9 @@ class DrawingTool(ToggleTool):
         nodeid = draw_node.id
         self._draw_nodes[nodeid] = draw_node
         artist.nodeid = nodeid
+        if self._batch_node is not None:
+            self._make_batched_node(artist, draw_node)
+            return
         output_node = node(self._func)(self._input_node, draw_node)
         output_node.pretty_name = f'Output node {len(self._output_nodes)}'
         self._output_nodes[nodeid] = output_node
@@ -109,6 +186,25 @@ class DrawingTool(ToggleTool):
             self._destination.add_parents(output_node)
             self._destination.notify_children(artist)
 
+    def _make_batched_node(self, artist, draw_node: Node):
+        nodeid = draw_node.id
+        output_node = Node(
+            partial(self._evaluate_shape, key=nodeid), self._batch_node, draw_node
+        )
+        output_node.pretty_name = f'Output node {len(self._output_nodes)}'
+        self._output_nodes[nodeid] = output_node
+        if self._destination_is_fig:
+            # The artists in the destination are keyed by the draw node ids. The
+            # figure is updated by the batch view when the input changes, and only
+            # with the result of this shape otherwise.
+            self._destination.update({nodeid: output_node()})
+            self._destination.artists[nodeid].color = (
+                artist.color if hasattr(artist, 'color') else artist.edgecolor
+            )
+        elif isinstance(self._destination, Node):
+            self._destination.add_parents(output_node)
+            self._destination.notify_children(artist)
+
     def update_node(self, artist):
         n = self._draw_nodes[artist.nodeid]
         if self._get_artist_info_is_callable:
@@ -116,14 +212,18 @@ class DrawingTool(ToggleTool):
         else:
             n.func = partial(self._get_artist_info, artist=artist, figure=self._figure)
         n.notify_children(artist)
+        if self._batch_node is not None and self._destination_is_fig:
+            nodeid = artist.nodeid
+            self._destination.update({nodeid: self._output_nodes[nodeid]()})
 
     def remove_node(self, artist):
         nodeid = artist.nodeid
         draw_node = self._draw_nodes.pop(nodeid)
         output_node = self._output_nodes[nodeid]
         if self._destination_is_fig:
-            self._destination.artists[output_node.id].remove()
-            del self._destination.artists[output_node.id]
+            key = nodeid if self._batch_node is not None else output_node.id
+            self._destination.artists[key].remove()
+            del self._destination.artists[key]
             self._destination.canvas.draw()
         output_node.remove()
         draw_node.remove()
@@ -9,6 +9,7 @@ import scipp as sc
 from traitlets import Any
 
 from ..core import node
+from ..core.lazy import LazyDataArray
 from .box import VBar
 
 
@@ -562,10 +563,11 @@ width:
 """
 
 
-@node
-def slice_dims(data_array: sc.DataArray, slices: dict[str, slice]) -> sc.DataArray:
+def _slice_dims(data_array: sc.DataArray, slices: dict[str, slice]) -> sc.DataArray:
     """
     Slice the data according to input slices.
+    If the data is a :class:`LazyDataArray`, only the selected region is read from
+    its source.
 
     Parameters
     ----------
@@ -581,4 +583,9 @@ def slice_dims(data_array: sc.DataArray, slices: dict[str, slice]) -> sc.DataArr
             # be inclusive.
             sl = slice(sl[0], sl[1] + 1)
         out = out[dim, sl]
+    if isinstance(out, LazyDataArray):
+        out = out.load()
     return out
+
+
+slice_dims = node(_slice_dims)
@@ -9,6 +9,7 @@ import scipp as sc
 from plopp import Node
 from plopp.data.testing import data_array
 from plopp.graphics import imagefigure
+from plopp.plotting._binned import DisplayHistogram
 
 pytestmark = pytest.mark.usefixtures("_parametrize_mpl_backends")
 
@@ -89,3 +90,220 @@ def test_pass_mpl_cmap_object():
     da = data_array(ndim=2)
     cmap = mpl.colormaps['plasma']
     imagefigure(Node(da), cmap=cmap)
+
+
+def _large_image(ny=1000, nx=1200):
+    da = sc.DataArray(
+        data=sc.array(
+            dims=['yy', 'xx'], values=np.random.random((ny, nx)), unit='counts'
+        ),
+        coords={
+            'xx': sc.arange('xx', float(nx), unit='m'),
+            'yy': sc.arange('yy', float(ny), unit='m'),
+        },
+    )
+    return da
+
+
+@pytest.mark.parametrize('pyramid', ['mean', 'max', 'sum', True])
+def test_image_pyramid_draws_reduced_level(pyramid):
+    da = _large_image()
+    fig = imagefigure(Node(da), pyramid=pyramid, figsize=(4, 3))
+    [artist] = fig.artists.values()
+    level, _ys, _xs = artist._window
+    assert level > 0
+    shape = artist._image.get_array().shape
+    assert shape[0] < da.sizes['yy']
+    assert shape[1] < da.sizes['xx']
+    assert artist._image.get_extent() == [0 - 0.5, 1200 - 0.5, 0 - 0.5, 1000 - 0.5]
+
+
+def test_image_pyramid_level_values():
+    da = _large_image(ny=5, nx=4)
+    fig = imagefigure(Node(da), pyramid='max')
+    [artist] = fig.artists.values()
+    values, _ = artist._get_level(1)
+    expected = np.array(
+        [
+            [da.values[0:2, 0:2].max(), da.values[0:2, 2:4].max()],
+            [da.values[2:4, 0:2].max(), da.values[2:4, 2:4].max()],
+            [da.values[4:5, 0:2].max(), da.values[4:5, 2:4].max()],
+        ]
+    )
+    assert np.array_equal(values, expected)
+
+
+def test_image_pyramid_zoom_selects_finer_level_and_window():
+    da = _large_image()
+    fig = imagefigure(Node(da), pyramid=True, figsize=(4, 3))
+    [artist] = fig.artists.values()
+    coarse = artist._window[0]
+    fig.canvas.ax.set_xlim(100, 160)
+    fig.canvas.ax.set_ylim(200, 240)
+    fig.canvas.draw()
+    level, ys, xs = artist._window
+    assert level < coarse
+    assert level == 0
+    assert xs.start <= 100
+    assert xs.stop >= 160
+    assert ys.start <= 200
+    assert ys.stop >= 240
+    extent = artist._image.get_extent()
+    assert extent[0] <= 100
+    assert extent[1] >= 160
+    shape = (ys.stop - ys.start, xs.stop - xs.start)
+    assert artist._image.get_array().shape[:2] == shape
+
+
+def test_image_pyramid_sum_colors_match_full_resolution():
+    da = _large_image()
+    da.values = np.ones(da.shape)
+    fig = imagefigure(Node(da), pyramid='sum', figsize=(4, 3))
+    [artist] = fig.artists.values()
+    assert artist._window[0] > 0
+    colors = artist._image.get_array()
+    expected = fig.view.colormapper.rgba(da['yy', :1]['xx', :1], bytes=True)
+    assert np.array_equal(colors[0, 0], expected[0, 0])
+
+
+def test_image_pyramid_with_masks():
+    da = _large_image()
+    da.masks['m'] = da.coords['xx'] > sc.scalar(600.0, unit='m')
+    fig = imagefigure(Node(da), pyramid=True, figsize=(4, 3))
+    [artist] = fig.artists.values()
+    _, mask = artist._get_level(artist._window[0])
+    assert mask.any()
+    assert not mask.all()
+
+
+def test_image_pyramid_update():
+    da = _large_image()
+    a = Node(da)
+    fig = imagefigure(a, pyramid='max', figsize=(4, 3))
+    [artist] = fig.artists.values()
+    a.func = lambda: da * 0.0
+    a.notify_children('updated')
+    values, _ = artist._get_level(artist._window[0])
+    assert np.all(values == 0)
+
+
+def test_image_pyramid_bad_reduction_raises():
+    with pytest.raises(ValueError, match='Invalid pyramid reduction'):
+        imagefigure(Node(data_array(ndim=2)), pyramid='median')
+
+
+def _binned_image_figure(events, resolution=20):
+    hist = DisplayHistogram(dims=['y', 'x'], resolution=resolution)
+    node = Node(hist, Node(events.bin(y=1, x=1)))
+    return imagefigure(node, rebin={node.id: hist.window}, figsize=(4, 3))
+
+
+def test_image_rebin_histograms_visible_region_on_zoom():
+    events = sc.data.table_xyz(50_000)
+    fig = _binned_image_figure(events)
+    [artist] = fig.artists.values()
+    full_bbox = artist.bbox(xscale='linear', yscale='linear')
+    x = events.coords['x'].values
+    y = events.coords['y'].values
+    xlo, xhi = np.quantile(x, [0.3, 0.5])
+    ylo, yhi = np.quantile(y, [0.4, 0.7])
+    fig.canvas.ax.set_xlim(xlo, xhi)
+    fig.canvas.ax.set_ylim(ylo, yhi)
+    fig.canvas.draw()
+    extent = artist._image.get_extent()
+    assert xlo <= extent[0] < extent[1] <= xhi
+    assert ylo <= extent[2] < extent[3] <= yhi
+    # One bin per screen pixel
+    window = fig.canvas.ax.get_window_extent()
+    ny, nx = artist._image.get_array().shape[:2]
+    assert abs(nx - window.width) <= 1
+    assert abs(ny - window.height) <= 1
+    # Only the events inside the visible region are counted
+    inside = (x >= extent[0]) & (x < extent[1]) & (y >= extent[2]) & (y < extent[3])
+    assert np.isclose(artist._data.sum().value, events.data.values[inside].sum())
+    # The bounding box still covers the full range of the data
+    assert artist.bbox(xscale='linear', yscale='linear') == full_bbox
+
+
+def test_image_rebin_fits_color_range_to_visible_histogram():
+    events = sc.data.table_xyz(50_000)
+    fig = _binned_image_figure(events)
+    [artist] = fig.artists.values()
+    x = events.coords['x'].values
+    fig.canvas.ax.set_xlim(*np.quantile(x, [0.45, 0.55]))
+    fig.canvas.draw()
+    assert np.isclose(fig.view.colormapper.vmax, artist._data.max().value)
+
+
+def test_image_rebin_keeps_fixed_color_range_on_zoom():
+    events = sc.data.table_xyz(50_000)
+    hist = DisplayHistogram(dims=['y', 'x'], resolution=20)
+    node = Node(hist, Node(events.bin(y=1, x=1)))
+    fig = imagefigure(node, rebin={node.id: hist.window}, autoscale=False)
+    fig.canvas.draw()
+    vmin, vmax = fig.view.colormapper.vmin, fig.view.colormapper.vmax
+    x = events.coords['x'].values
+    fig.canvas.ax.set_xlim(*np.quantile(x, [0.45, 0.55]))
+    fig.canvas.draw()
+    assert fig.view.colormapper.vmin == vmin
+    assert fig.view.colormapper.vmax == vmax
+
+
+def test_image_rebin_histograms_once_per_zoom():
+    events = sc.data.table_xyz(50_000)
+    hist = DisplayHistogram(dims=['y', 'x'], resolution=20)
+    node = Node(hist, Node(events.bin(y=1, x=1)))
+    calls = []
+
+    def window(*args):
+        calls.append(args)
+        return hist.window(*args)
+
+    fig = imagefigure(node, rebin={node.id: window}, figsize=(4, 3))
+    fig.canvas.draw()
+    calls.clear()
+    fig.canvas.ax.set_xlim(*np.quantile(events.coords['x'].values, [0.3, 0.5]))
+    fig.canvas.ax.set_ylim(*np.quantile(events.coords['y'].values, [0.4, 0.7]))
+    fig.canvas.draw()
+    assert len(calls) == 1
+
+
+def test_image_rebin_update():
+    events = sc.data.table_xyz(50_000)
+    hist = DisplayHistogram(dims=['y', 'x'])
+    source = Node(events.bin(y=1, x=1))
+    node = Node(hist, source)
+    fig = imagefigure(node, rebin={node.id: hist.window}, figsize=(4, 3))
+    [artist] = fig.artists.values()
+    source.func = lambda: (events * 2.0).bin(y=1, x=1)
+    source.notify_children('updated')
+    # The new data is also histogrammed with one bin per screen pixel
+    window = fig.canvas.ax.get_window_extent()
+    ny, nx = artist._image.get_array().shape[:2]
+    assert abs(nx - window.width) <= 1
+    assert abs(ny - window.height) <= 1
+    assert np.isclose(artist._data.sum().value, 2.0 * events.data.sum().value)
+
+
+@pytest.mark.parametrize('linspace', [True, False])
+def test_update_reuses_color_buffer(linspace):
+    da = data_array(ndim=2, linspace=linspace)
+    a = Node(da)
+    fig = imagefigure(a)
+    [artist] = fig.artists.values()
+    buffer = artist._rgba_buffer
+    a.func = lambda: da * 2.0
+    a.notify_children('updated')
+    assert artist._rgba_buffer is buffer
+
+
+def test_update_with_new_shape_reallocates_color_buffer():
+    da = data_array(ndim=2, linspace=True)
+    a = Node(da)
+    fig = imagefigure(a)
+    [artist] = fig.artists.values()
+    buffer = artist._rgba_buffer
+    a.func = lambda: da['xx', :10]
+    a.notify_children('updated')
+    assert artist._rgba_buffer is not buffer
+    assert artist._rgba_buffer.shape[:2] == (da.sizes['yy'], 10)
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import io
+
 import numpy as np
 import pytest
 import scipp as sc
@@ -256,3 +258,122 @@ def test_kwarg_zorder_binedges_errorbars_band_mode():
     )
     assert line._line.get_zorder() == 15
     assert line._error.get_zorder() == 14  # band is below the line
+
+
+def _long_line(n=100_000):
+    x = sc.linspace('t', 0.0, 100.0, n, unit='s')
+    y = sc.array(dims=['t'], values=np.sin(x.values) + np.random.random(n), unit='m')
+    return sc.DataArray(data=y, coords={'t': x})
+
+
+def test_line_lod_decimates_but_keeps_envelope():
+    da = _long_line()
+    line = Line(canvas=Canvas(), data=da, lod=200)
+    ydata = line._line.get_ydata()
+    assert len(ydata) <= 4 * 200
+    assert ydata.min() == da.values.min()
+    assert ydata.max() == da.values.max()
+    xdata = line._line.get_xdata()
+    assert xdata[0] == da.coords['t'].values[0]
+    assert xdata[-1] == da.coords['t'].values[-1]
+
+
+def test_line_lod_uses_axes_width_by_default():
+    da = _long_line()
+    canvas = Canvas()
+    line = Line(canvas=canvas, data=da, lod=True)
+    width = canvas.ax.get_window_extent().width
+    assert len(line._line.get_xdata()) <= 4 * width
+
+
+def test_line_lod_recomputed_on_zoom():
+    da = _long_line()
+    canvas = Canvas()
+    line = Line(canvas=canvas, data=da, lod=100)
+    canvas.ax.set_xlim(10.0, 20.0)
+    xdata = line._line.get_xdata()
+    assert len(xdata) <= 4 * 100 + 2
+    assert xdata[0] < 10.0 < xdata[1]
+    assert xdata[-2] < 20.0 < xdata[-1]
+    # Zoomed in, we see more details than when zoomed out
+    assert np.diff(xdata[1:-1]).max() < 0.1
+
+
+def test_line_lod_small_data_is_not_decimated():
+    da = data_array(ndim=1)
+    line = Line(canvas=Canvas(), data=da, lod=True)
+    assert len(line._line.get_xdata()) == da.sizes['xx']
+
+
+def test_line_lod_unsorted_coord_is_not_decimated():
+    da = _long_line(10_000)
+    da.coords['t'].values = da.coords['t'].values[::-1].copy()
+    line = Line(canvas=Canvas(), data=da, lod=100)
+    assert len(line._line.get_xdata()) == 10_000
+
+
+def test_line_lod_update():
+    da = _long_line()
+    line = Line(canvas=Canvas(), data=da, lod=100)
+    line.update(da * 3.0)
+    ydata = line._line.get_ydata()
+    assert len(ydata) <= 4 * 100
+    assert ydata.max() == (da.data * 3.0).values.max()
+
+
+def test_line_lod_with_masks_and_errorbars():
+    da = _long_line()
+    da.variances = np.abs(da.values) * 0.1
+    da.masks['m'] = da.coords['t'] > sc.scalar(50.0, unit='s')
+    line = Line(canvas=Canvas(), data=da, lod=100)
+    assert len(line._mask.get_ydata()) == len(line._line.get_ydata())
+    assert line._mask.get_visible()
+    assert len(line._error.get_xdata()) <= 4 * 100
+
+
+def test_line_rebin_histograms_visible_range_on_zoom():
+    from plopp.plotting._binned import DisplayHistogram
+
+    events = sc.data.table_xyz(10_000)
+    da = events.bin(x=1)
+    hist = DisplayHistogram(dims=['x'], resolution=50)
+    canvas = Canvas()
+    line = Line(canvas=canvas, data=hist(da), uid='a', rebin={'a': hist.window})
+    assert len(line._line.get_xdata()) == 51
+    xmin = events.coords['x'].min().value
+    xmax = events.coords['x'].max().value
+    lo, hi = xmin + 0.4 * (xmax - xmin), xmin + 0.6 * (xmax - xmin)
+    canvas.ax.set_xlim(lo, hi)
+    canvas.draw()
+    xdata = line._line.get_xdata()
+    assert xdata[0] >= lo
+    assert xdata[-1] <= hi
+    # One bin per pixel column of the axes
+    width = canvas.ax.get_window_extent().width
+    assert abs(len(xdata) - 1 - width) <= 1
+    # Events inside the visible range are all counted
+    x = events.coords['x'].values
+    inside = (x >= xdata[0]) & (x < xdata[-1])
+    # The first value is repeated in the step function
+    ydata = line._line.get_ydata()[1:]
+    assert np.isclose(ydata.sum(), events.data.values[inside].sum())
+    # The full histogram is still used for the bounding box
+    assert line._data.sizes['x'] == 50
+
+
+def test_line_rebin_on_draw_outside_of_canvas_draw():
+    from plopp.plotting._binned import DisplayHistogram
+
+    events = sc.data.table_xyz(10_000)
+    hist = DisplayHistogram(dims=['x'], resolution=50)
+    canvas = Canvas()
+    line = Line(
+        canvas=canvas, data=hist(events.bin(x=1)), uid='a', rebin={'a': hist.window}
+    )
+    lo, hi = np.quantile(events.coords['x'].values, [0.4, 0.6])
+    canvas.ax.set_xlim(lo, hi)
+    # Rendering the figure (e.g. after a toolbar zoom) also refreshes the line
+    canvas.fig.savefig(io.BytesIO())
+    xdata = line._line.get_xdata()
+    assert xdata[0] >= lo
+    assert xdata[-1] <= hi
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+import pytest
+
+from plopp.core.cache import NodeCache, freeze
+
+
+def test_freeze_dict_of_slider_values():
+    key = freeze({'x': 3, 'y': (2, 7)})
+    assert key == (('x', 3), ('y', (2, 7)))
+    assert hash(key) == hash(freeze({'x': 3, 'y': (2, 7)}))
+
+
+def test_freeze_raises_for_arrays():
+    with pytest.raises(TypeError, match='Cannot make a hashable key'):
+        freeze(np.arange(5))
+
+
+def test_cache_hit_and_miss():
+    cache = NodeCache(max_bytes=1000)
+    found, _ = cache.get('a')
+    assert not found
+    cache.put('a', np.zeros(10))
+    found, value = cache.get('a')
+    assert found
+    assert value.shape == (10,)
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.entries == 1
+    assert info.nbytes == 80
+
+
+def test_cache_evicts_least_recently_used():
+    cache = NodeCache(max_bytes=200)
+    cache.put('a', np.zeros(10))
+    cache.put('b', np.zeros(10))
+    cache.get('a')
+    cache.put('c', np.zeros(10))
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.info().evictions == 1
+    assert cache.info().nbytes == 160
+
+
+def test_cache_does_not_store_values_larger_than_budget():
+    cache = NodeCache(max_bytes=50)
+    cache.put('a', np.zeros(10))
+    assert len(cache) == 0
+    assert cache.info().nbytes == 0
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import asyncio
+import threading
+import time
+
+import pytest
+import scipp as sc
+
+from plopp import Node, View
+from plopp.core.executor import BackgroundEvaluator
+from plopp.data.testing import data_array
+from plopp.graphics import linefigure
+
+
+def _run(coro):
+    # Use a private loop to avoid resetting the global event loop for other tests
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def _wait_until_idle(evaluator, timeout=5.0):
+    start = time.perf_counter()
+    while evaluator.busy and (time.perf_counter() - start < timeout):
+        await asyncio.sleep(0.01)
+
+
+def test_evaluator_runs_synchronously_without_event_loop():
+    evaluator = BackgroundEvaluator()
+    results = []
+    evaluator.submit('a', lambda: threading.current_thread(), results.append)
+    assert results == [threading.current_thread()]
+
+
+def test_evaluator_runs_in_background_thread():
+    evaluator = BackgroundEvaluator()
+    results = []
+
+    async def main():
+        evaluator.submit('a', lambda: threading.current_thread(), results.append)
+        assert evaluator.busy
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert len(results) == 1
+    assert results[0] is not threading.current_thread()
+
+
+def test_evaluator_only_delivers_latest_request():
+    evaluator = BackgroundEvaluator()
+    computed = []
+    results = []
+
+    def compute(i):
+        time.sleep(0.05)
+        computed.append(i)
+        return i
+
+    async def main():
+        for i in range(10):
+            evaluator.submit('a', lambda i=i: compute(i), results.append)
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert computed == [0, 9]
+    assert results == [9]
+    assert evaluator.nsuperseded == 9
+
+
+def test_evaluator_keys_are_independent():
+    evaluator = BackgroundEvaluator()
+    results = []
+
+    async def main():
+        evaluator.submit('a', lambda: 'a', results.append)
+        evaluator.submit('b', lambda: 'b', results.append)
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert sorted(results) == ['a', 'b']
+
+
+def test_node_marked_dirty_during_computation_stays_dirty():
+    def func():
+        # Simulate a notification arriving while the node is being computed
+        node._mark_dirty()
+        return 1
+
+    node = Node(func)
+    assert node.request_data() == 1
+    assert node.is_dirty
+
+
+def test_linefigure_with_executor():
+    da = data_array(ndim=1)
+    a = Node(da)
+    fig = linefigure(a, executor=True)
+    [line] = fig.artists.values()
+    evaluator = fig.view._evaluator
+
+    async def main():
+        for i in range(2, 6):
+            a.func = lambda i=i: da * float(i)
+            a.notify_children('updated')
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert sc.identical(line._data, da * 5.0)
+
+
+def test_notify_children_does_not_wait_for_background_evaluation():
+    started = threading.Event()
+    events = []
+
+    def slow(x):
+        started.set()
+        time.sleep(0.1)
+        events.append('computed')
+        return x
+
+    class PassiveView(View):
+        def notify_view(self, message):
+            pass
+
+        def render(self):
+            pass
+
+    a = Node(1)
+    b = Node(slow, a)
+    PassiveView(b)
+    worker = threading.Thread(target=b.request_data)
+    worker.start()
+    started.wait()
+    a.notify_children('updated')
+    events.append('notified')
+    worker.join()
+    assert events == ['notified', 'computed']
+    # The result computed from the previous state is not stored
+    assert b.is_dirty
+
+
+def test_evaluator_drops_result_when_stamp_changes():
+    evaluator = BackgroundEvaluator()
+    stamp = [0]
+    results = []
+
+    def compute():
+        time.sleep(0.05)
+        return 'stale'
+
+    async def main():
+        evaluator.submit('a', compute, results.append, stamp=lambda: stamp[0])
+        stamp[0] += 1
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert results == []
+    assert evaluator.nsuperseded == 1
+
+
+def test_evaluator_raises_background_error_on_next_submit():
+    evaluator = BackgroundEvaluator()
+    results = []
+
+    def fail():
+        raise ValueError('bad input')
+
+    async def main():
+        evaluator.submit('a', fail, results.append)
+        await _wait_until_idle(evaluator)
+        with pytest.raises(ValueError, match='bad input'):
+            evaluator.submit('a', lambda: 1, results.append)
+        await _wait_until_idle(evaluator)
+
+    _run(main())
+    assert results == [1]
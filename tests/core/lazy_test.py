@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+import pytest
+import scipp as sc
+
+from plopp.core import LazyDataArray
+from plopp.data.testing import data_array
+from plopp.widgets import slice_dims
+
+
+class CountingArray:
+    """
+    Array-like wrapper that records the number of values that are read.
+    """
+
+    def __init__(self, values):
+        self._values = values
+        self.shape = values.shape
+        self.dtype = values.dtype
+        self.nread = 0
+
+    def __getitem__(self, key):
+        out = self._values[key]
+        self.nread += np.size(out)
+        return out
+
+
+def _lazy(da):
+    source = CountingArray(da.values)
+    lazy = LazyDataArray(
+        source,
+        dims=da.dims,
+        coords=dict(da.coords),
+        masks=dict(da.masks),
+        unit=da.unit,
+        name=da.name,
+    )
+    return lazy, source
+
+
+def test_lazy_metadata_does_not_read_values():
+    da = data_array(ndim=3)
+    lazy, source = _lazy(da)
+    assert lazy.dims == da.dims
+    assert lazy.sizes == da.sizes
+    assert sc.identical(lazy.coords['xx'], da.coords['xx'])
+    assert lazy.name == da.name
+    assert source.nread == 0
+
+
+def test_lazy_load():
+    da = data_array(ndim=2)
+    lazy, _ = _lazy(da)
+    assert sc.identical(lazy.load(), da)
+
+
+@pytest.mark.parametrize(
+    'slices',
+    [
+        [('zz', 3)],
+        [('zz', -1)],
+        [('zz', slice(2, 7))],
+        [('yy', slice(5, 25)), ('yy', 4)],
+        [('zz', slice(2, 7)), ('xx', 10), ('zz', slice(1, None))],
+    ],
+)
+def test_lazy_slicing_reads_only_the_selected_region(slices):
+    da = data_array(ndim=3, binedges=True)
+    lazy, source = _lazy(da)
+    expected = da
+    for dim, sl in slices:
+        lazy = lazy[dim, sl]
+        expected = expected[dim, sl]
+    assert source.nread == 0
+    assert sc.identical(lazy.load(), expected)
+    assert source.nread == expected.data.size
+
+
+def test_lazy_slicing_with_step_raises():
+    lazy, _ = _lazy(data_array(ndim=2))
+    with pytest.raises(ValueError, match='step'):
+        lazy['xx', ::2]
+
+
+def test_lazy_with_memmap(tmp_path):
+    da = data_array(ndim=3)
+    path = tmp_path / 'data.dat'
+    mm = np.memmap(path, dtype='float64', mode='w+', shape=da.shape)
+    mm[...] = da.values
+    mm.flush()
+    lazy = LazyDataArray(
+        np.memmap(path, dtype='float64', mode='r', shape=da.shape),
+        dims=da.dims,
+        coords=dict(da.coords),
+        unit=da.unit,
+    )
+    assert sc.identical(lazy['zz', 4].load(), da['zz', 4].copy())
+
+
+def test_slice_dims_loads_lazy_data():
+    da = data_array(ndim=3)
+    lazy, source = _lazy(da)
+    out = slice_dims(lazy, {'zz': 5, 'yy': (3, 10)})()
+    assert isinstance(out, sc.DataArray)
+    assert sc.identical(out, da['zz', 5]['yy', 3:11])
+    assert source.nread == out.data.size
@@ -5,7 +5,12 @@ import numpy as np
 import pytest
 import scipp as sc
 
-from plopp.core.limits import find_limits, fix_empty_range
+from plopp.core.limits import (
+    ValueSampler,
+    find_limits,
+    fix_empty_range,
+    value_range,
+)
 
 
 def test_find_limits():
@@ -150,3 +155,43 @@ def test_fix_empty_range_zeros_values():
     lims = fix_empty_range((a, a))
     assert sc.identical(lims[0], sc.scalar(-0.5, unit='m'))
     assert sc.identical(lims[1], sc.scalar(0.5, unit='m'))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 20])
+def test_value_range_chunked(chunk_size):
+    values = np.random.normal(size=(50, 30))
+    values[3, 4] = np.nan
+    values[10, 2] = np.inf
+    values[20, 7] = -np.inf
+    x = sc.array(dims=['y', 'x'], values=values, unit='K')
+    da = sc.DataArray(
+        data=x, masks={'m': sc.array(dims=['x'], values=np.arange(30) > 25)}
+    )
+    vrange = value_range(da, chunk_size=chunk_size)
+    kept = values[:, :26][np.isfinite(values[:, :26])]
+    assert vrange.min == kept.min()
+    assert vrange.max == kept.max()
+    assert vrange.positive_min == kept[kept > 0].min()
+    assert vrange.unit == 'K'
+
+
+def test_value_range_no_positives():
+    vrange = value_range(sc.arange('x', -5.0, 0.0))
+    assert vrange.positive_min is None
+
+
+def test_value_sampler_reuses_positions_for_same_shape():
+    sampler = ValueSampler(size=100)
+    x = sc.array(dims=['y', 'x'], values=np.random.random((50, 40)))
+    sample = sampler(x)
+    assert sample.shape == (100,)
+    assert np.array_equal(sampler(x * 2.0), sample * 2.0)
+
+
+def test_value_sampler_small_array_is_not_sampled():
+    sampler = ValueSampler(size=100)
+    x = sc.array(dims=['x'], values=[1.0, np.nan, 3.0])
+    da = sc.DataArray(
+        data=x, masks={'m': sc.array(dims=['x'], values=[True, False, False])}
+    )
+    assert np.array_equal(sampler(da), [3.0])
@@ -3,6 +3,7 @@
 
 from functools import partial
 
+import numpy as np
 import pytest
 
 from plopp import Node, View, node
@@ -126,6 +127,96 @@ def test_data_request_is_cached():
     assert log == 'cd'  # 'c' requests data from 'a' but 'a' is cached so no 'a' in log
 
 
+def test_diamond_graph_evaluates_and_notifies_once():
+    log = []
+    counts = {}
+
+    class CountingView(View):
+        def notify_view(self, message):
+            node_id = message["node_id"]
+            counts[node_id] = counts.get(node_id, 0) + 1
+            self.graph_nodes[node_id].request_data()
+
+    a = Node(lambda: log.append('a') or 1)
+    b = Node(lambda x: log.append('b') or x + 1, x=a)
+    c = Node(lambda x: log.append('c') or x + 2, x=a)
+    d = Node(lambda x, y: log.append('d') or x * y, x=b, y=c)
+    CountingView(d)
+    log.clear()
+    counts.clear()
+
+    a.notify_children(message='hello from a')
+    assert log == ['a', 'b', 'c', 'd']
+    assert counts == {d.id: 1}
+
+
+def test_diamond_graph_view_receives_up_to_date_data():
+    values = {'a': 1}
+    a = Node(lambda: values['a'])
+    b = Node(lambda x: x + 1, x=a)
+    c = Node(lambda x: x * 10, x=a)
+    d = Node(lambda x, y: x + y, x=b, y=c)
+    dv = DataView(d)
+    # Also attach a view to an intermediate node
+    DataView(b)
+    values['a'] = 2
+    a.notify_children(message='hello from a')
+    assert dv.data == 23
+
+
+def test_node_returning_none_is_cached():
+    log = []
+    a = Node(lambda: log.append('a'))
+    assert a() is None
+    assert a() is None
+    assert log == ['a']
+
+
+def test_node_cache_reuses_results_for_previous_parent_values():
+    log = []
+    slider = {'value': 1}
+    a = Node(lambda: {'x': slider['value']})
+    b = Node(lambda s: log.append(s['x']) or s['x'] * 10, s=a)
+    b.enable_cache(max_bytes=1000)
+    bv = DataView(b)
+    for value in (2, 3, 2, 1, 3):
+        slider['value'] = value
+        a.notify_children(message='')
+    assert bv.data == 30
+    assert log == [2, 3, 1]
+    info = b.cache.info()
+    assert info.hits == 2
+    assert info.misses == 3
+
+
+def test_node_cache_uses_version_of_parents_with_unhashable_values():
+    log = []
+    data = Node(lambda: [1, 2, 3])
+    slider = {'value': 0}
+    index = Node(lambda: slider['value'])
+    picked = Node(lambda d, i: d[i], d=data, i=index)
+    result = Node(lambda x: log.append(x) or x * 2, x=picked)
+    result.enable_cache(max_bytes=1000)
+    picked.enable_cache(max_bytes=1000)
+    rv = DataView(result)
+    for value in (1, 2, 1, 0):
+        slider['value'] = value
+        index.notify_children(message='')
+    assert rv.data == 2
+    assert log == [2, 3, 1]
+
+
+def test_node_cache_invalidated_when_unhashable_input_changes():
+    values = {'data': np.arange(3.0)}
+    data = Node(lambda: values['data'])
+    total = Node(lambda x: x.sum(), x=data)
+    total.enable_cache(max_bytes=1000)
+    assert total() == 3.0
+    values['data'] = np.arange(4.0)
+    data.notify_children(message='')
+    assert total() == 6.0
+
+
 def test_remove_node_args():
     a = Node(lambda: 5)
     b = Node(lambda x: x - 2, a)
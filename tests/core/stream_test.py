@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+import pytest
+import scipp as sc
+
+from plopp import View
+from plopp.core import StreamNode
+from plopp.graphics import linefigure
+
+
+class SimpleView(View):
+    def __init__(self, *nodes):
+        super().__init__(*nodes)
+        self.data = None
+        self.messages = []
+
+    def notify_view(self, message):
+        self.messages.append(message['message'])
+        self.data = self.graph_nodes[message['node_id']].request_data()
+
+    def render(self):
+        pass
+
+
+def _chunk(start, stop, dim='time'):
+    t = sc.arange(dim, float(start), float(stop), unit='s')
+    return sc.DataArray(data=t * 2.0, coords={dim: t})
+
+
+def test_stream_initial_data():
+    stream = StreamNode(_chunk(0, 5), capacity=10)
+    assert stream.dim == 'time'
+    assert stream.capacity == 10
+    assert stream.size == 5
+    assert sc.identical(stream(), _chunk(0, 5))
+
+
+def test_stream_append():
+    stream = StreamNode(_chunk(0, 5), capacity=10)
+    view = SimpleView(stream)
+    stream.append(_chunk(5, 8))
+    assert stream.size == 8
+    assert sc.identical(view.data, _chunk(0, 8))
+    assert view.messages[-1] == 'append'
+
+
+def test_stream_keeps_only_last_capacity_elements():
+    stream = StreamNode(_chunk(0, 0), capacity=10)
+    for i in range(0, 60, 3):
+        stream.append(_chunk(i, i + 3))
+    assert stream.size == 10
+    assert sc.identical(stream(), _chunk(50, 60))
+
+
+def test_stream_append_chunk_larger_than_capacity():
+    stream = StreamNode(_chunk(0, 4), capacity=10)
+    stream.append(_chunk(4, 29))
+    assert sc.identical(stream(), _chunk(19, 29))
+
+
+def test_stream_replace():
+    stream = StreamNode(_chunk(0, 5), capacity=10)
+    view = SimpleView(stream)
+    stream.replace(_chunk(100, 103))
+    assert sc.identical(view.data, _chunk(100, 103))
+    assert view.messages[-1] == 'replace'
+
+
+def test_stream_generates_index_coord():
+    stream = StreamNode(sc.arange('x', 4.0, unit='m'), capacity=6)
+    stream.append(sc.arange('x', 4.0, 9.0, unit='m'))
+    da = stream()
+    assert sc.identical(da.data, sc.arange('x', 3.0, 9.0, unit='m'))
+    assert sc.identical(da.coords['x'], sc.arange('x', 3, 9, unit=None))
+
+
+def test_stream_2d_with_masks_and_variances():
+    def make(start, stop):
+        t = sc.arange('time', start, stop, unit='s')
+        values = np.random.random((stop - start, 3))
+        return sc.DataArray(
+            data=sc.array(
+                dims=['time', 'y'], values=values, variances=values, unit='K'
+            ),
+            coords={'time': t, 'y': sc.arange('y', 3.0, unit='m')},
+            masks={'m': t > sc.scalar(5, unit='s')},
+        )
+
+    chunks = [make(i, i + 2) for i in range(0, 12, 2)]
+    stream = StreamNode(chunks[0], capacity=4)
+    for chunk in chunks[1:]:
+        stream.append(chunk)
+    expected = sc.concat(chunks, 'time')['time', -4:]
+    assert sc.identical(stream(), expected)
+
+
+def test_stream_raises_with_bin_edges_along_stream_dim():
+    da = sc.DataArray(
+        data=sc.arange('time', 3.0), coords={'time': sc.arange('time', 4.0)}
+    )
+    with pytest.raises(ValueError, match='bin-edges'):
+        StreamNode(da)
+
+
+def test_stream_raises_with_incompatible_chunk():
+    stream = StreamNode(_chunk(0, 5))
+    with pytest.raises(sc.DimensionError):
+        stream.append(_chunk(0, 5, dim='x'))
+
+
+def test_stream_failed_replace_keeps_content():
+    stream = StreamNode(_chunk(0, 5), capacity=10)
+    view = SimpleView(stream)
+    bad = _chunk(100, 103)
+    bad.coords['time'] = bad.coords['time'].to(unit='ms')
+    with pytest.raises(sc.UnitError):
+        stream.replace(bad)
+    assert stream.size == 5
+    assert sc.identical(stream(), _chunk(0, 5))
+    assert view.messages == []
+
+
+def test_stream_updates_line_figure():
+    stream = StreamNode(_chunk(0, 5), capacity=20)
+    fig = linefigure(stream)
+    stream.append(_chunk(5, 30))
+    [line] = fig.artists.values()
+    assert sc.identical(line._data, _chunk(10, 30))
+    assert len(line._line.get_xdata()) == 20
@@ -11,6 +11,7 @@ import scipp as sc
 from matplotlib.colors import LogNorm, Normalize
 
 from plopp import Node, imagefigure, scatter3dfigure
+from plopp.core.utils import merge_masks
 from plopp.data.testing import data_array, scatter
 from plopp.graphics.colormapper import ColorMapper
 
@@ -231,6 +232,87 @@ def test_rgba_with_masks():
     assert not np.allclose(mapper.rgba(da1), mapper.rgba(da2))
 
 
+@pytest.mark.parametrize('logc', [False, True])
+def test_rgba_matches_matplotlib_colormap(logc):
+    da = data_array(ndim=2, unit='K')
+    da.values[0, :5] = [np.nan, -1.0, 0.0, np.inf, -np.inf]
+    mapper = ColorMapper(logc=logc, cmin=0.5, cmax=3.0)
+    mapper.autoscale()
+    expected = mapper.cmap(mapper.normalizer(da.values))
+    assert np.array_equal(mapper.rgba(da), expected)
+
+
+def test_rgba_with_masks_matches_matplotlib_colormap():
+    da = data_array(ndim=2, unit='K', masks=True)
+    mapper = ColorMapper(cmin=0.5, cmax=3.0)
+    mapper.autoscale()
+    one_mask = sc.broadcast(merge_masks(da.masks), sizes=da.sizes).values
+    expected = mapper.cmap(mapper.normalizer(da.values))
+    expected[one_mask] = mapper.mask_cmap(mapper.normalizer(da.values[one_mask]))
+    assert np.array_equal(mapper.rgba(da), expected)
+
+
+def test_rgba_bytes_into_buffer():
+    da = data_array(ndim=2, unit='K')
+    mapper = ColorMapper(cmin=0.5, cmax=3.0)
+    mapper.autoscale()
+    out = np.empty((*da.shape, 4), dtype=np.uint8)
+    colors = mapper.rgba(da, bytes=True, out=out)
+    assert colors is out
+    expected = mapper.cmap(mapper.normalizer(da.values), bytes=True)
+    assert np.array_equal(colors, expected)
+
+
+def test_toggle_norm_does_not_rescan_data(monkeypatch):
+    import plopp.graphics.colormapper as colormapper
+
+    da = data_array(ndim=2, unit='K')
+    mapper = ColorMapper()
+    artist = DummyChild(data=da, colormapper=mapper)
+    mapper.add_artist('data', artist)
+    calls = []
+    original = colormapper.value_range
+
+    def counting_value_range(x):
+        calls.append(x)
+        return original(x)
+
+    monkeypatch.setattr(colormapper, 'value_range', counting_value_range)
+    mapper.autoscale()
+    mapper.toggle_norm()
+    assert len(calls) == 1
+    artist.update(da * 2.0)
+    mapper.autoscale()
+    assert len(calls) == 2
+    assert mapper.cmax == (da.max() * 2.0).value
+
+
+def test_autoscale_percentile_ignores_hot_pixel():
+    da = data_array(ndim=2, unit='K')
+    da.values[10, 10] = 1.0e9
+    mapper = ColorMapper(autoscale='percentile', percentile=(0.0, 99.0))
+    artist = DummyChild(data=da, colormapper=mapper)
+    mapper.add_artist('data', artist)
+    mapper.autoscale()
+    assert mapper.cmin == da.min().value
+    assert mapper.cmax < 1.0e9
+    assert mapper.cmax == np.percentile(da.values, 99.0)
+
+
+def test_autoscale_percentile_log_uses_positive_values():
+    da = data_array(ndim=2, unit='K')
+    da.values[0, :] = -5.0
+    mapper = ColorMapper(autoscale='percentile', percentile=(0.0, 100.0), logc=True)
+    mapper.add_artist('data', DummyChild(data=da, colormapper=mapper))
+    mapper.autoscale()
+    assert mapper.cmin == da.values[da.values > 0].min()
+
+
+def test_bad_autoscale_mode_raises():
+    with pytest.raises(ValueError, match='Invalid autoscale mode'):
+        ColorMapper(autoscale='median')
+
+
 def test_colorbar_updated_on_rescale():
     da = data_array(ndim=2, unit='K')
     mapper = ColorMapper()
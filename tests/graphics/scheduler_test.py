@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import asyncio
+
+import pytest
+import scipp as sc
+
+from plopp import Node
+from plopp.data.testing import data_array
+from plopp.graphics import linefigure
+from plopp.graphics.scheduler import RenderScheduler, get_scheduler
+
+
+class DummyCanvas:
+    def __init__(self):
+        self.ndraws = 0
+
+    def draw(self):
+        self.ndraws += 1
+
+
+def test_first_update_is_drawn_immediately():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=10)
+    log = []
+    scheduler.schedule('a', lambda: log.append(1))
+    assert log == [1]
+    assert canvas.ndraws == 1
+    assert not scheduler.pending
+
+
+def _run(coroutine):
+    # Use a private loop to avoid resetting the global event loop for other tests
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_updates_are_applied_immediately_without_loop():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=1e-3)
+    log = []
+    for i in range(3):
+        scheduler.schedule('a', lambda i=i: log.append(i))
+    assert log == [0, 1, 2]
+    assert canvas.ndraws == 3
+    assert not scheduler.pending
+
+
+def test_updates_within_frame_interval_are_coalesced_with_event_loop():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=1e-3)
+    log = []
+
+    async def drag():
+        scheduler.schedule('a', lambda: log.append(0))
+        for i in range(1, 10):
+            scheduler.schedule('a', lambda i=i: log.append(i))
+        assert log == [0]
+        assert scheduler.pending
+        scheduler.flush()
+        # Let the cancelled timer finish
+        await asyncio.sleep(0)
+
+    _run(drag())
+    assert log == [0, 9]
+    assert canvas.ndraws == 2
+
+
+def test_single_draw_for_multiple_keys():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=1e-3)
+    log = []
+
+    async def update():
+        scheduler.schedule('a', lambda: None)
+        scheduler.schedule('a', lambda: log.append('a'))
+        scheduler.schedule('b', lambda: log.append('b'))
+        scheduler.flush()
+        # Let the cancelled timer finish
+        await asyncio.sleep(0)
+
+    _run(update())
+    assert log == ['a', 'b']
+    assert canvas.ndraws == 2
+
+
+def test_timer_applies_latest_update_with_event_loop():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=20)
+    log = []
+
+    async def drag():
+        for i in range(20):
+            scheduler.schedule('a', lambda i=i: log.append(i))
+        assert scheduler.pending
+        await asyncio.sleep(0.2)
+
+    _run(drag())
+    assert log == [0, 19]
+    assert canvas.ndraws == 2
+    assert not scheduler.pending
+
+
+def test_discard_pending_update():
+    canvas = DummyCanvas()
+    scheduler = RenderScheduler(canvas, max_fps=1e-3)
+
+    async def update():
+        scheduler.schedule('a', lambda: None)
+        scheduler.schedule('b', lambda: None)
+        assert scheduler.pending
+        scheduler.discard('b')
+        assert not scheduler.pending
+        scheduler.flush()
+        # Let the cancelled timer finish
+        await asyncio.sleep(0)
+
+    _run(update())
+
+
+def test_scheduler_is_shared_per_canvas():
+    canvas = DummyCanvas()
+    first = get_scheduler(canvas, max_fps=10)
+    second = get_scheduler(canvas, max_fps=5)
+    assert first is second
+    assert second.max_fps == 5
+
+
+def test_bad_max_fps_raises():
+    with pytest.raises(ValueError, match='max_fps must be positive'):
+        RenderScheduler(DummyCanvas(), max_fps=0)
+
+
+def test_linefigure_with_max_fps_coalesces_updates():
+    da = data_array(ndim=1)
+    a = Node(da)
+    fig = linefigure(a, max_fps=1e-3)
+    scheduler = fig.canvas._render_scheduler
+    ndraws = scheduler.ndraws
+    [line] = fig.artists.values()
+
+    async def update():
+        for i in range(2, 6):
+            a.func = lambda i=i: da * float(i)
+            a.notify_children('updated')
+        assert scheduler.ndraws == ndraws
+        assert sc.identical(line._data, da)
+        scheduler.flush()
+        # Let the cancelled timer finish
+        await asyncio.sleep(0)
+
+    _run(update())
+    assert scheduler.ndraws == ndraws + 1
+    assert sc.identical(line._data, da * 5.0)
+
+
+def test_linefigure_with_max_fps_draws_last_update_without_loop():
+    da = data_array(ndim=1)
+    a = Node(da)
+    fig = linefigure(a, max_fps=1e-3)
+    for i in range(2, 6):
+        a.func = lambda i=i: da * float(i)
+        a.notify_children('updated')
+    [line] = fig.artists.values()
+    assert sc.identical(line._data, da * 5.0)
+    assert not fig.canvas._render_scheduler.pending
@@ -1,12 +1,16 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import logging
+from collections import OrderedDict
+
 import numpy as np
 import pytest
 import scipp as sc
 
 from plopp.data.testing import data_array
-from plopp.plotting.common import preprocess
+from plopp.plotting import common
+from plopp.plotting.common import preprocess, preprocess_cache, to_data_array
 
 
 def test_preprocess_raises_ValueError_when_given_binned_data():
@@ -101,3 +105,151 @@ def test_preprocess_drops_coords_that_are_not_plotted_custom_coord_single_str():
     da.coords['xx2'] = 7.5 * da.coords['xx']
     out = preprocess(da, coords='xx')
     assert set(out.coords) == {'xx'}
+
+
+def test_preprocess_returns_cached_result_for_same_input():
+    da = data_array(ndim=2)
+    da.coords['xx2'] = 7.5 * da.coords['xx']
+    first = preprocess(da, coords=['xx2', 'yy'])
+    hits = preprocess_cache.info().hits
+    second = preprocess(da, coords=['xx2', 'yy'])
+    assert preprocess_cache.info().hits == hits + 1
+    assert second is not first
+    assert sc.identical(second, first)
+    preprocess(da)
+    assert preprocess_cache.info().hits == hits + 1
+
+
+def test_preprocess_cache_detects_modified_coord():
+    da = data_array(ndim=2)
+    preprocess(da)
+    da.coords['xx'].values *= 2.0
+    assert sc.identical(preprocess(da).coords['xx'], da.coords['xx'])
+    da.coords['yy'] = da.coords['yy'] + sc.scalar(1.0, unit=da.coords['yy'].unit)
+    assert sc.identical(preprocess(da).coords['yy'], da.coords['yy'])
+
+
+def test_preprocess_cache_detects_replaced_data_and_masks():
+    da = data_array(ndim=2)
+    da.masks['m'] = da.coords['xx'] > sc.scalar(0.0, unit=da.coords['xx'].unit)
+    preprocess(da)
+    da.data = da.data * 2.0
+    assert sc.identical(preprocess(da).data, da.data)
+    da.masks['m'] = ~da.masks['m']
+    assert sc.identical(preprocess(da).masks['m'], da.masks['m'])
+
+
+def test_preprocess_cache_drops_entry_when_input_is_deleted():
+    da = data_array(ndim=2)
+    preprocess(da)
+    entries = preprocess_cache.info().entries
+    del da
+    assert preprocess_cache.info().entries == entries - 1
+
+
+def test_preprocess_cache_shares_data_with_input():
+    da = data_array(ndim=2)
+    preprocess(da)
+    da.values[0, 0] = 123.0
+    assert preprocess(da).values[0, 0] == 123.0
+
+
+def test_preprocess_cache_does_not_count_buffers_shared_with_input(monkeypatch):
+    da = data_array(ndim=2)
+    monkeypatch.setattr(preprocess_cache, 'max_bytes', 1024)
+    assert da.data.underlying_size() > preprocess_cache.max_bytes
+    preprocess(da)
+    hits = preprocess_cache.info().hits
+    preprocess(da)
+    assert preprocess_cache.info().hits == hits + 1
+
+
+def test_preprocess_warns_every_time_when_coordinate_is_not_sorted():
+    da = data_array(ndim=1)
+    unsorted = sc.concat([da['xx', 20:], da['xx', :20]], dim='xx')
+    for _ in range(2):
+        with pytest.warns(
+            RuntimeWarning, match='The input contains a coordinate with unsorted values'
+        ):
+            preprocess(unsorted)
+
+
+def test_preprocess_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(preprocess_cache, 'max_bytes', 0)
+    da = data_array(ndim=2)
+    preprocess(da)
+    hits = preprocess_cache.info().hits
+    preprocess(da)
+    assert preprocess_cache.info().hits == hits
+
+
+@pytest.mark.parametrize(
+    ('values', 'expected'),
+    [
+        ([1.0, 2.0, 2.0, 5.0], 'ascending'),
+        ([5.0, 2.0, 2.0, 1.0], 'descending'),
+        ([3.0, 3.0, 3.0], 'constant'),
+        ([1.0, 3.0, 2.0, 5.0], None),
+        ([1.0, np.nan, 5.0], None),
+        ([1, 2, 3], 'ascending'),
+        ([4.0], 'constant'),
+    ],
+)
+def test_sort_direction(values, expected):
+    assert common._sort_direction(sc.array(dims=['x'], values=values)) == expected
+
+
+def test_sort_direction_2d():
+    x = sc.arange('x', 4.0)
+    y = sc.arange('y', 3.0)
+    assert common._sort_direction(x + y) == 'ascending'
+    assert common._sort_direction(-(x + y)) == 'descending'
+    assert common._sort_direction(x - y) is None
+    assert common._sort_direction(x + 0.0 * y) == 'ascending'
+
+
+def test_sort_direction_datetime():
+    times = sc.datetimes(dims=['t'], values=[3, 2, 1], unit='s')
+    assert common._sort_direction(times) == 'descending'
+
+
+def test_preprocess_does_not_check_sortedness_of_same_coords_again(monkeypatch):
+    calls = []
+
+    def sort_direction(var):
+        calls.append(var)
+        return 'ascending'
+
+    monkeypatch.setattr(common, '_sort_direction_cache', OrderedDict())
+    monkeypatch.setattr(common, '_sort_direction', sort_direction)
+    da = data_array(ndim=2)
+    preprocess(da)
+    assert len(calls) == 2
+    # A different data array that shares the coordinates
+    other = da.copy(deep=False)
+    other.name = 'other'
+    preprocess(other)
+    assert len(calls) == 2
+    other.coords['xx'] = other.coords['xx'] * 2.0
+    preprocess(other)
+    assert len(calls) == 3
+
+
+def test_to_data_array_numpy_supported_dtype_does_not_warn():
+    values = np.arange(12.0).reshape(3, 4)[:, ::2]
+    da = to_data_array(values)
+    assert da.dims == ('axis-0', 'axis-1')
+    assert np.array_equal(da.values, values)
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected'),
+    [('float16', 'float32'), ('uint8', 'int32'), ('>f8', 'float64')],
+)
+def test_to_data_array_numpy_unsupported_dtype_logs_copy(dtype, expected, caplog):
+    values = np.arange(10).astype(dtype)
+    with caplog.at_level(logging.DEBUG, logger='plopp.plotting.common'):
+        da = to_data_array(values)
+    assert 'requires an additional copy' in caplog.text
+    assert da.dtype == expected
+    assert np.array_equal(da.values, values)
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2026 Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+import pytest
+import scipp as sc
+from scipp.testing import assert_allclose, assert_identical
+
+from plopp.plotting._downsample import Downsample, block_reduce, decimate_line
+
+
+def _histogram(n: int) -> sc.DataArray:
+    return sc.DataArray(
+        data=sc.array(dims=['x'], values=np.arange(float(n)), unit='counts'),
+        coords={'x': sc.linspace('x', 0.0, 1.0, n + 1, unit='m')},
+    )
+
+
+def test_block_reduce_sum_with_remainder():
+    da = _histogram(10)
+    out = block_reduce(da, {'x': 4}, 'sum')
+    assert_identical(
+        out.data, sc.array(dims=['x'], values=[6.0, 22.0, 17.0], unit='counts')
+    )
+    assert_allclose(
+        out.coords['x'],
+        sc.array(dims=['x'], values=np.linspace(0.0, 1.0, 11)[[0, 4, 8, 10]], unit='m'),
+    )
+
+
+def test_block_reduce_mean_excludes_masked_values():
+    da = _histogram(6)
+    da.masks['m'] = sc.array(dims=['x'], values=[True, False, False] * 2)
+    out = block_reduce(da, {'x': 3}, 'mean')
+    assert_allclose(out.data, sc.array(dims=['x'], values=[1.5, 4.5], unit='counts'))
+
+
+def test_block_reduce_midpoint_coords_become_block_edges():
+    da = sc.DataArray(
+        data=sc.ones(sizes={'y': 4, 'x': 6}),
+        coords={'x': sc.arange('x', 6.0), 'y': sc.arange('y', 4.0)},
+    )
+    out = block_reduce(da, {'y': 2, 'x': 3}, 'max')
+    assert out.sizes == {'y': 2, 'x': 2}
+    assert_identical(out.coords['x'], sc.array(dims=['x'], values=[-0.5, 2.5, 5.5]))
+    assert_identical(out.coords['y'], sc.array(dims=['y'], values=[-0.5, 1.5, 3.5]))
+
+
+def test_decimate_line_keeps_extrema():
+    x = np.linspace(0.0, 1.0, 100_000)
+    y = np.sin(50 * x)
+    da = sc.DataArray(
+        data=sc.array(dims=['x'], values=y),
+        coords={'x': sc.array(dims=['x'], values=x)},
+    )
+    out = decimate_line(da, 400)
+    assert out.sizes['x'] <= 400
+    assert out.max().value == y.max()
+    assert out.min().value == y.min()
+
+
+def test_downsample_raises_for_invalid_size():
+    with pytest.raises(ValueError, match='max_display_size must be positive'):
+        Downsample(max_size=0)
@@ -3,8 +3,16 @@
 import numpy as np
 import pytest
 import scipp as sc
+from matplotlib.path import Path
 
 import plopp as pp
+from plopp.plotting._inspector import (
+    _gather_xy,
+    _polygon_selection,
+    _RectangleReducer,
+    _slice_xy,
+    _to_bin_edges,
+)
 
 
 @pytest.mark.usefixtures('_use_ipympl')
@@ -84,6 +92,82 @@ def test_line_removal():
     assert len(fig1d.artists) == 0
 
 
+@pytest.mark.usefixtures('_use_ipympl')
+def test_points_are_updated_in_a_single_batch():
+    da = pp.data.data3d()
+    ip = pp.inspector(da)
+    fig2d = ip[0][0]
+    fig1d = ip[0][1]
+    fig2d.toolbar['inspect'].value = True
+    tool = fig2d.toolbar['inspect']
+    for x, y in [(10, 10), (20, 15), (5, 12)]:
+        tool._tool.click(x, y)
+    assert len(fig1d.artists) == 3
+
+    updates = []
+    original = fig1d.view.update
+
+    def counting_update(*args, **kwargs):
+        updates.append(dict(*args, **kwargs))
+        return original(*args, **kwargs)
+
+    fig1d.view.update = counting_update
+    tool._input_node.notify_children('data changed')
+    assert len(updates) == 1
+    assert set(updates[0]) == set(fig1d.artists)
+
+
+@pytest.mark.usefixtures('_use_ipympl')
+def test_changing_one_point_only_updates_its_line():
+    da = pp.data.data3d()
+    ip = pp.inspector(da)
+    fig2d = ip[0][0]
+    fig1d = ip[0][1]
+    fig2d.toolbar['inspect'].value = True
+    tool = fig2d.toolbar['inspect']
+    for x, y in [(10, 10), (20, 15), (5, 12)]:
+        tool._tool.click(x, y)
+
+    updates = []
+    original = fig1d.view.update
+
+    def counting_update(*args, **kwargs):
+        updates.append(dict(*args, **kwargs))
+        return original(*args, **kwargs)
+
+    fig1d.view.update = counting_update
+    artist = tool._tool.children[1]
+    tool.update_node(artist)
+    assert len(updates) == 1
+    assert set(updates[0]) == {artist.nodeid}
+
+
+@pytest.mark.parametrize('binedges', [False, True])
+@pytest.mark.parametrize('masks', [False, True])
+def test_gather_xy_matches_slice_xy(binedges, masks):
+    da = _to_bin_edges(pp.data.data3d(binedges=binedges, masks=masks), dim='z')
+    infos = [
+        {
+            'x': {'dim': 'x', 'value': sc.scalar(x, unit='m')},
+            'y': {'dim': 'y', 'value': sc.scalar(y, unit='m')},
+        }
+        for x, y in [(16.0, 4.0), (3.0, 20.0), (100.0, 4.0), (0.0, 0.0)]
+    ]
+    results = _gather_xy(da, infos)
+    assert len(results) == len(infos)
+    assert not np.isnan(results[0].values).any()
+    assert np.isnan(results[2].values).all()
+    for result, info in zip(results, infos, strict=True):
+        expected = _slice_xy(da, info)
+        # Points outside of the data give NaN values in both cases
+        assert sc.identical(
+            result.drop_coords(['x', 'y']),
+            expected.drop_coords(['x', 'y']),
+            equal_nan=True,
+        )
+        assert np.array_equal(result.coords['x'].values, expected.coords['x'].values)
+
+
 @pytest.mark.usefixtures('_use_ipympl')
 def test_kwargs_propagation():
     da = pp.data.data3d()
@@ -323,6 +407,35 @@ def test_polygon_mode_contains_nothing():
     assert sc.identical(line._data, expected)
 
 
+def test_polygon_selection_only_tests_bounding_box_window():
+    x = sc.arange('xx', 100.0, unit='m')
+    y = sc.arange('yy', 80.0, unit='m')
+    sizes = {**x.sizes, **y.sizes}
+    vx = np.array([10.5, 30.5, 10.5, 10.5])
+    vy = np.array([20.5, 20.5, 40.5, 20.5])
+    window, inside = _polygon_selection(vx=vx, vy=vy, x=x, y=y, sizes=sizes)
+    assert window == {'xx': slice(11, 31), 'yy': slice(21, 41)}
+    xx, yy = np.meshgrid(x.values, y.values, indexing='ij')
+    points = np.column_stack([xx.ravel(), yy.ravel()])
+    expected = Path(np.column_stack([vx, vy])).contains_points(points).reshape(xx.shape)
+    assert expected.any()
+    full = np.zeros((100, 80), dtype=bool)
+    full[window['xx'], window['yy']] = inside
+    assert np.array_equal(full, expected)
+
+
+def test_polygon_selection_outside_of_data():
+    x = sc.arange('xx', 10.0, unit='m')
+    y = sc.arange('yy', 8.0, unit='m')
+    vx = np.array([20.0, 30.0, 20.0, 20.0])
+    vy = np.array([2.0, 2.0, 5.0, 2.0])
+    window, inside = _polygon_selection(
+        vx=vx, vy=vy, x=x, y=y, sizes={**x.sizes, **y.sizes}
+    )
+    assert window == {'xx': slice(0, 1), 'yy': slice(0, 1)}
+    assert not inside.any()
+
+
 @pytest.mark.usefixtures('_use_ipympl')
 def test_rectangle_mode():
     da = _make_test_data()
@@ -377,6 +490,59 @@ def test_rectangle_mode_contains_nothing():
     assert sc.identical(line._data, expected)
 
 
+@pytest.mark.usefixtures('_use_ipympl')
+@pytest.mark.parametrize(
+    "operation", ["sum", "mean", "nansum", "nanmean", "max", "nanmin"]
+)
+@pytest.mark.parametrize(
+    ("x", "y"), [([-1, 290], [-1, 19]), ([100, 400], [10, 30]), ([150, 160], [5, 7])]
+)
+def test_rectangle_mode_with_summed_area_table(operation, x, y):
+    da = _make_test_data()
+    da.values[1, 1, 1] = np.nan
+
+    results = []
+    for index_size in (None, 10_000):
+        ip = pp.inspector(
+            da,
+            mode='rectangle',
+            dim='zz',
+            operation=operation,
+            rectangle_index_size=index_size,
+        )
+        fig2d = ip[0][0]
+        fig1d = ip[0][1]
+        fig2d.toolbar['inspect'].value = True
+        tool = fig2d.toolbar['inspect']._tool
+        for xi, yi in zip(x, y, strict=True):
+            tool.click(x=xi, y=yi)
+        results.append(next(iter(fig1d.artists.values()))._data)
+
+    assert sc.allclose(results[0].data, results[1].data, equal_nan=True)
+    assert sc.identical(results[0].coords['zz'], results[1].coords['zz'])
+
+
+def test_rectangle_reducer_rebuilds_table_when_data_is_modified_in_place():
+    da = sc.DataArray(
+        data=sc.ones(sizes={'z': 3, 'y': 4, 'x': 5}),
+        coords={
+            'x': sc.arange('x', 6.0),
+            'y': sc.arange('y', 5.0),
+            'z': sc.arange('z', 3.0),
+        },
+    )
+    node = pp.Node(da)
+    reducer = _RectangleReducer(op='sum', max_bytes=1024**2, node=node)
+    rect = {
+        'x': {'dim': 'x', 'value': sc.array(dims=['v'], values=[1.0, 3.0])},
+        'y': {'dim': 'y', 'value': sc.array(dims=['v'], values=[0.0, 2.0])},
+    }
+    assert np.array_equal(reducer(node(), rect).values, [4.0, 4.0, 4.0])
+    da.values *= 2.0
+    node.notify_children('updated')
+    assert np.array_equal(reducer(node(), rect).values, [8.0, 8.0, 8.0])
+
+
 @pytest.mark.usefixtures('_use_ipympl')
 def test_creation_with_non_dimension_coord():
     da = pp.data.data3d()
@@ -108,6 +108,34 @@ def test_plot_ignore_size_disables_size_check():
     pp.plot(np.random.random(1_100_000), ignore_size=True)
 
 
+def test_plot_lod_disables_size_check_for_1d():
+    fig = pp.plot(np.random.random(1_100_000), lod=True)
+    [line] = fig.artists.values()
+    assert len(line._line.get_xdata()) < 1_100_000
+    error_match = "may take very long or use an excessive amount of memory"
+    with pytest.raises(ValueError, match=error_match):
+        pp.plot(np.random.random((3000, 2500)), lod=True)
+
+
+def test_plot_max_display_size_decimates_line():
+    y = np.random.random(1_100_000)
+    fig = pp.plot(y, max_display_size=10_000)
+    [line] = fig.artists.values()
+    ydata = line._line.get_ydata()
+    assert len(ydata) <= 10_000
+    assert ydata.max() == y.max()
+    assert ydata.min() == y.min()
+    assert fig.canvas.badge == f'Downsampled: 1,100,000 → {len(ydata):,}'
+
+
+def test_plot_max_display_size_does_not_reduce_small_data():
+    da = data_array(ndim=1)
+    fig = pp.plot(da, max_display_size=10_000)
+    [line] = fig.artists.values()
+    assert len(line._line.get_ydata()) == da.sizes['xx']
+    assert fig.canvas.badge is None
+
+
 def test_plot_with_non_dimensional_unsorted_coord_does_not_warn():
     da = data_array(ndim=1)
     da.coords['aux'] = sc.sin(sc.arange(da.dim, 50.0, unit='rad'))
@@ -159,10 +187,22 @@ def test_kwarg_as_dict():
     assert line_b.color == 'black'
 
 
-def test_raises_ValueError_when_given_binned_data():
+def test_plot_binned_data():
     da = sc.data.table_xyz(100).bin(x=10)
-    with pytest.raises(ValueError, match='Cannot plot binned data'):
-        pp.plot(da)
+    fig = pp.plot(da)
+    [line] = fig.view.artists.values()
+    # The events are histogrammed at display resolution, not using the outer bins
+    assert line._data.dims == ('x',)
+    assert line._data.sizes['x'] > da.sizes['x']
+    assert np.isclose(line._data.sum().value, da.hist().sum().value)
+
+
+def test_plot_binned_data_histograms_event_coord():
+    da = sc.data.table_xyz(1000).bin(x=10)
+    fig = pp.plot(da, coords=['y'])
+    [line] = fig.view.artists.values()
+    assert line._data.dims == ('y',)
+    assert np.isclose(line._data.sum().value, da.hist().sum().value)
 
 
 def test_raises_ValueError_when_given_unsupported_data_type():
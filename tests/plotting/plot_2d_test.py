@@ -90,10 +90,15 @@ def test_norm_and_scale_2d(linspace):
     assert p.view.colormapper.norm == 'log'
 
 
-def test_raises_ValueError_when_given_binned_data():
+def test_plot_binned_data():
     da = sc.data.table_xyz(100).bin(x=10, y=20)
-    with pytest.raises(ValueError, match='Cannot plot binned data'):
-        pp.plot(da)
+    fig = pp.plot(da)
+    [image] = fig.view.artists.values()
+    # The events are histogrammed at display resolution, not using the outer bins
+    assert image._data.dims == da.dims
+    assert image._data.sizes['x'] > da.sizes['x']
+    assert image._data.sizes['y'] > da.sizes['y']
+    assert np.isclose(image._data.sum().value, da.hist().sum().value)
 
 
 @pytest.mark.parametrize('linspace', [True, False])
@@ -516,3 +521,42 @@ def test_clabel():
     da = data_array(ndim=2)
     fig = da.plot(clabel='MyColorLabel')
     assert fig.view.colormapper.clabel == 'MyColorLabel'
+
+
+def test_plot_pyramid_disables_size_check_for_2d():
+    da = sc.DataArray(
+        data=sc.array(dims=['y', 'x'], values=np.random.random((2600, 3000))),
+        coords={
+            'x': sc.arange('x', 3000.0, unit='m'),
+            'y': sc.arange('y', 2600.0, unit='m'),
+        },
+    )
+    fig = pp.plot(da, pyramid=True)
+    [artist] = fig.artists.values()
+    assert artist._image.get_array().shape[1] < 3000
+
+
+@pytest.mark.parametrize('downsample', ['mean', 'sum', 'max'])
+def test_plot_max_display_size_reduces_image(downsample):
+    values = np.random.random((3000, 2500))
+    da = sc.DataArray(
+        data=sc.array(dims=['y', 'x'], values=values),
+        coords={
+            'x': sc.arange('x', 2500.0, unit='m'),
+            'y': sc.arange('y', 3000.0, unit='m'),
+        },
+    )
+    fig = pp.plot(da, max_display_size=300_000, downsample=downsample)
+    [artist] = fig.artists.values()
+    assert artist._data.shape == (600, 500)
+    assert fig.canvas.badge == 'Downsampled: 3,000x2,500 → 600x500'
+    expected = getattr(values.reshape(600, 5, 500, 5), downsample)(axis=(1, 3))
+    np.testing.assert_allclose(artist._data.values, expected)
+    # The coordinates of the blocks span the range of the original pixels
+    assert sc.identical(artist._data.coords['x'][0], sc.scalar(-0.5, unit='m'))
+    assert sc.identical(artist._data.coords['x'][-1], sc.scalar(2499.5, unit='m'))
+
+
+def test_plot_max_display_size_raises_for_invalid_operation():
+    with pytest.raises(ValueError, match='Invalid downsampling operation'):
+        pp.plot(data_array(ndim=2), max_display_size=100, downsample='median')
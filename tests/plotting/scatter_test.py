@@ -263,3 +263,11 @@ def test_clabel():
     da = scatter_data()
     fig = pp.scatter(da, cbar=True, clabel='MyColorLabel')
     assert fig.view.colormapper.clabel == 'MyColorLabel'
+
+
+def test_scatter_max_display_size_decimates_points():
+    a = scatter_data(npoints=5000)
+    fig = pp.scatter(a, max_display_size=1000)
+    [artist] = fig.artists.values()
+    assert artist._data.sizes == {a.dim: 1000}
+    assert fig.canvas.badge == 'Decimated: 5,000 → 1,000 points'
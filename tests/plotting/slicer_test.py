@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import numpy as np
 import pytest
 import scipp as sc
 from scipp.testing import assert_allclose, assert_identical
 
-from plopp import Node
+from plopp import LazyDataArray, Node
 from plopp.data.testing import data_array, dataset
 from plopp.plotting._slicer import DimensionSlicer, SlicerPlot
 
@@ -190,10 +191,33 @@ class TestSlicer1d:
         with pytest.raises(ValueError, match="Slicer plot: cannot slice dim 'yy'"):
             SlicerPlot({'a': a, 'b': b}, keep=['xx'], mode='single')
 
-    def test_raises_ValueError_when_given_binned_data(self):
+    def test_binned_data(self):
+        da = sc.data.table_xyz(1000).bin(x=10, y=20)
+        sp = SlicerPlot(da, keep=['x'], mode='single')
+        [line] = sp.figure.view.artists.values()
+        index = sp.slicer.slider.value['y']
+        # The events are histogrammed at display resolution
+        edges = line._data.coords['x']
+        assert line._data.sizes['x'] > da.sizes['x']
+        assert sc.allclose(line._data.data, da['y', index].hist(x=edges).data)
+        sp.slicer.slider.controls['y'].value = 5
+        edges = line._data.coords['x']
+        assert sc.allclose(line._data.data, da['y', 5].hist(x=edges).data)
+
+    def test_binned_data_range_is_summed(self):
+        da = sc.data.table_xyz(1000).bin(x=10, y=20)
+        sp = SlicerPlot(da, keep=['x'], mode='range')
+        [line] = sp.figure.view.artists.values()
+        start, stop = sp.slicer.slider.value['y']
+        expected = da['y', start : stop + 1].hist(x=line._data.coords['x']).sum('y')
+        assert sc.allclose(line._data.data, expected.data)
+
+    def test_raises_ValueError_when_given_binned_data_and_unsupported_operation(
+        self,
+    ):
         da = sc.data.table_xyz(100).bin(x=10, y=20)
-        with pytest.raises(ValueError, match='Cannot plot binned data'):
-            SlicerPlot(da, keep=['xx'], mode='single')
+        with pytest.raises(ValueError, match="invalid operation 'mean' for binned"):
+            SlicerPlot(da, keep=['x'], mode='single', operation='mean')
 
     def test_from_node_1d(self):
         da = data_array(ndim=2)
@@ -267,6 +291,27 @@ class TestSlicer2d:
         assert sl.slider.value == {'zz': 5}
         assert_identical(sl.slice_nodes[0](), da['zz', 5])
 
+    @pytest.mark.parametrize("mode", ["single", "range"])
+    def test_lazy_data(self, mode):
+        da = data_array(ndim=3, binedges=True)
+        lazy = LazyDataArray(
+            da.values,
+            dims=da.dims,
+            coords=dict(da.coords),
+            unit=da.unit,
+            name=da.name,
+        )
+        sl = DimensionSlicer(lazy, keep=['xx', 'yy'], mode=mode)
+        expected = DimensionSlicer(da, keep=['xx', 'yy'], mode=mode)
+        assert isinstance(sl.slice_nodes[0](), sc.DataArray)
+        assert_identical(sl.reduce_nodes[0](), expected.reduce_nodes[0]())
+        if mode == 'single':
+            sl.slider.controls['zz'].value = 5
+            assert_identical(sl.reduce_nodes[0](), da['zz', 5])
+        else:
+            sl.slider.controls['zz'].value = (5, 8)
+            assert_identical(sl.reduce_nodes[0](), da['zz', 5:9].sum('zz'))
+
     @pytest.mark.parametrize("binedges", [False, True])
     @pytest.mark.parametrize("datetime", [False, True])
     def test_creation_keep_two_dims_range_mode(self, binedges, datetime):
@@ -407,3 +452,208 @@ class TestSlicer2d:
     def test_different_operations(self, operation, mode):
         da = data_array(ndim=3)
         SlicerPlot(da, keep=['xx', 'yy'], mode=mode, operation=operation)
+
+    def test_cache_size_reuses_reduced_slices(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='mean', cache_size=10**6
+        )
+        reduce_node = sl.reduce_nodes[0]
+        reduce_node()
+        sl.slider.controls['zz'].value = (5, 15)
+        first = reduce_node()
+        sl.slider.controls['zz'].value = (3, 12)
+        sl.slider.controls['zz'].value = (5, 15)
+        assert reduce_node() is first
+        assert_allclose(first, da['zz', 5:16].mean('zz'))
+        assert reduce_node.cache.info().hits == 1
+
+    @pytest.mark.parametrize("operation", ["sum", "mean", "nansum", "nanmean"])
+    @pytest.mark.parametrize("variances", [False, True])
+    @pytest.mark.parametrize("masks", [False, True])
+    def test_range_index_gives_same_results_as_reducing_slices(
+        self, operation, variances, masks
+    ):
+        da = data_array(ndim=4, variances=variances, masks=masks)
+        da.values[2, 3, 4, 5] = np.nan if 'nan' in operation else 1.0
+        indexed = DimensionSlicer(
+            da,
+            keep=['xx', 'yy'],
+            mode='range',
+            operation=operation,
+            range_index_size=10**8,
+        )
+        reference = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation=operation
+        )
+        for zz, time in [((3, 10), (1, 15)), ((0, 29), (0, 19)), ((4, 4), (2, 9))]:
+            for sl in (indexed, reference):
+                sl.slider.controls['zz'].value = zz
+                sl.slider.controls['time'].value = time
+            expected = reference.reduce_nodes[0]()
+            assert_allclose(
+                indexed.reduce_nodes[0](),
+                expected,
+                atol=sc.scalar(1e-9, unit=expected.unit),
+            )
+        assert indexed.reduce_nodes[0].func._index is not None
+
+    @pytest.mark.parametrize("operation", ["max", "min", "nanmax", "nanmin"])
+    @pytest.mark.parametrize("masks", [False, True])
+    @pytest.mark.parametrize("dtype", ["float64", "float32", "int64"])
+    def test_range_index_extrema_give_same_results_as_reducing_slices(
+        self, operation, masks, dtype
+    ):
+        da = data_array(ndim=4, masks=masks, dtype=dtype)
+        if dtype != 'int64':
+            da.values[2, 3, 4, 5] = np.nan
+        indexed = DimensionSlicer(
+            da,
+            keep=['xx', 'yy'],
+            mode='range',
+            operation=operation,
+            range_index_size=10**9,
+        )
+        reference = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation=operation
+        )
+        for zz, time in [((3, 10), (1, 15)), ((0, 29), (0, 19)), ((2, 3), (5, 6))]:
+            for sl in (indexed, reference):
+                sl.slider.controls['zz'].value = zz
+                sl.slider.controls['time'].value = time
+            assert_identical(indexed.reduce_nodes[0](), reference.reduce_nodes[0]())
+        assert indexed.reduce_nodes[0].func._index is not None
+
+    def test_range_index_falls_back_for_max_with_variances(self):
+        da = data_array(ndim=3, variances=True)
+        sl = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='max', range_index_size=10**8
+        )
+        sl.slider.controls['zz'].value = (5, 15)
+        assert_identical(sl.reduce_nodes[0](), da['zz', 5:16].max('zz'))
+        assert sl.reduce_nodes[0].func._index is None
+
+    def test_range_index_falls_back_when_budget_is_exceeded(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='sum', range_index_size=100
+        )
+        sl.slider.controls['zz'].value = (5, 15)
+        assert_identical(sl.reduce_nodes[0](), da['zz', 5:16].sum('zz'))
+        assert sl.reduce_nodes[0].func._index is None
+
+    @pytest.mark.parametrize("operation", ["sum", "mean", "nansum", "nanmean"])
+    @pytest.mark.parametrize("variances", [False, True])
+    @pytest.mark.parametrize("masks", [False, True])
+    def test_incremental_gives_same_results_as_reducing_slices(
+        self, operation, variances, masks
+    ):
+        da = data_array(ndim=3, variances=variances, masks=masks)
+        da.values[2, 3, 4] = np.nan if 'nan' in operation else 1.0
+        incremental = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation=operation, incremental=True
+        )
+        reference = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation=operation
+        )
+        values = [(5, 20), (5, 21), (4, 21), (2, 21), (2, 19), (3, 18), (3, 3)]
+        for value in values:
+            for sl in (incremental, reference):
+                sl.slider.controls['zz'].value = value
+            expected = reference.reduce_nodes[0]()
+            assert_allclose(
+                incremental.reduce_nodes[0](),
+                expected,
+                atol=sc.scalar(1e-9, unit=expected.unit),
+            )
+
+    def test_incremental_only_reduces_changed_slabs(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='sum', incremental=True
+        )
+        running = sl.reduce_nodes[0].func._running
+        sl.slider.controls['zz'].value = (2, 20)
+        for stop in range(21, 29):
+            sl.slider.controls['zz'].value = (2, stop)
+        assert running._updates == 8
+        assert_allclose(sl.reduce_nodes[0](), da['zz', 2:29].sum('zz'))
+
+    def test_incremental_refreshes_periodically(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='sum', incremental=True
+        )
+        running = sl.reduce_nodes[0].func._running
+        for i in range(40):
+            sl.slider.controls['zz'].value = (i % 2, 20)
+        assert 0 < running._updates < running._refresh_interval
+
+    def test_prefetch_computes_next_slices_ahead(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(da, keep=['xx', 'yy'], mode='single', prefetch=3)
+        reduce_node = sl.reduce_nodes[0]
+        prefetcher = reduce_node.func
+        sl.slider.controls['zz'].value = 10
+        reduce_node()
+        sl.slider.controls['zz'].value = 11
+        reduce_node()
+        prefetcher.wait()
+        for zz in (12, 13, 14):
+            assert (('zz', zz),) in prefetcher.cache
+        # The reduce node is a leaf, so moving the slider already requests the slice
+        hits = prefetcher.cache.info().hits
+        sl.slider.controls['zz'].value = 12
+        assert_identical(reduce_node(), da['zz', 12])
+        assert prefetcher.cache.info().hits == hits + 1
+
+    def test_prefetch_stops_at_the_end_of_the_dim(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(da, keep=['xx', 'yy'], mode='single', prefetch=5)
+        prefetcher = sl.reduce_nodes[0].func
+        for zz in (25, 27):
+            sl.slider.controls['zz'].value = zz
+            sl.reduce_nodes[0]()
+        prefetcher.wait()
+        assert (('zz', 29),) in prefetcher.cache
+        assert len(prefetcher.cache) == 3
+
+    def test_prefetch_does_not_slice_in_the_graph(self):
+        da = data_array(ndim=3)
+        sl = DimensionSlicer(da, keep=['xx', 'yy'], mode='single', prefetch=2)
+        assert sl.slice_nodes == []
+        assert sl.slider_node.children == sl.reduce_nodes
+        other = DimensionSlicer(da, keep=['xx', 'yy'], mode='single', prefetch=2)
+        # All the slicers share the same worker thread
+        assert other.reduce_nodes[0].func._executor is sl.reduce_nodes[0].func._executor
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_prefetch_range_gives_same_results_as_reducing_slices(self, incremental):
+        da = data_array(ndim=3)
+        prefetched = DimensionSlicer(
+            da,
+            keep=['xx', 'yy'],
+            mode='range',
+            operation='mean',
+            incremental=incremental,
+            prefetch=4,
+        )
+        reference = DimensionSlicer(
+            da, keep=['xx', 'yy'], mode='range', operation='mean'
+        )
+        for start in range(10):
+            for sl in (prefetched, reference):
+                sl.slider.controls['zz'].value = (start, start + 10)
+            assert_allclose(prefetched.reduce_nodes[0](), reference.reduce_nodes[0]())
+            prefetched.reduce_nodes[0].func.wait()
+
+    def test_max_display_size_reduces_slices(self):
+        da = data_array(ndim=3)
+        sl = SlicerPlot(
+            da, keep=['xx', 'yy'], mode='single', max_display_size=500, downsample='sum'
+        )
+        [artist] = sl.figure.artists.values()
+        assert artist._data.sizes == {'yy': 20, 'xx': 25}
+        assert sl.figure.canvas.badge == 'Downsampled: 40x50 → 20x25'
+        sl.slicer.slider.controls['zz'].value = 10
+        assert_allclose(artist._data.sum().data, da['zz', 10].sum().data)